@@ -0,0 +1,114 @@
+import argparse
+import time
+from typing import Any, Callable, Iterator
+from uuid import UUID, uuid4
+
+from spakky.core.mutability import mutable
+from spakky.domain.models.aggregate_root import AbstractAggregateRoot
+from spakky.domain.ports.persistency.in_memory import (
+    InMemoryRepository,
+    InMemoryStore,
+    InMemoryTransaction,
+)
+
+
+@mutable
+class Item(AbstractAggregateRoot[UUID]):
+    category: int
+    name: str
+
+    def validate(self) -> None:
+        return
+
+    @classmethod
+    def next_id(cls) -> UUID:
+        return uuid4()
+
+
+def measure(label: str, operations: int, function: Callable[[], Any]) -> Any:
+    started: float = time.perf_counter()
+    result: Any = function()
+    elapsed: float = time.perf_counter() - started
+    rate: float = operations / elapsed if elapsed > 0 else float("inf")
+    print(f"{label:<32} {elapsed:>9.3f}s {rate:>14,.0f} ops/s")
+    return result
+
+
+def chunks(count: int, size: int) -> Iterator[list[Item]]:
+    for start in range(0, count, size):
+        yield [
+            Item(uid=uuid4(), category=index % 100, name=f"item-{index}")
+            for index in range(start, min(start + size, count))
+        ]
+
+
+def benchmark(count: int, lookups: int, commits: int) -> None:
+    store = InMemoryStore[Item, UUID](indexes=("category",))
+    repository = InMemoryRepository(store)
+
+    # Aggregates are built up front so save_all measures the store alone
+    batches: list[list[Item]] = measure(
+        "create aggregates", count, lambda: list(chunks(count, 10_000))
+    )
+    measure("save_all", count, lambda: [repository.save_all(b) for b in batches])
+    uids: list[UUID] = [item.uid for batch in batches for item in batch]
+    sample: list[UUID] = uids[:: max(1, count // lookups)][:lookups]
+    measure("get", len(sample), lambda: [repository.get(uid) for uid in sample])
+    measure(
+        "contains",
+        len(sample),
+        lambda: [repository.contains(uid) for uid in sample],
+    )
+    measure("range", len(sample), lambda: repository.range(sample))
+    measure(
+        "find_by (1% selectivity)",
+        count // 100,
+        lambda: repository.find_by("category", 7),
+    )
+    measure("first page (sorts keys)", 1_000, lambda: repository.page(limit=1_000))
+    measure(
+        "iter_all",
+        count,
+        lambda: sum(1 for _ in repository.iter_all(chunk_size=10_000)),
+    )
+
+    transaction = InMemoryTransaction()
+    transactional = InMemoryRepository(store, transaction)
+
+    def update() -> None:
+        with transaction:
+            items: list[Item] = list(transactional.range(sample))
+            for item in items:
+                item.name = "renamed"
+            transactional.save_all(items)
+
+    def update_one(uid: UUID) -> None:
+        with transaction:
+            item: Item = transactional.get(uid)
+            item.name = "renamed again"
+            transactional.save(item)
+
+    measure("transaction (bulk update)", len(sample), update)
+    # Commits record only the rows they replace, so their cost ignores store size
+    targets: list[UUID] = sample[:commits]
+    measure(
+        "transactions (one row each)",
+        len(targets),
+        lambda: [update_one(uid) for uid in targets],
+    )
+    print(f"{'stored aggregates':<32} {len(store):>10,}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the in-memory repository engine"
+    )
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--lookups", type=int, default=100_000)
+    parser.add_argument("--commits", type=int, default=10_000)
+    arguments = parser.parse_args()
+    benchmark(arguments.count, arguments.lookups, arguments.commits)
+
+
+if __name__ == "__main__":
+    main()
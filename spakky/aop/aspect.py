@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import cached_property
 from inspect import getmembers
 
 from spakky.aop.error import AspectInheritanceError
@@ -17,7 +18,8 @@ from spakky.pod.annotations.pod import Pod, is_class_pod
 
 @dataclass(eq=False)
 class Aspect(Pod):
-    def matches(self, pod: object) -> bool:
+    @cached_property
+    def __advices(self) -> list[AbstractPointCut]:
         if not is_class_pod(self.target):
             raise AspectInheritanceError
         if not issubclass(self.target, IAspect):
@@ -29,22 +31,27 @@ class Aspect(Pod):
             After: self.target.after,
             Around: self.target.around,
         }
+        return [
+            advice
+            for annotation, target_method in pointcuts.items()
+            if (advice := annotation.get_or_none(target_method)) is not None
+        ]
+
+    def matches(self, pod: object) -> bool:
+        advices: list[AbstractPointCut] = self.__advices
         if callable(pod):
-            for annotation, target_method in pointcuts.items():
-                if (advice := annotation.get_or_none(target_method)) is not None:
-                    if advice.matches(pod):
-                        return True
+            if any(advice.matches(pod) for advice in advices):
+                return True
         for _, method in getmembers(pod, callable):
-            for annotation, target_method in pointcuts.items():
-                if (advice := annotation.get_or_none(target_method)) is not None:
-                    if advice.matches(method):
-                        return True
+            if any(advice.matches(method) for advice in advices):
+                return True
         return False
 
 
 @dataclass(eq=False)
 class AsyncAspect(Pod):
-    def matches(self, pod: object) -> bool:
+    @cached_property
+    def __advices(self) -> list[AbstractPointCut]:
         if not is_class_pod(self.target):
             raise AspectInheritanceError
         if not issubclass(self.target, IAsyncAspect):
@@ -56,14 +63,18 @@ class AsyncAspect(Pod):
             After: self.target.after_async,
             Around: self.target.around_async,
         }
+        return [
+            advice
+            for annotation, target_method in pointcuts.items()
+            if (advice := annotation.get_or_none(target_method)) is not None
+        ]
+
+    def matches(self, pod: object) -> bool:
+        advices: list[AbstractPointCut] = self.__advices
         if callable(pod):
-            for annotation, target_method in pointcuts.items():
-                if (advice := annotation.get_or_none(target_method)) is not None:
-                    if advice.matches(pod):
-                        return True
+            if any(advice.matches(pod) for advice in advices):
+                return True
         for _, method in getmembers(pod, callable):
-            for annotation, target_method in pointcuts.items():
-                if (advice := annotation.get_or_none(target_method)) is not None:
-                    if advice.matches(method):
-                        return True
+            if any(advice.matches(method) for advice in advices):
+                return True
         return False
@@ -1,16 +1,24 @@
 import sys
+from dataclasses import fields, is_dataclass
+from hashlib import blake2b
+from inspect import getmembers
 from logging import Logger
+from types import CodeType, NoneType
 from typing import Any, Sequence
 
 from spakky.aop.advisor import Advisor, AsyncAdvisor
 from spakky.aop.aspect import Aspect, AsyncAspect
 from spakky.aop.interfaces.aspect import IAspect, IAsyncAspect
+from spakky.core.annotation import AnnotationRegistry
+from spakky.core.constants import ANNOTATION_METADATA
 from spakky.core.proxy import AbstractProxyHandler, ProxyFactory
+from spakky.core.reference import get_reference_key
 from spakky.core.types import AsyncFunc, Func
 from spakky.pod.annotations.order import Order
 from spakky.pod.annotations.pod import Pod
 from spakky.pod.interfaces.container import IContainer
 from spakky.pod.interfaces.post_processor import IPostProcessor
+from spakky.pod.snapshot import PodSnapshot
 
 
 class AspectProxyHandler(AbstractProxyHandler):
@@ -62,26 +70,120 @@ class AspectProxyHandler(AbstractProxyHandler):
         return await self.__async_advisors_cache[method](*args, **kwargs)
 
 
+def _update_digest(digest: "blake2b", value: object) -> None:
+    if isinstance(value, CodeType):
+        digest.update(value.co_code)
+        digest.update(repr(value.co_names).encode())
+        for constant in value.co_consts:
+            _update_digest(digest, constant)
+    elif (code := getattr(value, "__code__", None)) is not None:
+        _update_digest(digest, code)
+    elif isinstance(value, (str, bytes, int, float, NoneType)):
+        digest.update(repr(value).encode())
+    elif isinstance(value, (tuple, list)):
+        for item in value:
+            _update_digest(digest, item)
+    elif isinstance(value, AnnotationRegistry):
+        for annotations in value.annotations.values():
+            _update_digest(digest, annotations)
+    else:
+        # Annotations are described by their type and fields, never by address
+        digest.update(type(value).__qualname__.encode())
+        if is_dataclass(value) and not isinstance(value, type):
+            for field in fields(value):
+                digest.update(field.name.encode())
+                _update_digest(digest, getattr(value, field.name))
+
+
+def get_match_fingerprint(type_: type) -> str:
+    # Covers the methods and the annotations matching reads, so a stored match
+    # goes stale as soon as a pointcut or an annotated method changes
+    digest = blake2b(digest_size=16)
+    for name, member in getmembers(type_, callable):
+        digest.update(name.encode())
+        _update_digest(digest, getattr(member, "__code__", None))
+        _update_digest(digest, getattr(member, ANNOTATION_METADATA, None))
+    return digest.hexdigest()
+
+
 @Pod()
 class AspectPostProcessor(IPostProcessor):
     __logger: Logger
     __container: IContainer
+    __snapshot: PodSnapshot | None
+    __trusts_snapshot: bool | None
+    __matches: dict[str, list[str]]
+    __matched_types: dict[str, type]
 
-    def __init__(self, container: IContainer, logger: Logger) -> None:
+    def __init__(
+        self,
+        container: IContainer,
+        logger: Logger,
+        snapshot: PodSnapshot | None = None,
+    ) -> None:
         super().__init__()
         self.__container = container
         self.__logger = logger
+        self.__snapshot = snapshot
+        self.__trusts_snapshot = None
+        self.__matches = {}
+        self.__matched_types = {}
+
+    @property
+    def matches(self) -> dict[str, list[str]]:
+        return {key: list(names) for key, names in self.__matches.items()}
+
+    @property
+    def aspect_fingerprints(self) -> dict[str, str]:
+        return {
+            pod.name: get_match_fingerprint(pod.type_)
+            for pod in self.__container.pods.values()
+            if Aspect.exists(pod.target) or AsyncAspect.exists(pod.target)
+        }
+
+    @property
+    def match_fingerprints(self) -> dict[str, str]:
+        # Computed on capture only, so booting without a snapshot pays nothing
+        return {
+            key: get_match_fingerprint(type_)
+            for key, type_ in self.__matched_types.items()
+        }
+
+    def __get_precomputed(self, key: str, type_: type) -> list[str] | None:
+        if self.__snapshot is None or key not in self.__snapshot.aspect_matches:
+            return None
+        if self.__trusts_snapshot is None:
+            # Matches against another set of aspects cannot be reused at all
+            self.__trusts_snapshot = (
+                self.__snapshot.aspect_fingerprints == self.aspect_fingerprints
+            )
+        if not self.__trusts_snapshot:
+            return None
+        if self.__snapshot.match_fingerprints.get(key) != get_match_fingerprint(type_):
+            return None
+        return self.__snapshot.aspect_matches[key]
 
     def post_process(self, pod: object) -> object:
+        key: str = get_reference_key(type(pod))
+        precomputed: list[str] | None = self.__get_precomputed(key, type(pod))
+        matched_names: list[str] = []
+
         def selector(x: Pod) -> bool:
-            return (
+            if precomputed is not None:
+                return x.name in precomputed
+            matched: bool = (
                 Aspect.exists(x.target)
                 and Aspect.get(x.target).matches(pod)
                 or AsyncAspect.exists(x.target)
                 and AsyncAspect.get(x.target).matches(pod)
             )
+            if matched:
+                matched_names.append(x.name)
+            return matched
 
         matched_aspects: Sequence[object] = list(self.__container.find(selector))
+        self.__matches[key] = precomputed if precomputed is not None else matched_names
+        self.__matched_types[key] = type(pod)
         if not any(matched_aspects):
             # No matching aspects found, return the pod as is
             return pod
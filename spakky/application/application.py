@@ -1,11 +1,13 @@
 import inspect
 import sys
+from contextlib import AbstractContextManager, nullcontext
 from importlib.metadata import EntryPoints, entry_points
 from pathlib import Path
 from types import ModuleType
-from typing import Callable
+from typing import Any, Callable
 
 from spakky.application.error import AbstractSpakkyApplicationError
+from spakky.application.profiler import SpanCategory, StartupProfiler
 from spakky.aspects.logging import AsyncLoggingAspect, LoggingAspect
 from spakky.aspects.transactional import AsyncTransactionalAspect, TransactionalAspect
 from spakky.core.constants import PLUGIN_PATH
@@ -16,6 +18,7 @@ from spakky.core.importing import (
     list_objects,
     resolve_module,
 )
+from spakky.event.bus import AsyncEventBus
 from spakky.pod.annotations.pod import Pod, PodType
 from spakky.pod.interfaces.application_context import IApplicationContext
 from spakky.pod.interfaces.container import IContainer
@@ -37,9 +40,27 @@ class SpakkyApplication:
     def container(self) -> IContainer:
         return self._application_context
 
+    @property
+    def profiler(self) -> StartupProfiler | None:
+        return self._application_context.profiler
+
     def __init__(self, application_context: IApplicationContext) -> None:
         self._application_context = application_context
 
+    def __profile(
+        self,
+        name: str,
+        category: SpanCategory,
+        **args: Any,
+    ) -> AbstractContextManager[None]:
+        if self._application_context.profiler is None:
+            return nullcontext()
+        return self._application_context.profiler.span(name, category, **args)
+
+    def enable_profiling(self, profiler: StartupProfiler | None = None) -> Self:
+        self._application_context.profiler = profiler or StartupProfiler()
+        return self
+
     def add(self, obj: PodType) -> Self:
         self._application_context.add(obj)
         return self
@@ -60,6 +81,10 @@ class SpakkyApplication:
         self.add(AsyncTransactionalAspect)
         return self
 
+    def enable_async_event_bus(self) -> Self:
+        self.add(AsyncEventBus)
+        return self
+
     def scan(
         self,
         path: Module | None = None,
@@ -80,14 +105,17 @@ class SpakkyApplication:
 
         if exclude is None:
             exclude = {caller_module} if caller_module else set()
-        if is_package(path):
-            modules = list_modules(path, exclude)
-        else:
-            modules = {resolve_module(path)}
-
-        for module_item in modules:
-            for obj in list_objects(module_item, Pod.exists):
-                self._application_context.add(obj)
+        with self.__profile("scan", SpanCategory.PHASE, path=path):
+            with self.__profile("import_modules", SpanCategory.SCAN):
+                if is_package(path):
+                    modules = list_modules(path, exclude)
+                else:
+                    modules = {resolve_module(path)}
+
+            for module_item in modules:
+                with self.__profile(module_item.__name__, SpanCategory.SCAN):
+                    for obj in list_objects(module_item, Pod.exists):
+                        self._application_context.add(obj)
 
         return self
 
@@ -95,11 +123,13 @@ class SpakkyApplication:
         all_entry_points = entry_points()
         my_plugins: EntryPoints = all_entry_points.select(group=PLUGIN_PATH)
 
-        for entry_point in my_plugins:
-            entry_point_function: Callable[[SpakkyApplication], None] = (
-                entry_point.load()
-            )
-            entry_point_function(self)
+        with self.__profile("load_plugins", SpanCategory.PHASE):
+            for entry_point in my_plugins:
+                with self.__profile(entry_point.name, SpanCategory.PLUGIN):
+                    entry_point_function: Callable[[SpakkyApplication], None] = (
+                        entry_point.load()
+                    )
+                    entry_point_function(self)
         return self
 
     def start(self) -> Self:
@@ -1,32 +1,49 @@
-import threading
-from asyncio import locks
-from asyncio.events import AbstractEventLoop, new_event_loop, set_event_loop
-from asyncio.tasks import run_coroutine_threadsafe
-from contextvars import ContextVar
+from asyncio.exceptions import TimeoutError as AsyncTimeoutError
+from asyncio.tasks import gather, wait_for
+from concurrent.futures import Future
+from contextlib import AbstractContextManager, nullcontext
+from contextvars import ContextVar, copy_context
 from copy import deepcopy
 from logging import Logger, getLogger
 from threading import Thread
-from typing import Callable, cast, overload
-from uuid import UUID, uuid4
+from time import monotonic
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    TypeAlias,
+    TypeVar,
+    cast,
+    overload,
+)
+from uuid import UUID
 
 from spakky.aop.post_processor import AspectPostProcessor
-from spakky.core.constants import CONTEXT_ID, CONTEXT_SCOPE_CACHE
+from spakky.application.event_loop import EventLoopFactory, EventLoopThread
+from spakky.application.profiler import SpanCategory, StartupProfiler
+from spakky.core.constants import CONTEXT_SCOPE_CACHE
+from spakky.core.interfaces.context_bound import IContextBound
 from spakky.core.mro import is_family_with
 from spakky.core.types import ObjectT, is_optional, remove_none
+from spakky.event.post_processor import TransactionEventPublisherPostProcessor
 from spakky.pod.annotations.lazy import Lazy
 from spakky.pod.annotations.order import Order
 from spakky.pod.annotations.pod import Pod, PodType
 from spakky.pod.annotations.qualifier import Qualifier
+from spakky.pod.context_scope import ContextScope
 from spakky.pod.interfaces.application_context import (
     ApplicationContextAlreadyStartedError,
     ApplicationContextAlreadyStoppedError,
-    EventLoopThreadAlreadyStartedInApplicationContextError,
     EventLoopThreadNotStartedInApplicationContextError,
     IApplicationContext,
+    ServiceStartTimeoutError,
+    ServiceStopTimeoutError,
 )
 from spakky.pod.interfaces.container import (
     CannotRegisterNonPodObjectError,
     CircularDependencyGraphDetectedError,
+    ContextBoundPodNotContextScopedError,
     NoSuchPodError,
     NoUniquePodError,
     PodNameAlreadyExistsError,
@@ -35,8 +52,24 @@ from spakky.pod.interfaces.post_processor import IPostProcessor
 from spakky.pod.post_processors.aware_post_processor import (
     ApplicationContextAwareProcessor,
 )
-from spakky.service.interfaces.service import IAsyncService, IService
+from spakky.pod.snapshot import PodSnapshot
+from spakky.service.interfaces.service import (
+    IAsyncService,
+    IService,
+    ISupervisedService,
+)
 from spakky.service.post_processor import ServicePostProcessor
+from spakky.service.scheduled import (
+    ScheduledPodNotSingletonError,
+    get_scheduled_methods,
+)
+from spakky.service.stop_event import ThreadStopEvent
+from spakky.service.supervision import ServiceStatus
+
+T = TypeVar("T")
+
+ServiceGroup: TypeAlias = tuple[list[IService], list[IAsyncService]]
+ServiceFailure: TypeAlias = tuple[IService | IAsyncService, BaseException]
 
 
 class ApplicationContext(IApplicationContext):
@@ -44,28 +77,64 @@ class ApplicationContext(IApplicationContext):
     __pods: dict[str, Pod]
     __forward_type_map: dict[str, type]
     __singleton_cache: dict[str, object]
-    __context_cache: ContextVar[dict[str, object]]
+    __context_scope: ContextVar[ContextScope | None]
     __post_processors: list[IPostProcessor]
+    __aspect_post_processor: AspectPostProcessor | None
+    __snapshot: PodSnapshot | None
     __services: list[IService]
     __async_services: list[IAsyncService]
-    __event_loop: AbstractEventLoop | None
-    __event_thread: Thread | None
+    __event_loops: list[EventLoopThread]
+    __service_loops: dict[int, EventLoopThread]
+    __service_start_timeout: float | None
+    __service_stop_timeout: float | None
     __is_started: bool
 
-    def __init__(self, logger: Logger | None = None) -> None:
+    def __init__(
+        self,
+        logger: Logger | None = None,
+        profiler: StartupProfiler | None = None,
+        snapshot: PodSnapshot | None = None,
+        service_start_timeout: float | None = None,
+        service_stop_timeout: float | None = None,
+        event_loop_count: int = 1,
+        event_loop_factory: EventLoopFactory | None = None,
+    ) -> None:
+        if event_loop_count < 1:
+            raise ValueError("event_loop_count must be at least 1")
         self.__logger = logger or getLogger()
         self.__forward_type_map = {}
         self.__pods = {}
         self.__singleton_cache = {}
-        self.__context_cache = ContextVar(CONTEXT_SCOPE_CACHE)
+        self.__context_scope = ContextVar(CONTEXT_SCOPE_CACHE, default=None)
         self.__post_processors = []
+        self.__aspect_post_processor = None
+        self.__snapshot = snapshot
         self.__services = []
         self.__async_services = []
-        self.__event_loop = None
-        self.__event_thread = None
+        self.__event_loops = [
+            EventLoopThread(f"{type(self).__name__}-{index}", event_loop_factory)
+            for index in range(event_loop_count)
+        ]
+        self.__service_loops = {}
+        self.__service_start_timeout = service_start_timeout
+        self.__service_stop_timeout = service_stop_timeout
         self.__is_started = False
-        self.task_stop_event = locks.Event()
-        self.thread_stop_event = threading.Event()
+        self.task_stop_event = self.__event_loops[0].stop_event
+        self.thread_stop_event = ThreadStopEvent()
+        self.profiler = profiler
+        if self.__snapshot is not None:
+            # Pods decorated from now on are restored from the snapshot
+            self.__snapshot.activate()
+
+    def __profile(
+        self,
+        name: str,
+        category: SpanCategory,
+        **args: Any,
+    ) -> AbstractContextManager[None]:
+        if self.profiler is None:
+            return nullcontext()
+        return self.profiler.span(name, category, **args)
 
     def __resolve_candidate(
         self,
@@ -113,13 +182,26 @@ class ApplicationContext(IApplicationContext):
 
     def __post_process_pod(self, pod: object) -> object:
         for post_processor in self.__post_processors:
-            pod = post_processor.post_process(pod)
+            with self.__profile(
+                type(post_processor).__name__,
+                SpanCategory.POST_PROCESSOR,
+                pod=type(pod).__name__,
+            ):
+                pod = post_processor.post_process(pod)
         return pod
 
     def __register_post_processors(self) -> None:
+        self.__aspect_post_processor = AspectPostProcessor(
+            self,
+            self.__logger,
+            self.__snapshot,
+        )
         self.__add_post_processor(ApplicationContextAwareProcessor(self, self.__logger))
-        self.__add_post_processor(AspectPostProcessor(self, self.__logger))
+        self.__add_post_processor(self.__aspect_post_processor)
         self.__add_post_processor(ServicePostProcessor(self, self.__logger))
+        self.__add_post_processor(
+            TransactionEventPublisherPostProcessor(self, self.__logger)
+        )
 
         post_processors: list[IPostProcessor] = cast(
             list[IPostProcessor],
@@ -143,8 +225,12 @@ class ApplicationContext(IApplicationContext):
         self.__forward_type_map.clear()
         self.__singleton_cache.clear()
         self.__post_processors.clear()
+        self.__aspect_post_processor = None
         self.__services.clear()
         self.__async_services.clear()
+        self.__service_loops.clear()
+        for event_loop in self.__event_loops:
+            event_loop.services.clear()
 
     def __set_singleton_cache(self, pod: Pod, instance: object) -> None:
         if pod.scope == Pod.Scope.SINGLETON:
@@ -153,15 +239,19 @@ class ApplicationContext(IApplicationContext):
     def __get_singleton_cache(self, pod: Pod) -> object | None:
         return self.__singleton_cache.get(pod.name)
 
+    def __get_context_scope(self) -> ContextScope:
+        scope: ContextScope | None = self.__context_scope.get()
+        if scope is None:
+            # Implicit scope lives until the context is cleared
+            scope = ContextScope(self.__context_scope, self.__logger)
+            self.__context_scope.set(scope)
+        return scope
+
     def __set_context_cache(self, pod: Pod, instance: object) -> None:
-        cache = self.__context_cache.get({})
-        cache[pod.name] = instance
-        self.__context_cache.set(cache)
+        self.__get_context_scope().instances[pod.name] = instance
 
     def __get_context_cache(self, pod: Pod) -> object | None:
-        cache = self.__context_cache.get({})
-        cached = cache.get(pod.name)
-        return cached
+        return self.__get_context_scope().instances.get(pod.name)
 
     def __get_internal(
         self,
@@ -199,10 +289,11 @@ class ApplicationContext(IApplicationContext):
             case Pod.Scope.PROTOTYPE:
                 pass
 
-        instance: object = self.__instantiate_pod(
-            pod,
-            dependency_hierarchy,
-        )
+        with self.__profile(pod.name, SpanCategory.POD, scope=pod.scope.name):
+            instance: object = self.__instantiate_pod(
+                pod,
+                dependency_hierarchy,
+            )
 
         # Cache the instance based on pod scope
         match pod.scope:
@@ -218,56 +309,142 @@ class ApplicationContext(IApplicationContext):
     def __add_post_processor(self, post_processor: IPostProcessor) -> None:
         self.__post_processors.append(post_processor)
 
-    def __run_event_loop(self, loop: AbstractEventLoop) -> None:
-        set_event_loop(loop)
-        loop.run_forever()
-        loop.close()
-
-    def __start_services(self) -> None:
-        if self.__event_loop is not None:
-            raise EventLoopThreadAlreadyStartedInApplicationContextError
-        if self.__event_thread is not None:
-            raise EventLoopThreadAlreadyStartedInApplicationContextError
-
-        self.__event_loop = new_event_loop()
-        self.__event_thread = Thread(
-            target=self.__run_event_loop,
-            args=(self.__event_loop,),
-            daemon=True,
-        )
-        self.__event_thread.start()
-
+    def __group_services(self) -> list[ServiceGroup]:
+        groups: dict[int, ServiceGroup] = {}
         for service in self.__services:
+            order: int = Order.get_or_default(service, Order()).order
+            groups.setdefault(order, ([], []))[0].append(service)
+        for async_service in self.__async_services:
+            order = Order.get_or_default(async_service, Order()).order
+            groups.setdefault(order, ([], []))[1].append(async_service)
+        return [groups[order] for order in sorted(groups)]
+
+    def __run_service_group(
+        self,
+        group: ServiceGroup,
+        run: Callable[[IService], None],
+        run_async: Callable[[IAsyncService], Awaitable[None]],
+        timeout: float | None,
+        timeout_error: type[Exception],
+    ) -> list[ServiceFailure]:
+        services, async_services = group
+
+        async def run_async_service(service: IAsyncService) -> None:
+            try:
+                await wait_for(run_async(service), timeout)
+            except AsyncTimeoutError as e:
+                raise timeout_error(type(service).__name__) from e
+
+        async def run_async_services(
+            services: list[IAsyncService],
+        ) -> list[BaseException | None]:
+            return await gather(
+                *(run_async_service(service) for service in services),
+                return_exceptions=True,
+            )
+
+        # Each async service runs on the event loop it was assigned to
+        partitions: dict[int, tuple[EventLoopThread, list[IAsyncService]]] = {}
+        for async_service in async_services:
+            event_loop = self.__service_loops[id(async_service)]
+            partitions.setdefault(id(event_loop), (event_loop, []))[1].append(
+                async_service
+            )
+        async_results = [
+            (partition, event_loop.submit(run_async_services(partition)))
+            for event_loop, partition in partitions.values()
+        ]
+        failures: list[ServiceFailure] = []
+        if any(services):
+            errors: dict[int, BaseException] = {}
+
+            def run_service(service: IService) -> None:
+                try:
+                    run(service)
+                except BaseException as e:
+                    errors[id(service)] = e
+
+            # Plain threads instead of an executor, since services may opt into
+            # fork and executor threads cannot exit cleanly in a forked child
+            threads: list[tuple[IService, Thread]] = [
+                (
+                    service,
+                    Thread(
+                        # Copy the context so profiler spans nest under the current phase
+                        target=copy_context().run,
+                        args=(run_service, service),
+                        daemon=True,
+                        name=f"{type(self).__name__}-{type(service).__name__}",
+                    ),
+                )
+                for service in services
+            ]
+            for _, thread in threads:
+                thread.start()
+            deadline: float | None = None if timeout is None else monotonic() + timeout
+            for service, thread in threads:
+                # Do not block on services that exceeded their deadline
+                thread.join(
+                    None if deadline is None else max(deadline - monotonic(), 0)
+                )
+                if thread.is_alive():
+                    failures.append((service, timeout_error(type(service).__name__)))
+                elif (error := errors.get(id(service))) is not None:
+                    failures.append((service, error))
+        for partition, future in async_results:
+            for async_service, result in zip(partition, future.result()):
+                if result is not None:
+                    failures.append((async_service, result))
+        return failures
+
+    def __start_service(self, service: IService) -> None:
+        with self.__profile(type(service).__name__, SpanCategory.SERVICE):
             service.start()
 
-        async def start_async_services() -> None:
-            if self.__event_loop is None:
-                raise EventLoopThreadNotStartedInApplicationContextError
-            for service in self.__async_services:
-                await service.start_async()
+    async def __start_async_service(self, service: IAsyncService) -> None:
+        with self.__profile(type(service).__name__, SpanCategory.SERVICE):
+            await service.start_async()
 
-        run_coroutine_threadsafe(start_async_services(), self.__event_loop).result()
+    def __start_services(self) -> None:
+        self.thread_stop_event.clear()
+        for event_loop in self.__event_loops:
+            event_loop.start()
+
+        # Services sharing the same order are started concurrently,
+        # groups are started in ascending order
+        for group in self.__group_services():
+            failures: list[ServiceFailure] = self.__run_service_group(
+                group=group,
+                run=self.__start_service,
+                run_async=self.__start_async_service,
+                timeout=self.__service_start_timeout,
+                timeout_error=ServiceStartTimeoutError,
+            )
+            if any(failures):
+                raise failures[0][1]
 
     def __stop_services(self) -> None:
-        if self.__event_loop is None:
-            raise EventLoopThreadNotStartedInApplicationContextError
-        if self.__event_thread is None:
+        if not all(event_loop.is_running for event_loop in self.__event_loops):
             raise EventLoopThreadNotStartedInApplicationContextError
 
-        for service in self.__services:
-            service.stop()
-
-        async def stop_async_services() -> None:
-            if self.__event_loop is None:
-                raise EventLoopThreadNotStartedInApplicationContextError
-            for service in self.__async_services:
-                await service.stop_async()
+        # Groups are stopped in reverse order so dependents stop first
+        for group in reversed(self.__group_services()):
+            failures: list[ServiceFailure] = self.__run_service_group(
+                group=group,
+                run=lambda service: service.stop(),
+                run_async=lambda service: service.stop_async(),
+                timeout=self.__service_stop_timeout,
+                timeout_error=ServiceStopTimeoutError,
+            )
+            for service, error in failures:
+                self.__logger.error(
+                    f"[{type(self).__name__}] {type(service).__name__!r} failed to stop: {error!r}"
+                )
 
-        run_coroutine_threadsafe(stop_async_services(), self.__event_loop).result()
-        self.__event_loop.call_soon_threadsafe(self.__event_loop.stop)
-        self.__event_thread.join()
-        self.__event_loop = None
-        self.__event_thread = None
+        # Anything still derived from the context-level event is stopped as well
+        self.thread_stop_event.set()
+        for event_loop in self.__event_loops:
+            event_loop.stop()
 
     @property
     def pods(self) -> dict[str, Pod]:
@@ -277,6 +454,33 @@ class ApplicationContext(IApplicationContext):
     def is_started(self) -> bool:
         return self.__is_started
 
+    @property
+    def service_statuses(self) -> dict[str, ServiceStatus]:
+        services: list[IService | IAsyncService] = [
+            *self.__services,
+            *self.__async_services,
+        ]
+        # Pods are keyed by their unique name, services added directly by their own
+        names: dict[int, str] = {
+            id(instance): name for name, instance in self.__singleton_cache.items()
+        }
+        statuses: dict[str, ServiceStatus] = {}
+        for service in services:
+            if isinstance(service, ISupervisedService):
+                status: ServiceStatus = service.status
+                statuses[names.get(id(service), status.name)] = status
+        return statuses
+
+    def create_snapshot(self) -> PodSnapshot:
+        if self.__aspect_post_processor is None:
+            return PodSnapshot.capture(pods=self.__pods.values())
+        return PodSnapshot.capture(
+            pods=self.__pods.values(),
+            aspect_matches=self.__aspect_post_processor.matches,
+            aspect_fingerprints=self.__aspect_post_processor.aspect_fingerprints,
+            match_fingerprints=self.__aspect_post_processor.match_fingerprints,
+        )
+
     def find(self, selector: Callable[[Pod], bool]) -> set[object]:
         return {
             self.__get_internal(type_=pod.type_, name=pod.name)
@@ -292,6 +496,12 @@ class ApplicationContext(IApplicationContext):
             if self.__pods[pod.name].id == pod.id:
                 return
             raise PodNameAlreadyExistsError(pod.name)
+        if pod.scope != Pod.Scope.SINGLETON and get_scheduled_methods(pod.type_):
+            # Every instance of another scope would add its jobs once more
+            raise ScheduledPodNotSingletonError(pod.name)
+        if pod.scope != Pod.Scope.CONTEXT and pod.is_family_with(IContextBound):
+            # A singleton would share its state across every context and thread
+            raise ContextBoundPodNotContextScopedError(pod.name)
         for base_type in pod.base_types:
             self.__forward_type_map[base_type.__name__] = base_type
         self.__pods[pod.name] = pod
@@ -300,15 +510,41 @@ class ApplicationContext(IApplicationContext):
         if isinstance(service, IService):
             self.__services.append(service)
         if isinstance(service, IAsyncService):
+            # Async services are spread across event loops by assigned service count
+            event_loop = min(self.__event_loops, key=lambda x: len(x.services))
+            event_loop.services.append(service)
+            self.__service_loops[id(service)] = event_loop
+            # Async stop events are bound to a loop, so they are derived here
+            service.set_stop_event(event_loop.stop_event.spawn())
             self.__async_services.append(service)
 
+    def submit(
+        self,
+        coroutine: Coroutine[Any, Any, T],
+        loop: int | None = None,
+    ) -> Future[T]:
+        if loop is not None:
+            return self.__event_loops[loop].submit(coroutine)
+        # Least loaded event loop by assigned services and pending coroutines
+        event_loop = min(self.__event_loops, key=lambda x: x.load)
+        return event_loop.submit(coroutine)
+
     def start(self) -> None:
         if self.__is_started:
             raise ApplicationContextAlreadyStartedError()
         self.__is_started = True
-        self.__register_post_processors()
-        self.__initialize_pods()
-        self.__start_services()
+        with self.__profile("start", SpanCategory.PHASE):
+            with self.__profile(
+                "register_post_processors",
+                SpanCategory.POST_PROCESSOR_REGISTRATION,
+            ):
+                self.__register_post_processors()
+            with self.__profile("initialize_pods", SpanCategory.PHASE):
+                self.__initialize_pods()
+            with self.__profile("start_services", SpanCategory.PHASE):
+                self.__start_services()
+        if self.profiler is not None:
+            self.profiler.finish()
 
     def stop(self) -> None:
         if not self.__is_started:
@@ -316,6 +552,9 @@ class ApplicationContext(IApplicationContext):
         self.__stop_services()
         self.__clear_all()
         self.__is_started = False
+        if self.__snapshot is not None:
+            # Records must not outlive the context that activated them
+            self.__snapshot.deactivate()
 
     @overload
     def get(self, type_: type[ObjectT]) -> ObjectT: ...
@@ -344,12 +583,11 @@ class ApplicationContext(IApplicationContext):
             return name in self.__pods
         return any(pod for pod in self.__pods.values() if pod.is_family_with(type_))
 
+    def scope(self) -> ContextScope:
+        return ContextScope(self.__context_scope, self.__logger)
+
     def get_context_id(self) -> UUID:
-        context = self.__context_cache.get({})
-        if CONTEXT_ID not in context:
-            context[CONTEXT_ID] = uuid4()
-            self.__context_cache.set(context)
-        return cast(UUID, context[CONTEXT_ID])
+        return self.__get_context_scope().id
 
     def clear_context(self) -> None:
-        self.__context_cache.set({})
+        self.__context_scope.set(None)
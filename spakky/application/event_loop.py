@@ -0,0 +1,108 @@
+import threading
+from asyncio.events import AbstractEventLoop, new_event_loop, set_event_loop
+from asyncio.tasks import run_coroutine_threadsafe
+from concurrent.futures import Future
+from importlib.util import find_spec
+from threading import Thread
+from typing import Any, Callable, Coroutine, TypeAlias, TypeVar
+
+from spakky.pod.interfaces.application_context import (
+    EventLoopThreadAlreadyStartedInApplicationContextError,
+    EventLoopThreadNotStartedInApplicationContextError,
+)
+from spakky.service.interfaces.service import IAsyncService
+from spakky.service.stop_event import TaskStopEvent
+
+T = TypeVar("T")
+
+EventLoopFactory: TypeAlias = Callable[[], AbstractEventLoop]
+
+
+def get_default_event_loop_factory() -> EventLoopFactory:
+    if find_spec("uvloop") is not None:  # pragma: no cover
+        import uvloop  # type: ignore
+
+        return uvloop.new_event_loop  # type: ignore
+    return new_event_loop
+
+
+class EventLoopThread:
+    __name: str
+    __factory: EventLoopFactory
+    __loop: AbstractEventLoop | None
+    __thread: Thread | None
+    __pending: int
+    __lock: threading.Lock
+    stop_event: TaskStopEvent
+    services: list[IAsyncService]
+
+    def __init__(self, name: str, factory: EventLoopFactory | None = None) -> None:
+        self.__name = name
+        self.__factory = factory or get_default_event_loop_factory()
+        self.__loop = None
+        self.__thread = None
+        self.__pending = 0
+        self.__lock = threading.Lock()
+        # Asyncio events are bound to a single loop, so each loop owns its own
+        self.stop_event = TaskStopEvent()
+        self.services = []
+
+    def __run(self, loop: AbstractEventLoop) -> None:
+        set_event_loop(loop)
+        loop.run_forever()
+        loop.close()
+
+    def __done(self, _: Future[Any]) -> None:
+        with self.__lock:
+            self.__pending -= 1
+
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    @property
+    def loop(self) -> AbstractEventLoop:
+        if self.__loop is None:
+            raise EventLoopThreadNotStartedInApplicationContextError
+        return self.__loop
+
+    @property
+    def is_running(self) -> bool:
+        return self.__loop is not None
+
+    @property
+    def load(self) -> int:
+        return len(self.services) + self.__pending
+
+    def start(self) -> None:
+        if self.__loop is not None or self.__thread is not None:
+            raise EventLoopThreadAlreadyStartedInApplicationContextError
+        self.stop_event.clear()
+        self.__loop = self.__factory()
+        self.__thread = Thread(
+            target=self.__run,
+            args=(self.__loop,),
+            daemon=True,
+            name=self.__name,
+        )
+        self.__thread.start()
+
+    def stop(self) -> None:
+        if self.__loop is None or self.__thread is None:
+            raise EventLoopThreadNotStartedInApplicationContextError
+        # Anything still derived from this loop's stop event is stopped as well
+        self.__loop.call_soon_threadsafe(self.stop_event.set)
+        self.__loop.call_soon_threadsafe(self.__loop.stop)
+        self.__thread.join()
+        self.__loop = None
+        self.__thread = None
+
+    def submit(self, coroutine: Coroutine[Any, Any, T]) -> Future[T]:
+        if self.__loop is None:
+            coroutine.close()
+            raise EventLoopThreadNotStartedInApplicationContextError
+        future: Future[T] = run_coroutine_threadsafe(coroutine, self.__loop)
+        with self.__lock:
+            self.__pending += 1
+        future.add_done_callback(self.__done)
+        return future
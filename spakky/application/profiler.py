@@ -0,0 +1,166 @@
+import json
+import os
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any, Iterator
+
+NANOSECONDS_PER_MICROSECOND = 1_000
+NANOSECONDS_PER_MILLISECOND = 1_000_000
+
+
+class SpanCategory(str, Enum):
+    PHASE = "phase"
+    SCAN = "scan"
+    PLUGIN = "plugin"
+    POST_PROCESSOR_REGISTRATION = "post_processor_registration"
+    POD = "pod"
+    POST_PROCESSOR = "post_processor"
+    SERVICE = "service"
+
+
+class TimelineFormat(str, Enum):
+    JSON = "json"
+    CHROME_TRACE = "chrome_trace"
+
+
+@dataclass
+class TimelineSpan:
+    name: str
+    category: SpanCategory
+    start: int
+    thread_id: int
+    depth: int
+    duration: int = 0
+    children_duration: int = 0
+    args: dict[str, Any] = field(default_factory=dict[str, Any])
+
+    @property
+    def self_duration(self) -> int:
+        # Concurrent children may overlap, so their sum can exceed the parent
+        return max(self.duration - self.children_duration, 0)
+
+
+class StartupProfiler:
+    __origin: int
+    __spans: list[TimelineSpan]
+    __stack: ContextVar[tuple[TimelineSpan, ...]]
+    __lock: threading.Lock
+    __is_finished: bool
+
+    def __init__(self) -> None:
+        self.__origin = perf_counter_ns()
+        self.__spans = []
+        # Context variable keeps nesting correct across threads and asyncio tasks
+        self.__stack = ContextVar(f"{type(self).__name__}_{id(self)}", default=())
+        self.__lock = threading.Lock()
+        self.__is_finished = False
+
+    @property
+    def is_finished(self) -> bool:
+        return self.__is_finished
+
+    @property
+    def spans(self) -> list[TimelineSpan]:
+        with self.__lock:
+            return sorted(self.__spans, key=lambda x: x.start)
+
+    @contextmanager
+    def span(
+        self,
+        name: str,
+        category: SpanCategory,
+        **args: Any,
+    ) -> Iterator[None]:
+        if self.__is_finished:
+            yield
+            return
+        stack: tuple[TimelineSpan, ...] = self.__stack.get()
+        span = TimelineSpan(
+            name=name,
+            category=category,
+            start=perf_counter_ns() - self.__origin,
+            thread_id=threading.get_ident(),
+            depth=len(stack),
+            args=args,
+        )
+        token = self.__stack.set((*stack, span))
+        try:
+            yield
+        finally:
+            span.duration = perf_counter_ns() - self.__origin - span.start
+            self.__stack.reset(token)
+            with self.__lock:
+                if stack:
+                    # Parent span's self time excludes time spent in nested spans
+                    stack[-1].children_duration += span.duration
+                self.__spans.append(span)
+
+    def finish(self) -> None:
+        self.__is_finished = True
+
+    def to_dict(self) -> dict[str, Any]:
+        spans: list[TimelineSpan] = self.spans
+        total: int = max((x.start + x.duration for x in spans), default=0)
+        return {
+            "total_ms": total / NANOSECONDS_PER_MILLISECOND,
+            "spans": [
+                {
+                    "name": span.name,
+                    "category": span.category.value,
+                    "start_ms": span.start / NANOSECONDS_PER_MILLISECOND,
+                    "duration_ms": span.duration / NANOSECONDS_PER_MILLISECOND,
+                    "self_ms": span.self_duration / NANOSECONDS_PER_MILLISECOND,
+                    "depth": span.depth,
+                    "thread_id": span.thread_id,
+                    "args": {key: str(value) for key, value in span.args.items()},
+                }
+                for span in spans
+            ],
+        }
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        process_id: int = os.getpid()
+        return {
+            "displayTimeUnit": "ms",
+            "traceEvents": [
+                {
+                    "name": span.name,
+                    "cat": span.category.value,
+                    "ph": "X",
+                    "ts": span.start / NANOSECONDS_PER_MICROSECOND,
+                    "dur": span.duration / NANOSECONDS_PER_MICROSECOND,
+                    "pid": process_id,
+                    "tid": span.thread_id,
+                    "args": {key: str(value) for key, value in span.args.items()},
+                }
+                for span in self.spans
+            ],
+        }
+
+    def slowest(
+        self,
+        category: SpanCategory | None = None,
+        limit: int = 10,
+    ) -> list[TimelineSpan]:
+        spans: list[TimelineSpan] = [
+            span for span in self.spans if category is None or span.category == category
+        ]
+        spans.sort(key=lambda x: x.self_duration, reverse=True)
+        return spans[:limit]
+
+    def export(
+        self,
+        path: str | Path,
+        format: TimelineFormat = TimelineFormat.JSON,
+    ) -> None:
+        match format:
+            case TimelineFormat.JSON:
+                content: dict[str, Any] = self.to_dict()
+            case TimelineFormat.CHROME_TRACE:
+                content = self.to_chrome_trace()
+        Path(path).write_text(json.dumps(content, indent=2), encoding="utf-8")
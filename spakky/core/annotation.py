@@ -1,6 +1,6 @@
 import sys
 from dataclasses import dataclass
-from typing import Any, final
+from typing import Any, ClassVar, final
 
 from spakky.core.constants import ANNOTATION_METADATA
 from spakky.core.error import AbstractSpakkyCoreError
@@ -12,72 +12,121 @@ else:
     from typing_extensions import Self  # pragma: no cover
 
 
+@final
+class AnnotationRegistry:
+    __slots__ = ("owner", "annotations", "unique")
+
+    owner: Any
+    annotations: dict[type, list[Any]]
+    unique: dict[type, Any]
+
+    def __init__(self, owner: Any) -> None:
+        self.owner = owner
+        self.annotations = {}
+        self.unique = {}
+
+    def copy(self, owner: Any) -> "AnnotationRegistry":
+        registry = AnnotationRegistry(owner)
+        registry.annotations = {
+            key: list(value) for key, value in self.annotations.items()
+        }
+        registry.unique = dict(self.unique)
+        return registry
+
+    def add(self, annotation: "Annotation", annotation_types: tuple[type, ...]) -> None:
+        for annotation_type in annotation_types:
+            annotations: list[Any] | None = self.annotations.get(annotation_type)
+            if annotations is None:
+                self.annotations[annotation_type] = [annotation]
+                self.unique[annotation_type] = annotation
+                continue
+            annotations.append(annotation)
+            self.unique.pop(annotation_type, None)
+
+
 @dataclass
 class Annotation:
+    __lineages: ClassVar[dict[type, tuple[type, ...]]] = {}
+
     def __call__(self, obj: AnyT) -> AnyT:
         return self.__set_metadata(obj)
 
     @final
-    def __set_metadata(self, obj: AnyT) -> AnyT:
-        metadata: dict[type, list[Self]] = self.__get_metadata(obj)
-        for base_type in type(self).mro():
-            if base_type not in metadata:
-                metadata[base_type] = []
-            metadata[base_type].append(self)
-        setattr(obj, ANNOTATION_METADATA, metadata)
-        return obj
+    @classmethod
+    def __lineage(cls) -> tuple[type, ...]:
+        lineage: tuple[type, ...] | None = Annotation.__lineages.get(cls)
+        if lineage is None:
+            lineage = tuple(
+                base_type
+                for base_type in cls.mro()
+                if isinstance(base_type, type) and issubclass(base_type, Annotation)
+            )
+            Annotation.__lineages[cls] = lineage
+        return lineage
 
     @final
-    @classmethod
-    def __get_metadata(cls, obj: Any) -> dict[type, list[Self]]:
-        metadata: dict[type, list[Self]] = getattr(obj, ANNOTATION_METADATA, {})
-        return metadata
+    def __set_metadata(self, obj: AnyT) -> AnyT:
+        registry: AnnotationRegistry | None = getattr(obj, ANNOTATION_METADATA, None)
+        if registry is None:
+            registry = AnnotationRegistry(obj)
+        elif registry.owner is not obj:
+            # Registry was inherited from a base class or copied by functools.wraps,
+            # so it is copied before being written to keep the original intact
+            registry = registry.copy(obj)
+        registry.add(self, self.__lineage())
+        setattr(obj, ANNOTATION_METADATA, registry)
+        return obj
 
     @final
     @classmethod
     def all(cls, obj: Any) -> list[Self]:
-        metadata: dict[type, list[Self]] = cls.__get_metadata(obj)
-        annotations: list[Self] = metadata.get(cls, [])
-        return annotations
+        registry: AnnotationRegistry | None = getattr(obj, ANNOTATION_METADATA, None)
+        if registry is None:
+            return []
+        return list(registry.annotations.get(cls, ()))
 
     @final
     @classmethod
     def get(cls, obj: Any) -> Self:
-        metadata: dict[type, list[Self]] = cls.__get_metadata(obj)
-        if cls not in metadata:
+        registry: AnnotationRegistry | None = getattr(obj, ANNOTATION_METADATA, None)
+        if registry is None:
             raise AnnotationNotFoundError(cls, obj)
-        annotations: list[Self] = metadata.get(cls, [])
-        if len(annotations) > 1:
+        annotation: Self | None = registry.unique.get(cls)
+        if annotation is not None:
+            return annotation
+        if cls in registry.annotations:
             raise MultipleAnnotationFoundError(cls, obj)
-        return annotations[0]
+        raise AnnotationNotFoundError(cls, obj)
 
     @final
     @classmethod
     def get_or_none(cls, obj: Any) -> Self | None:
-        metadata: dict[type, list[Self]] = cls.__get_metadata(obj)
-        if cls not in metadata:
+        registry: AnnotationRegistry | None = getattr(obj, ANNOTATION_METADATA, None)
+        if registry is None:
             return None
-        annotations: list[Self] = metadata.get(cls, [])
-        if len(annotations) > 1:
+        annotation: Self | None = registry.unique.get(cls)
+        if annotation is None and cls in registry.annotations:
             raise MultipleAnnotationFoundError(cls, obj)
-        return annotations[0]
+        return annotation
 
     @final
     @classmethod
     def get_or_default(cls, obj: Any, default: Self) -> Self:
-        metadata: dict[type, list[Self]] = cls.__get_metadata(obj)
-        if cls not in metadata:
+        registry: AnnotationRegistry | None = getattr(obj, ANNOTATION_METADATA, None)
+        if registry is None:
             return default
-        annotations: list[Self] = metadata.get(cls, [])
-        if len(annotations) > 1:
+        annotation: Self | None = registry.unique.get(cls)
+        if annotation is not None:
+            return annotation
+        if cls in registry.annotations:
             raise MultipleAnnotationFoundError(cls, obj)
-        return annotations[0]
+        return default
 
     @final
     @classmethod
     def exists(cls, obj: Any) -> bool:
-        metadata: dict[type, list[Self]] = cls.__get_metadata(obj)
-        return cls in metadata
+        registry: AnnotationRegistry | None = getattr(obj, ANNOTATION_METADATA, None)
+        return registry is not None and cls in registry.annotations
 
 
 @dataclass
@@ -8,4 +8,4 @@ SELF = "self"
 INIT = "__init__"
 PROTOCOL_INIT = "_no_init_or_replace_init"
 CONTEXT_SCOPE_CACHE = "__spakky_context_scope_cache__"
-CONTEXT_ID = "__spakky_context_id__"
+MRO_CACHE_SIZE = 1024
@@ -10,6 +10,8 @@ else:
 
 @runtime_checkable
 class ICloneable(Protocol):
+    __slots__ = ()
+
     @abstractmethod
     def clone(self) -> Self: ...
 
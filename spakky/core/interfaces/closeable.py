@@ -0,0 +1,18 @@
+from abc import abstractmethod
+from typing import Protocol, TypeVar, runtime_checkable
+
+
+@runtime_checkable
+class ICloseable(Protocol):
+    @abstractmethod
+    def close(self) -> None: ...
+
+
+@runtime_checkable
+class IAsyncCloseable(Protocol):
+    @abstractmethod
+    async def close_async(self) -> None: ...
+
+
+CloseableT = TypeVar("CloseableT", bound=ICloseable)
+AsyncCloseableT = TypeVar("AsyncCloseableT", bound=IAsyncCloseable)
@@ -10,6 +10,8 @@ else:
 
 @runtime_checkable
 class IComparable(Protocol):
+    __slots__ = ()
+
     @abstractmethod
     def __lt__(self, __value: Self) -> bool: ...
 
@@ -0,0 +1,7 @@
+from abc import ABC
+
+
+class IContextBound(ABC):
+    # Holds state that must not outlive a context scope, so pods of these
+    # classes are only registered with Pod.Scope.CONTEXT
+    ...
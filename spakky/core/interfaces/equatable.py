@@ -4,6 +4,8 @@ from typing import Protocol, TypeVar, runtime_checkable
 
 @runtime_checkable
 class IEquatable(Protocol):
+    __slots__ = ()
+
     @abstractmethod
     def __eq__(self, __value: object) -> bool: ...
 
@@ -2,10 +2,13 @@
 # type: ignore
 
 import sys
+import threading
+from collections import OrderedDict
 from typing import *  # noqa: F403
-from typing import Any, Generic, Protocol, TypeGuard, get_args, get_origin
+from typing import Any, Generic, Protocol, TypeAlias, TypeGuard, get_args, get_origin
+from weakref import WeakKeyDictionary
 
-from spakky.core.constants import ORIGIN_BASES, PARAMETERS
+from spakky.core.constants import MRO_CACHE_SIZE, ORIGIN_BASES, PARAMETERS
 from spakky.core.types import ClassT
 
 if sys.version_info >= (3, 11):
@@ -38,7 +41,7 @@ def _generic_mro(result: dict[type, Any], tp: Any) -> None:
             _generic_mro(result, base)
 
 
-def generic_mro(tp: Any) -> list[type]:
+def _compute_generic_mro(tp: Any) -> list[type]:
     origin = get_origin(tp)
     if origin is None and not hasattr(tp, ORIGIN_BASES):
         if not isinstance(tp, type):
@@ -49,9 +52,64 @@ def generic_mro(tp: Any) -> list[type]:
     _generic_mro(result, tp)
     cls = origin if origin is not None else tp
     return list(result.get(sub_cls, sub_cls) for sub_cls in cls.__mro__)
-    cls = origin if origin is not None else tp
-    return list(result.get(sub_cls, sub_cls) for sub_cls in cls.__mro__)
+
+
+# The first entry of an MRO is the type itself, so only the ancestors are cached.
+# Otherwise the cached value would keep its own weak key alive forever.
+_Ancestors: TypeAlias = tuple[tuple[Any, ...], frozenset[Any]]
+
+_class_cache: WeakKeyDictionary[type, _Ancestors] = WeakKeyDictionary()
+_alias_cache: OrderedDict[Any, _Ancestors] = OrderedDict()
+_alias_cache_lock = threading.Lock()
+
+
+def _ancestors(tp: Any) -> _Ancestors | None:
+    if isinstance(tp, type):
+        try:
+            return _class_cache[tp]
+        except KeyError:
+            mro = _compute_generic_mro(tp)
+            ancestors = (tuple(mro[1:]), frozenset(mro[1:]))
+            _class_cache[tp] = ancestors
+            return ancestors
+    try:
+        with _alias_cache_lock:
+            ancestors = _alias_cache[tp]
+            _alias_cache.move_to_end(tp)
+            return ancestors
+    except KeyError:
+        mro = _compute_generic_mro(tp)
+        ancestors = (tuple(mro[1:]), frozenset(mro[1:]))
+        with _alias_cache_lock:
+            _alias_cache[tp] = ancestors
+            if len(_alias_cache) > MRO_CACHE_SIZE:
+                _alias_cache.popitem(last=False)
+        return ancestors
+    except TypeError:
+        # Unhashable generic aliases cannot be cached
+        return None
+
+
+def generic_mro(tp: Any) -> list[type]:
+    ancestors = _ancestors(tp)
+    if ancestors is None:
+        return _compute_generic_mro(tp)
+    return [tp, *ancestors[0]]
 
 
 def is_family_with(tp: Any, target: ClassT) -> TypeGuard[ClassT]:
-    return target in generic_mro(tp)
+    if tp == target:
+        return True
+    ancestors = _ancestors(tp)
+    if ancestors is None:
+        return target in _compute_generic_mro(tp)
+    try:
+        return target in ancestors[1]
+    except TypeError:
+        return target in ancestors[0]
+
+
+def clear_mro_cache() -> None:
+    _class_cache.clear()
+    with _alias_cache_lock:
+        _alias_cache.clear()
@@ -1,5 +1,7 @@
 import sys
 from dataclasses import dataclass, field
+from types import FunctionType
+from typing import Any, Callable, overload
 
 from spakky.core.types import AnyT
 
@@ -9,14 +11,100 @@ else:
     from typing_extensions import dataclass_transform  # pragma: no cover
 
 
+def _rebind_class_cells(old: type, new: type) -> None:
+    # Slotted dataclasses are recreated, so zero-argument super() in their
+    # methods would still point to the discarded class
+    for member in new.__dict__.values():
+        if isinstance(member, (classmethod, staticmethod)):
+            member = member.__func__
+        elif isinstance(member, property):
+            member = member.fget
+        if not isinstance(member, FunctionType) or member.__closure__ is None:
+            continue
+        for cell in member.__closure__:
+            if cell.cell_contents is old:
+                cell.cell_contents = new
+
+
+def _add_weakref_slot(cls: type[AnyT]) -> type[AnyT]:
+    # dataclass() only takes weakref_slot from Python 3.11, so the slotted class
+    # is recreated once more with the extra slot, the way dataclass() does it
+    slots: tuple[str, ...] = getattr(cls, "__slots__")
+    namespace: dict[str, Any] = dict(cls.__dict__)
+    for name in slots:
+        namespace.pop(name, None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = (*slots, "__weakref__")
+    recreated: type[AnyT] = type(cls)(cls.__name__, cls.__bases__, namespace)
+    recreated.__qualname__ = cls.__qualname__
+    _rebind_class_cells(cls, recreated)
+    return recreated
+
+
+def _dataclass(
+    cls: type[AnyT],
+    frozen: bool,
+    slots: bool,
+    weakref_slot: bool,
+) -> type[AnyT]:
+    if weakref_slot and not slots:
+        raise TypeError("weakref_slot is True but slots is False")
+    native: bool = weakref_slot and sys.version_info >= (3, 11)
+    options: dict[str, Any] = {"weakref_slot": True} if native else {}
+    decorated: type[AnyT] = dataclass(
+        frozen=frozen,
+        kw_only=True,
+        eq=False,
+        slots=slots,
+        **options,
+    )(cls)
+    if decorated is not cls:
+        _rebind_class_cells(cls, decorated)
+    if weakref_slot and not decorated.__weakrefoffset__:
+        decorated = _add_weakref_slot(decorated)
+    return decorated
+
+
+@overload
+def mutable(cls: type[AnyT], /) -> type[AnyT]: ...
+
+
+@overload
+def mutable(
+    *,
+    slots: bool = False,
+    weakref_slot: bool = False,
+) -> Callable[[type[AnyT]], type[AnyT]]: ...
+
+
 @dataclass_transform(
     eq_default=False,
     kw_only_default=True,
     frozen_default=False,
     field_specifiers=(field,),
 )
-def mutable(cls: type[AnyT]) -> type[AnyT]:
-    return dataclass(frozen=False, kw_only=True, eq=False)(cls)
+def mutable(
+    cls: type[Any] | None = None,
+    /,
+    *,
+    slots: bool = False,
+    weakref_slot: bool = False,
+) -> Any:
+    if cls is None:
+        return lambda x: _dataclass(x, False, slots, weakref_slot)
+    return _dataclass(cls, False, slots, weakref_slot)
+
+
+@overload
+def immutable(cls: type[AnyT], /) -> type[AnyT]: ...
+
+
+@overload
+def immutable(
+    *,
+    slots: bool = False,
+    weakref_slot: bool = False,
+) -> Callable[[type[AnyT]], type[AnyT]]: ...
 
 
 @dataclass_transform(
@@ -25,5 +113,13 @@ def mutable(cls: type[AnyT]) -> type[AnyT]:
     frozen_default=True,
     field_specifiers=(field,),
 )
-def immutable(cls: type[AnyT]) -> type[AnyT]:
-    return dataclass(frozen=True, kw_only=True, eq=False)(cls)
+def immutable(
+    cls: type[Any] | None = None,
+    /,
+    *,
+    slots: bool = False,
+    weakref_slot: bool = False,
+) -> Any:
+    if cls is None:
+        return lambda x: _dataclass(x, True, slots, weakref_slot)
+    return _dataclass(cls, True, slots, weakref_slot)
@@ -0,0 +1,115 @@
+import importlib
+import sys
+from functools import reduce
+from operator import or_
+from types import NoneType, UnionType
+from typing import Any, Mapping, TypeAlias, get_args, get_origin
+
+from spakky.core.error import AbstractSpakkyCoreError
+
+Reference: TypeAlias = list[Any]
+
+LOCALS = "<locals>"
+NONE = "none"
+NONE_TYPE = "none_type"
+STRING = "str"
+LIST = "list"
+OBJECT = "object"
+GENERIC = "generic"
+
+
+class CannotReferenceObjectError(AbstractSpakkyCoreError):
+    message = "Object cannot be referenced by its import path"
+
+
+class CannotResolveReferenceError(AbstractSpakkyCoreError):
+    message = "Reference cannot be resolved to an object"
+
+
+def get_reference_key(obj: Any) -> str:
+    return f"{obj.__module__}:{obj.__qualname__}"
+
+
+def resolve_path(module: str, qualname: str) -> Any:
+    if module not in sys.modules:
+        importlib.import_module(module)
+    resolved: Any = sys.modules[module]
+    for part in qualname.split("."):
+        resolved = getattr(resolved, part)
+    return resolved
+
+
+def _to_reference(obj: Any) -> Reference:
+    if obj is None:
+        return [NONE]
+    if obj is NoneType:
+        return [NONE_TYPE]
+    if isinstance(obj, str):
+        return [STRING, obj]
+    if isinstance(obj, list):
+        return [LIST, [_to_reference(x) for x in obj]]
+    origin = get_origin(obj)
+    if origin is not None and origin is not obj:
+        return [
+            GENERIC,
+            _to_reference(origin),
+            [_to_reference(x) for x in get_args(obj)],
+        ]
+    module: str | None = getattr(obj, "__module__", None)
+    name: str | None = getattr(obj, "__qualname__", None) or getattr(
+        obj, "__name__", None
+    )
+    if module is None or name is None or LOCALS in name:
+        raise CannotReferenceObjectError(obj)
+    try:
+        resolved: Any = resolve_path(module, name)
+    except (ImportError, AttributeError) as e:
+        raise CannotReferenceObjectError(obj) from e
+    if resolved is not obj:
+        raise CannotReferenceObjectError(obj)
+    return [OBJECT, module, name]
+
+
+def to_reference(obj: Any) -> Reference:
+    reference: Reference = _to_reference(obj)
+    try:
+        # Guarantee that the reference round-trips to an equal object,
+        # so consumers can trust it without introspecting the original again
+        if from_reference(reference) != obj:
+            raise CannotReferenceObjectError(obj)
+    except CannotResolveReferenceError as e:  # pragma: no cover
+        raise CannotReferenceObjectError(obj) from e
+    return reference
+
+
+def from_reference(
+    reference: Reference,
+    scope: Mapping[str, Any] | None = None,
+) -> Any:
+    match reference:
+        case [str(kind)] if kind == NONE:
+            return None
+        case [str(kind)] if kind == NONE_TYPE:
+            return NoneType
+        case [str(kind), str(value)] if kind == STRING:
+            return value
+        case [str(kind), list(items)] if kind == LIST:
+            return [from_reference(x, scope) for x in items]
+        case [str(kind), origin, list(args)] if kind == GENERIC:
+            resolved_origin: Any = from_reference(origin, scope)
+            resolved_args: tuple[Any, ...] = tuple(
+                from_reference(x, scope) for x in args
+            )
+            if resolved_origin is UnionType:
+                return reduce(or_, resolved_args)
+            return resolved_origin[resolved_args]
+        case [str(kind), str(module), str(name)] if kind == OBJECT:
+            key: str = f"{module}:{name}"
+            if scope is not None and key in scope:
+                return scope[key]
+            try:
+                return resolve_path(module, name)
+            except (ImportError, AttributeError) as e:
+                raise CannotResolveReferenceError(reference) from e
+        case _:
+            raise CannotResolveReferenceError(reference)
@@ -1,7 +1,6 @@
 from abc import ABC
-from copy import deepcopy
 from dataclasses import field
-from typing import Any, Generic, Sequence, TypeVar
+from typing import Any, Generic, TypeVar
 
 from spakky.core.interfaces.equatable import EquatableT
 from spakky.core.mutability import mutable
@@ -16,8 +15,14 @@ class AbstractAggregateRoot(AbstractEntity[EquatableT], Generic[EquatableT], ABC
     )
 
     @property
-    def events(self) -> Sequence[AbstractIntegrationEvent]:
-        return deepcopy(self.__events)
+    def events(self) -> tuple[AbstractIntegrationEvent, ...]:
+        # Events are immutable, a tuple snapshot is enough to protect the list
+        return tuple(self.__events)
+
+    def pull_events(self) -> tuple[AbstractIntegrationEvent, ...]:
+        events: list[AbstractIntegrationEvent] = self.__events
+        self.__events = []
+        return tuple(events)
 
     def add_event(self, event: AbstractIntegrationEvent) -> None:
         self.__events.append(event)
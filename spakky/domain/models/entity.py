@@ -1,8 +1,9 @@
 import sys
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from dataclasses import field
 from datetime import datetime, timedelta
-from typing import Any, Generic
+from typing import Any, Generic, Iterable, Iterator
 from uuid import UUID, uuid4
 
 from spakky.core.interfaces.equatable import EquatableT, IEquatable
@@ -16,6 +17,11 @@ else:  # pragma: no cover
 
     UTC = timezone(offset=timedelta(hours=0), name="UTC")
 
+if sys.version_info >= (3, 11):
+    from typing import Self  # pragma: no cover
+else:
+    from typing_extensions import Self  # pragma: no cover
+
 
 class CannotMonkeyPatchEntityError(AbstractSpakkyDomainError):
     message = "Cannot monkey patch an entity."
@@ -24,6 +30,9 @@ class CannotMonkeyPatchEntityError(AbstractSpakkyDomainError):
 @mutable
 class AbstractEntity(IEquatable, Generic[EquatableT], ABC):
     __initialized: bool = field(init=False, repr=False, default=False)
+    __batch: dict[str, Any] | None = field(init=False, repr=False, default=None)
+    __dirty: set[str] = field(init=False, repr=False, default_factory=set[str])
+    __persisted_version: UUID | None = field(init=False, repr=False, default=None)
 
     uid: EquatableT
     version: UUID = field(default_factory=uuid4)
@@ -45,6 +54,59 @@ class AbstractEntity(IEquatable, Generic[EquatableT], ABC):
     def __hash__(self) -> int:
         return hash(self.uid)
 
+    @property
+    def dirty_fields(self) -> frozenset[str]:
+        return frozenset(self.__dirty)
+
+    @property
+    def is_dirty(self) -> bool:
+        return bool(self.__dirty)
+
+    @property
+    def persisted_version(self) -> UUID | None:
+        return self.__persisted_version
+
+    def mark_clean(self) -> None:
+        # Called by repositories once the entity is loaded or saved
+        self.__dirty = set()
+        self.__persisted_version = self.version
+
+    def __mark_dirty(self, names: Iterable[str]) -> None:
+        changed: set[str] = set(names)
+        if not changed:
+            return
+        if not self.__dirty and "version" not in changed:
+            # One new version per unit of change, compared on save
+            super().__setattr__("version", uuid4())
+            changed.add("version")
+        self.__dirty.update(changed)
+
+    @contextmanager
+    def batch_update(self) -> Iterator[Self]:
+        if self.__batch is not None:
+            # Nested batches are part of the outermost one
+            yield self
+            return
+        batch: dict[str, Any] = {}
+        self.__batch = batch
+        try:
+            yield self
+            self.validate()
+        except:
+            for name, old in batch.items():
+                super().__setattr__(name, old)
+            raise
+        finally:
+            self.__batch = None
+        self.__mark_dirty(
+            name for name, old in batch.items() if getattr(self, name) != old
+        )
+
+    def update(self, **changes: Any) -> None:
+        with self.batch_update():
+            for name, value in changes.items():
+                setattr(self, name, value)
+
     def __post_init__(self) -> None:
         self.validate()
         self.__initialized = True
@@ -52,11 +114,20 @@ class AbstractEntity(IEquatable, Generic[EquatableT], ABC):
     def __setattr__(self, __name: str, __value: Any) -> None:
         if __name not in self.__dataclass_fields__:
             raise CannotMonkeyPatchEntityError
+        if not self.__initialized or not self.__dataclass_fields__[__name].init:
+            # Internal state is neither validated nor tracked
+            super().__setattr__(__name, __value)
+            return
         __old: Any | None = getattr(self, __name, None)
         super().__setattr__(__name, __value)
-        if self.__initialized:
-            try:
-                self.validate()
-            except:
-                super().__setattr__(__name, __old)
-                raise
+        if self.__batch is not None:
+            # Validated once when the batch ends, keeping the value from before it
+            self.__batch.setdefault(__name, __old)
+            return
+        try:
+            self.validate()
+        except:
+            super().__setattr__(__name, __old)
+            raise
+        if __old != __value:
+            self.__mark_dirty((__name,))
@@ -16,7 +16,7 @@ else:
     from typing_extensions import Self  # pragma: no cover
 
 
-@immutable
+@immutable(slots=True)
 class AbstractDomainEvent(IEquatable, IComparable, ICloneable, ABC):
     event_id: UUID = field(default_factory=uuid4)
     timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
@@ -49,5 +49,5 @@ class AbstractDomainEvent(IEquatable, IComparable, ICloneable, ABC):
         return self.timestamp >= __value.timestamp
 
 
-@immutable
+@immutable(slots=True)
 class AbstractIntegrationEvent(AbstractDomainEvent, ABC): ...
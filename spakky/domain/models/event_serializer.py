@@ -0,0 +1,591 @@
+import json
+import sys
+from base64 import b64decode, b64encode
+from dataclasses import dataclass, fields, is_dataclass
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from enum import Enum
+from struct import Struct
+from threading import Lock
+from types import NoneType, UnionType
+from typing import (
+    Any,
+    Callable,
+    ForwardRef,
+    Generic,
+    Iterable,
+    Mapping,
+    TypeAlias,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+from uuid import UUID
+
+from spakky.core.reference import get_reference_key, resolve_path
+from spakky.domain.error import AbstractSpakkyDomainError
+from spakky.domain.models.event import AbstractDomainEvent
+
+BINARY_FORMAT = 1
+
+DomainEventT = TypeVar("DomainEventT", bound=AbstractDomainEvent)
+
+Upcaster: TypeAlias = Callable[[dict[str, Any]], dict[str, Any]]
+BinaryEncoder: TypeAlias = Callable[[Any, bytearray], None]
+BinaryDecoder: TypeAlias = Callable[["_Reader"], Any]
+JsonEncoder: TypeAlias = Callable[[Any], Any]
+JsonDecoder: TypeAlias = Callable[[Any], Any]
+
+_DOUBLE = Struct("<d")
+_EPOCH = datetime(1970, 1, 1)
+_AWARE_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class UnsupportedEventFieldTypeError(AbstractSpakkyDomainError):
+    message = "Event field type cannot be serialized"
+
+
+class UnknownEventTypeError(AbstractSpakkyDomainError):
+    message = "Event type is not registered in serializer registry"
+
+
+class EventSchemaVersionError(AbstractSpakkyDomainError):
+    message = "Serialized event schema version cannot be upcasted"
+
+
+class InvalidSerializedEventError(AbstractSpakkyDomainError):
+    message = "Serialized event is malformed"
+
+
+class _Reader:
+    __slots__ = ("data", "offset")
+
+    data: memoryview
+    offset: int
+
+    def __init__(self, data: bytes) -> None:
+        self.data = memoryview(data)
+        self.offset = 0
+
+    def read(self, size: int) -> memoryview:
+        end: int = self.offset + size
+        if end > len(self.data):
+            raise InvalidSerializedEventError
+        chunk: memoryview = self.data[self.offset : end]
+        self.offset = end
+        return chunk
+
+    def byte(self) -> int:
+        if self.offset >= len(self.data):
+            raise InvalidSerializedEventError
+        value: int = self.data[self.offset]
+        self.offset += 1
+        return value
+
+    def varint(self) -> int:
+        result: int = 0
+        shift: int = 0
+        while True:
+            byte: int = self.byte()
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+
+def _write_varint(value: int, out: bytearray) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _write_int(value: int, out: bytearray) -> None:
+    # Zigzag keeps small negative numbers small
+    _write_varint(value << 1 if value >= 0 else ((-value) << 1) - 1, out)
+
+
+def _read_int(reader: _Reader) -> int:
+    value: int = reader.varint()
+    return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+
+def _write_bytes(value: bytes, out: bytearray) -> None:
+    _write_varint(len(value), out)
+    out += value
+
+
+def _read_bytes(reader: _Reader) -> bytes:
+    return bytes(reader.read(reader.varint()))
+
+
+def _write_str(value: str, out: bytearray) -> None:
+    _write_bytes(value.encode(), out)
+
+
+def _read_str(reader: _Reader) -> str:
+    return str(reader.read(reader.varint()), "utf-8")
+
+
+def _write_datetime(value: datetime, out: bytearray) -> None:
+    offset: timedelta | None = value.utcoffset()
+    if offset is None:
+        out.append(0)
+        _write_int((value - _EPOCH) // timedelta(microseconds=1), out)
+        return
+    out.append(1)
+    _write_int((value - _AWARE_EPOCH) // timedelta(microseconds=1), out)
+    _write_int(offset // timedelta(seconds=1), out)
+
+
+def _read_datetime(reader: _Reader) -> datetime:
+    if reader.byte() == 0:
+        return _EPOCH + timedelta(microseconds=_read_int(reader))
+    value: datetime = _AWARE_EPOCH + timedelta(microseconds=_read_int(reader))
+    return value.astimezone(timezone(timedelta(seconds=_read_int(reader))))
+
+
+@dataclass(frozen=True, slots=True)
+class _Codec:
+    encode: BinaryEncoder
+    decode: BinaryDecoder
+    to_json: JsonEncoder
+    from_json: JsonDecoder
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+_SCALARS: dict[type, _Codec] = {
+    bool: _Codec(
+        lambda value, out: out.append(1 if value else 0),
+        lambda reader: reader.byte() != 0,
+        _identity,
+        bool,
+    ),
+    int: _Codec(_write_int, _read_int, _identity, int),
+    float: _Codec(
+        lambda value, out: out.extend(_DOUBLE.pack(value)),
+        lambda reader: _DOUBLE.unpack(reader.read(_DOUBLE.size))[0],
+        _identity,
+        float,
+    ),
+    str: _Codec(_write_str, _read_str, _identity, str),
+    bytes: _Codec(
+        _write_bytes,
+        _read_bytes,
+        lambda value: b64encode(value).decode(),
+        b64decode,
+    ),
+    UUID: _Codec(
+        lambda value, out: out.extend(value.bytes),
+        lambda reader: UUID(bytes=bytes(reader.read(16))),
+        str,
+        UUID,
+    ),
+    datetime: _Codec(
+        _write_datetime,
+        _read_datetime,
+        datetime.isoformat,
+        datetime.fromisoformat,
+    ),
+    date: _Codec(
+        lambda value, out: _write_varint(value.toordinal(), out),
+        lambda reader: date.fromordinal(reader.varint()),
+        date.isoformat,
+        date.fromisoformat,
+    ),
+    Decimal: _Codec(
+        lambda value, out: _write_str(str(value), out),
+        lambda reader: Decimal(_read_str(reader)),
+        str,
+        Decimal,
+    ),
+}
+
+
+class _DataclassCodec:
+    __slots__ = ("type_", "names", "codecs")
+
+    type_: type
+    names: tuple[str, ...]
+    codecs: tuple[_Codec, ...]
+
+    def __init__(self, type_: type) -> None:
+        self.type_ = type_
+        self.names = ()
+        self.codecs = ()
+
+    def compile(self, compiler: "Callable[[Any, type], _Codec]") -> None:
+        hints: dict[str, Any] = get_type_hints(self.type_)
+        # Fields excluded from __init__ are derived state and never serialized
+        targets = [field for field in fields(self.type_) if field.init]
+        self.names = tuple(field.name for field in targets)
+        self.codecs = tuple(
+            compiler(hints[field.name], self.type_) for field in targets
+        )
+
+    def encode(self, value: Any, out: bytearray) -> None:
+        _write_varint(len(self.names), out)
+        for name, codec in zip(self.names, self.codecs):
+            codec.encode(getattr(value, name), out)
+
+    def decode_fields(self, reader: _Reader) -> dict[str, Any]:
+        # Fields are positional, a payload only matches the layout it was written with
+        if reader.varint() != len(self.names):
+            raise InvalidSerializedEventError
+        return {
+            name: codec.decode(reader) for name, codec in zip(self.names, self.codecs)
+        }
+
+    def decode(self, reader: _Reader) -> Any:
+        return self.type_(**self.decode_fields(reader))
+
+    def to_json(self, value: Any) -> dict[str, Any]:
+        return {
+            name: codec.to_json(getattr(value, name))
+            for name, codec in zip(self.names, self.codecs)
+        }
+
+    def fields_from_json(self, value: Mapping[str, Any]) -> dict[str, Any]:
+        return {
+            name: codec.from_json(value[name])
+            for name, codec in zip(self.names, self.codecs)
+            if name in value
+        }
+
+    def from_json(self, value: Mapping[str, Any]) -> Any:
+        return self.type_(**self.fields_from_json(value))
+
+    def as_codec(self) -> _Codec:
+        return _Codec(self.encode, self.decode, self.to_json, self.from_json)
+
+
+class _CodecCompiler:
+    __dataclasses: dict[type, _DataclassCodec]
+    __lock: Lock
+
+    def __init__(self) -> None:
+        self.__dataclasses = {}
+        self.__lock = Lock()
+
+    def dataclass_codec(self, type_: type) -> _DataclassCodec:
+        with self.__lock:
+            return self.__dataclass_codec(type_)
+
+    def __dataclass_codec(self, type_: type) -> _DataclassCodec:
+        if (codec := self.__dataclasses.get(type_)) is not None:
+            return codec
+        codec = _DataclassCodec(type_)
+        # Cached before compiling its fields, so recursive types terminate
+        self.__dataclasses[type_] = codec
+        try:
+            codec.compile(self.__compile)
+        except:
+            del self.__dataclasses[type_]
+            raise
+        return codec
+
+    def __compile(self, type_: Any, owner: type) -> _Codec:
+        if isinstance(type_, str):
+            type_ = ForwardRef(type_)
+        if isinstance(type_, ForwardRef):
+            # Python 3.10 leaves string arguments of builtin generics unresolved
+            return self.__compile(self.__resolve(type_, owner), owner)
+        if type_ in _SCALARS:
+            return _SCALARS[type_]
+        origin: Any = get_origin(type_)
+        args: tuple[Any, ...] = get_args(type_)
+        if origin in (Union, UnionType):
+            values: list[Any] = [arg for arg in args if arg is not NoneType]
+            if len(values) != 1 or len(args) != 2:
+                raise UnsupportedEventFieldTypeError(type_)
+            return self.__optional(self.__compile(values[0], owner))
+        if origin in (list, set, frozenset) and len(args) == 1:
+            return self.__sequence(origin, self.__compile(args[0], owner))
+        if origin is tuple:
+            if len(args) == 2 and args[1] is Ellipsis:
+                return self.__sequence(tuple, self.__compile(args[0], owner))
+            return self.__tuple(tuple(self.__compile(arg, owner) for arg in args))
+        if origin is dict and len(args) == 2:
+            return self.__mapping(
+                self.__compile(args[0], owner), self.__compile(args[1], owner)
+            )
+        if isinstance(type_, type) and issubclass(type_, Enum):
+            return self.__enum(type_)
+        if isinstance(type_, type) and is_dataclass(type_):
+            return self.__dataclass_codec(type_).as_codec()
+        raise UnsupportedEventFieldTypeError(type_)
+
+    @staticmethod
+    def __resolve(reference: ForwardRef, owner: type) -> Any:
+        module: Any = sys.modules.get(owner.__module__)
+        try:
+            return eval(
+                reference.__forward_arg__,
+                vars(module) if module is not None else {},
+                {owner.__name__: owner},
+            )
+        except NameError as e:
+            raise UnsupportedEventFieldTypeError(reference) from e
+
+    @staticmethod
+    def __optional(codec: _Codec) -> _Codec:
+        def encode(value: Any, out: bytearray) -> None:
+            if value is None:
+                out.append(0)
+                return
+            out.append(1)
+            codec.encode(value, out)
+
+        return _Codec(
+            encode,
+            lambda reader: None if reader.byte() == 0 else codec.decode(reader),
+            lambda value: None if value is None else codec.to_json(value),
+            lambda value: None if value is None else codec.from_json(value),
+        )
+
+    @staticmethod
+    def __sequence(container: type, codec: _Codec) -> _Codec:
+        def encode(value: Any, out: bytearray) -> None:
+            _write_varint(len(value), out)
+            for item in value:
+                codec.encode(item, out)
+
+        return _Codec(
+            encode,
+            lambda reader: container(
+                codec.decode(reader) for _ in range(reader.varint())
+            ),
+            lambda value: [codec.to_json(item) for item in value],
+            lambda value: container(codec.from_json(item) for item in value),
+        )
+
+    @staticmethod
+    def __tuple(codecs: tuple[_Codec, ...]) -> _Codec:
+        def encode(value: Any, out: bytearray) -> None:
+            for item, codec in zip(value, codecs):
+                codec.encode(item, out)
+
+        return _Codec(
+            encode,
+            lambda reader: tuple(codec.decode(reader) for codec in codecs),
+            lambda value: [codec.to_json(item) for item, codec in zip(value, codecs)],
+            lambda value: tuple(
+                codec.from_json(item) for item, codec in zip(value, codecs)
+            ),
+        )
+
+    @staticmethod
+    def __mapping(keys: _Codec, values: _Codec) -> _Codec:
+        def encode(value: Any, out: bytearray) -> None:
+            _write_varint(len(value), out)
+            for key, item in value.items():
+                keys.encode(key, out)
+                values.encode(item, out)
+
+        def decode(reader: _Reader) -> dict[Any, Any]:
+            return {
+                keys.decode(reader): values.decode(reader)
+                for _ in range(reader.varint())
+            }
+
+        return _Codec(
+            encode,
+            decode,
+            # JSON object keys are always strings
+            lambda value: {
+                str(keys.to_json(key)): values.to_json(item)
+                for key, item in value.items()
+            },
+            lambda value: {
+                keys.from_json(key): values.from_json(item)
+                for key, item in value.items()
+            },
+        )
+
+    @staticmethod
+    def __enum(type_: type[Enum]) -> _Codec:
+        return _Codec(
+            lambda value, out: _write_str(value.name, out),
+            lambda reader: type_[_read_str(reader)],
+            lambda value: value.name,
+            lambda value: type_[value],
+        )
+
+
+class EventSerializer(Generic[DomainEventT]):
+    __event_type: type[DomainEventT]
+    __name: str
+    __version: int
+    __upcasters: dict[int, Upcaster]
+    __codec: _DataclassCodec
+    __layouts: dict[int, _DataclassCodec]
+
+    def __init__(
+        self,
+        event_type: type[DomainEventT],
+        name: str,
+        version: int,
+        upcasters: Mapping[int, Upcaster],
+        codec: _DataclassCodec,
+        layouts: Mapping[int, _DataclassCodec],
+    ) -> None:
+        self.__event_type = event_type
+        self.__name = name
+        self.__version = version
+        self.__upcasters = dict(upcasters)
+        self.__codec = codec
+        self.__layouts = dict(layouts)
+
+    @property
+    def event_type(self) -> type[DomainEventT]:
+        return self.__event_type
+
+    @property
+    def name(self) -> str:
+        return self.__name
+
+    @property
+    def version(self) -> int:
+        return self.__version
+
+    def __layout(self, version: int) -> _DataclassCodec:
+        if version == self.__version:
+            return self.__codec
+        # Older payloads are read with the fields they were written with
+        if version not in self.__layouts:
+            raise EventSchemaVersionError(self.__name, version)
+        return self.__layouts[version]
+
+    def __upcast(self, version: int, data: dict[str, Any]) -> dict[str, Any]:
+        while version < self.__version:
+            if version not in self.__upcasters:
+                raise EventSchemaVersionError(self.__name, version)
+            data = self.__upcasters[version](data)
+            version += 1
+        return data
+
+    def encode(self, event: DomainEventT, out: bytearray) -> None:
+        _write_varint(self.__version, out)
+        self.__codec.encode(event, out)
+
+    def decode(self, reader: _Reader) -> DomainEventT:
+        version: int = reader.varint()
+        data: dict[str, Any] = self.__layout(version).decode_fields(reader)
+        return self.__event_type(**self.__upcast(version, data))
+
+    def to_json(self, event: DomainEventT) -> dict[str, Any]:
+        return {
+            "type": self.__name,
+            "version": self.__version,
+            "data": self.__codec.to_json(event),
+        }
+
+    def from_json(self, value: Mapping[str, Any]) -> DomainEventT:
+        version: int = value["version"]
+        data: dict[str, Any] = self.__layout(version).fields_from_json(value["data"])
+        return self.__event_type(**self.__upcast(version, data))
+
+
+class EventSerializerRegistry:
+    __compiler: _CodecCompiler
+    __by_type: dict[type, EventSerializer[Any]]
+    __by_name: dict[str, EventSerializer[Any]]
+    __allowed_modules: tuple[str, ...]
+    __lock: Lock
+
+    def __init__(self, allowed_modules: Iterable[str] = ()) -> None:
+        self.__compiler = _CodecCompiler()
+        self.__by_type = {}
+        self.__by_name = {}
+        self.__allowed_modules = tuple(allowed_modules)
+        self.__lock = Lock()
+
+    def register(
+        self,
+        event_type: type[DomainEventT],
+        name: str | None = None,
+        version: int = 1,
+        upcasters: Mapping[int, Upcaster] | None = None,
+        layouts: Mapping[int, type] | None = None,
+    ) -> EventSerializer[DomainEventT]:
+        if version < 1:
+            raise ValueError("version must be at least 1")
+        layouts = layouts or {}
+        if any(not 1 <= old < version for old in layouts):
+            raise ValueError("layouts must describe versions older than the current")
+        for layout in layouts.values():
+            if not isinstance(layout, type) or not is_dataclass(layout):
+                raise UnsupportedEventFieldTypeError(layout)
+        # Encoders are generated here once, never per serialized event
+        serializer: EventSerializer[DomainEventT] = EventSerializer(
+            event_type,
+            name or get_reference_key(event_type),
+            version,
+            upcasters or {},
+            self.__compiler.dataclass_codec(event_type),
+            {
+                old: self.__compiler.dataclass_codec(layout)
+                for old, layout in layouts.items()
+            },
+        )
+        with self.__lock:
+            self.__by_type[event_type] = serializer
+            self.__by_name[serializer.name] = serializer
+        return serializer
+
+    def get(self, event_type: type[DomainEventT]) -> EventSerializer[DomainEventT]:
+        if (serializer := self.__by_type.get(event_type)) is not None:
+            return serializer
+        return self.register(event_type)
+
+    def get_by_name(self, name: str) -> EventSerializer[Any]:
+        if (serializer := self.__by_name.get(name)) is not None:
+            return serializer
+        module, _, qualname = name.partition(":")
+        # Payload names are untrusted, only allowlisted modules are ever imported
+        if not any(
+            module == allowed or module.startswith(f"{allowed}.")
+            for allowed in self.__allowed_modules
+        ):
+            raise UnknownEventTypeError(name)
+        try:
+            event_type: Any = resolve_path(module, qualname)
+        except (ImportError, AttributeError, ValueError) as e:
+            raise UnknownEventTypeError(name) from e
+        if not isinstance(event_type, type) or not issubclass(
+            event_type, AbstractDomainEvent
+        ):
+            raise UnknownEventTypeError(name)
+        return self.register(event_type)
+
+    def serialize(self, event: AbstractDomainEvent) -> bytes:
+        serializer: EventSerializer[Any] = self.get(type(event))
+        out = bytearray((BINARY_FORMAT,))
+        _write_str(serializer.name, out)
+        serializer.encode(event, out)
+        return bytes(out)
+
+    def deserialize(self, data: bytes) -> AbstractDomainEvent:
+        reader = _Reader(data)
+        if reader.byte() != BINARY_FORMAT:
+            raise InvalidSerializedEventError
+        event: AbstractDomainEvent = self.get_by_name(_read_str(reader)).decode(reader)
+        if reader.offset != len(reader.data):
+            raise InvalidSerializedEventError
+        return event
+
+    def serialize_json(self, event: AbstractDomainEvent) -> str:
+        return json.dumps(
+            self.get(type(event)).to_json(event),
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )
+
+    def deserialize_json(self, data: str | bytes) -> AbstractDomainEvent:
+        value: dict[str, Any] = json.loads(data)
+        return self.get_by_name(value["type"]).from_json(value)
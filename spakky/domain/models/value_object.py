@@ -2,9 +2,13 @@ import sys
 from abc import ABC, abstractmethod
 from collections.abc import Hashable
 from copy import deepcopy
-from dataclasses import astuple
-from functools import reduce
+from dataclasses import dataclass, fields
+from operator import attrgetter
+from threading import Lock
+from typing import Any, Callable, Protocol
+from weakref import WeakKeyDictionary, WeakValueDictionary
 
+from spakky.core.annotation import ClassAnnotation
 from spakky.core.interfaces.cloneable import ICloneable
 from spakky.core.interfaces.equatable import IEquatable
 from spakky.core.mutability import immutable
@@ -14,9 +18,95 @@ if sys.version_info >= (3, 11):
 else:
     from typing_extensions import Self  # pragma: no cover
 
+_value_getters: "WeakKeyDictionary[type, Callable[[Any], tuple[Any, ...]]]" = (
+    WeakKeyDictionary()
+)
+
+
+def _get_values(obj: Any) -> tuple[Any, ...]:
+    cls: type = type(obj)
+    if (getter := _value_getters.get(cls)) is None:
+        names: list[str] = [x.name for x in fields(cls) if x.compare]
+        if len(names) == 1:
+            single: attrgetter[Any] = attrgetter(names[0])
+            getter = lambda x: (single(x),)  # noqa: E731
+        else:
+            getter = attrgetter(*names) if names else lambda _: ()
+        _value_getters[cls] = getter
+    return getter(obj)
+
+
+def _return_self(self: Any, *_: Any) -> Any:
+    return self
+
+
+@dataclass
+class Interned(ClassAnnotation):
+    def __call__(self, obj: type[Any]) -> type[Any]:
+        if not obj.__weakrefoffset__:
+            raise TypeError(
+                f"{obj.__name__} must support weak references to be interned, "
+                "use weakref_slot=True with slots=True"
+            )
+        # Copies of a canonical instance are the instance itself
+        setattr(obj, "__copy__", _return_self)
+        setattr(obj, "__deepcopy__", _return_self)
+        return super().__call__(obj)
+
+
+class _InternPool:
+    __by_arguments: "WeakValueDictionary[Hashable, Any]"
+    __by_values: "WeakValueDictionary[Hashable, Any]"
+    __lock: Lock
+
+    def __init__(self) -> None:
+        self.__by_arguments = WeakValueDictionary()
+        self.__by_values = WeakValueDictionary()
+        self.__lock = Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        return self.__by_arguments.get(key)
+
+    def put(self, key: Hashable, instance: Any) -> Any:
+        values: tuple[Any, ...] = _get_values(instance)
+        # Types are part of the key, so 1, 1.0 and True stay distinct values
+        value_key: Hashable = (values, tuple(type(x) for x in values))
+        with self.__lock:
+            canonical: Any = self.__by_values.setdefault(value_key, instance)
+            self.__by_arguments[key] = canonical
+        return canonical
+
+
+_intern_pools: "WeakKeyDictionary[type, _InternPool | None]" = WeakKeyDictionary()
+
+
+class _ValueObjectMeta(type(Protocol)):  # type: ignore
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        if (pool := _intern_pools.get(cls, False)) is False:
+            pool = _InternPool() if Interned.exists(cls) else None
+            _intern_pools[cls] = pool
+        if pool is None:
+            return super().__call__(*args, **kwargs)
+        key: Hashable = (
+            tuple((type(x), x) for x in args),
+            tuple((name, type(x), x) for name, x in kwargs.items()),
+        )
+        try:
+            if (instance := pool.get(key)) is not None:
+                # Known values were validated when first constructed
+                return instance
+        except TypeError:
+            # Unhashable arguments are never interned
+            return super().__call__(*args, **kwargs)
+        return pool.put(key, super().__call__(*args, **kwargs))
+
 
 @immutable
-class AbstractValueObject(IEquatable, ICloneable, ABC):
+class AbstractValueObject(IEquatable, ICloneable, ABC, metaclass=_ValueObjectMeta):
+    # Immutable, so the hash is computed once and kept with the instance.
+    # A plain slot rather than a field, so fields() and asdict() never see it
+    __slots__ = ("__hash",)
+
     def clone(self) -> Self:
         return deepcopy(self)
 
@@ -24,16 +114,22 @@ class AbstractValueObject(IEquatable, ICloneable, ABC):
     def validate(self) -> None: ...
 
     def __eq__(self, __value: object) -> bool:
+        if self is __value:
+            return True
         if not isinstance(__value, type(self)):
             return False
-        return astuple(self) == astuple(__value)
+        # Shallow field tuples, nested values compare with their own __eq__
+        return _get_values(self) == _get_values(__value)
 
     def __hash__(self) -> int:
-        return reduce(
-            lambda x, y: x ^ y,
-            (hash(x) for x in astuple(self) if isinstance(x, Hashable)),
-            0,
-        )
+        try:
+            return self.__hash
+        except AttributeError:
+            value: int = hash(
+                tuple(x for x in _get_values(self) if isinstance(x, Hashable))
+            )
+            object.__setattr__(self, "_AbstractValueObject__hash", value)
+            return value
 
     def __post_init__(self) -> None:
         self.validate()
@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import Protocol, runtime_checkable
+from typing import Protocol, Sequence, runtime_checkable
 
 from spakky.domain.models.event import AbstractDomainEvent
 
@@ -14,3 +14,37 @@ class IEventPublisher(Protocol):
 class IAsyncEventPublisher(Protocol):
     @abstractmethod
     async def publish(self, event: AbstractDomainEvent) -> None: ...
+
+
+@runtime_checkable
+class IBatchEventPublisher(IEventPublisher, Protocol):
+    @abstractmethod
+    def publish_all(self, events: Sequence[AbstractDomainEvent]) -> None: ...
+
+
+@runtime_checkable
+class IAsyncBatchEventPublisher(IAsyncEventPublisher, Protocol):
+    @abstractmethod
+    async def publish_all(self, events: Sequence[AbstractDomainEvent]) -> None: ...
+
+
+def publish_all(
+    publisher: IEventPublisher, events: Sequence[AbstractDomainEvent]
+) -> None:
+    if isinstance(publisher, IBatchEventPublisher):
+        publisher.publish_all(events)
+        return
+    # Publishers that cannot batch get one call per event
+    for event in events:
+        publisher.publish(event)
+
+
+async def publish_all_async(
+    publisher: IAsyncEventPublisher, events: Sequence[AbstractDomainEvent]
+) -> None:
+    if isinstance(publisher, IAsyncBatchEventPublisher):
+        await publisher.publish_all(events)
+        return
+    # Publishers that cannot batch get one call per event
+    for event in events:
+        await publisher.publish(event)
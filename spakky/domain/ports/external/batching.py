@@ -0,0 +1,116 @@
+from asyncio import AbstractEventLoop, Future, Task, get_running_loop, shield
+from typing import Any, Generic, Sequence, TypeVar
+
+from spakky.core.interfaces.context_bound import IContextBound
+from spakky.core.interfaces.equatable import IEquatable
+from spakky.domain.ports.external.proxy import (
+    IAsyncGenericProxy,
+    ProxyModel,
+    ProxyModelNotFoundError,
+)
+from spakky.domain.ports.pagination import (
+    DEFAULT_CHUNK_SIZE,
+    check_chunk_size,
+    chunked,
+)
+
+ProxyIdT = TypeVar("ProxyIdT", bound=IEquatable)
+ProxyModelT = TypeVar("ProxyModelT", bound=ProxyModel[Any])
+
+
+class BatchingAsyncProxy(
+    IAsyncGenericProxy[ProxyModelT, ProxyIdT],
+    IContextBound,
+    Generic[ProxyModelT, ProxyIdT],
+):
+    __proxy: IAsyncGenericProxy[ProxyModelT, ProxyIdT]
+    __max_batch_size: int
+    __cache: dict[ProxyIdT, ProxyModelT | None]
+    __futures: dict[ProxyIdT, "Future[ProxyModelT | None]"]
+    __queue: list[ProxyIdT]
+    __tasks: set[Task[None]]
+
+    def __init__(
+        self,
+        proxy: IAsyncGenericProxy[ProxyModelT, ProxyIdT],
+        max_batch_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        check_chunk_size(max_batch_size)
+        self.__proxy = proxy
+        self.__max_batch_size = max_batch_size
+        self.__cache = {}
+        self.__futures = {}
+        self.__queue = []
+        self.__tasks = set()
+
+    def evict(self, *proxy_ids: ProxyIdT) -> None:
+        for proxy_id in proxy_ids:
+            self.__cache.pop(proxy_id, None)
+
+    def clear(self) -> None:
+        self.__cache.clear()
+
+    def __request(self, proxy_id: ProxyIdT) -> "Future[ProxyModelT | None]":
+        # Concurrent requests for one id share a single pending future
+        if (future := self.__futures.get(proxy_id)) is not None:
+            return future
+        loop: AbstractEventLoop = get_running_loop()
+        future = loop.create_future()
+        self.__futures[proxy_id] = future
+        self.__queue.append(proxy_id)
+        if len(self.__queue) == 1:
+            # Every id requested until the next loop iteration joins this batch
+            loop.call_soon(self.__dispatch)
+        return future
+
+    def __dispatch(self) -> None:
+        queue, self.__queue = self.__queue, []
+        for chunk in chunked(queue, self.__max_batch_size):
+            task: Task[None] = get_running_loop().create_task(self.__load(chunk))
+            self.__tasks.add(task)
+            task.add_done_callback(self.__tasks.discard)
+
+    async def __load(self, proxy_ids: list[ProxyIdT]) -> None:
+        try:
+            models: Sequence[ProxyModelT] = await self.__proxy.range(proxy_ids)
+        except BaseException as e:
+            # Failures are not cached, the next request for these ids retries
+            for proxy_id in proxy_ids:
+                future = self.__futures.pop(proxy_id)
+                if not future.done():
+                    future.set_exception(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+        found: dict[ProxyIdT, ProxyModelT] = {model.id: model for model in models}
+        for proxy_id in proxy_ids:
+            self.__cache[proxy_id] = found.get(proxy_id)
+            future = self.__futures.pop(proxy_id)
+            if not future.done():
+                future.set_result(self.__cache[proxy_id])
+
+    async def get(self, proxy_id: ProxyIdT) -> ProxyModelT:
+        model: ProxyModelT | None = await self.get_or_none(proxy_id)
+        if model is None:
+            raise ProxyModelNotFoundError(proxy_id)
+        return model
+
+    async def get_or_none(self, proxy_id: ProxyIdT) -> ProxyModelT | None:
+        if proxy_id in self.__cache:
+            return self.__cache[proxy_id]
+        # Shielded so a cancelled caller does not fail the others sharing the id
+        return await shield(self.__request(proxy_id))
+
+    async def contains(self, proxy_id: ProxyIdT) -> bool:
+        return await self.get_or_none(proxy_id) is not None
+
+    async def range(self, proxy_ids: Sequence[ProxyIdT]) -> Sequence[ProxyModelT]:
+        # Queue every miss before awaiting, so they all land in the same batch
+        for proxy_id in proxy_ids:
+            if proxy_id not in self.__cache:
+                self.__request(proxy_id)
+        models: list[ProxyModelT] = []
+        for proxy_id in proxy_ids:
+            if (model := await self.get_or_none(proxy_id)) is not None:
+                models.append(model)
+        return models
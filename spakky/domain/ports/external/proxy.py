@@ -1,12 +1,33 @@
 from abc import abstractmethod
-from typing import Any, Generic, Protocol, Sequence, TypeVar, runtime_checkable
+from typing import (
+    Any,
+    AsyncIterator,
+    Generic,
+    Iterable,
+    Iterator,
+    Protocol,
+    Sequence,
+    TypeVar,
+    runtime_checkable,
+)
 
 from spakky.core.interfaces.equatable import IEquatable
 from spakky.core.mutability import immutable
+from spakky.domain.ports.external.error import AbstractSpakkyExternalError
+from spakky.domain.ports.pagination import (
+    DEFAULT_CHUNK_SIZE,
+    Page,
+    aiter_chunks,
+    iter_chunks,
+)
 
 ProxyIdT_contra = TypeVar("ProxyIdT_contra", bound=IEquatable, contravariant=True)
 
 
+class ProxyModelNotFoundError(AbstractSpakkyExternalError):
+    message = "Proxy model not found by given id"
+
+
 @immutable
 class ProxyModel(IEquatable, Generic[ProxyIdT_contra]):
     id: ProxyIdT_contra
@@ -40,6 +61,37 @@ class IGenericProxy(Protocol[ProxyModelT_co, ProxyIdT_contra]):
     ) -> Sequence[ProxyModelT_co]: ...
 
 
+@runtime_checkable
+class IPageableProxy(
+    IGenericProxy[ProxyModelT_co, ProxyIdT_contra],
+    Protocol[ProxyModelT_co, ProxyIdT_contra],
+):
+    @abstractmethod
+    def page(
+        self,
+        after: ProxyIdT_contra | None = None,
+        limit: int = DEFAULT_CHUNK_SIZE,
+    ) -> Page[ProxyModelT_co, ProxyIdT_contra]: ...
+
+    def iter_range(
+        self,
+        proxy_ids: Iterable[ProxyIdT_contra],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[ProxyModelT_co]:
+        return iter_chunks(self.range, proxy_ids, chunk_size)
+
+    def iter_all(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[ProxyModelT_co]:
+        after: ProxyIdT_contra | None = None
+        while True:
+            page: Page[ProxyModelT_co, ProxyIdT_contra] = self.page(after, chunk_size)
+            yield from page.items
+            if page.next_cursor is None:
+                return
+            after = page.next_cursor
+
+
 @runtime_checkable
 class IAsyncGenericProxy(Protocol[ProxyModelT_co, ProxyIdT_contra]):
     @abstractmethod
@@ -55,3 +107,37 @@ class IAsyncGenericProxy(Protocol[ProxyModelT_co, ProxyIdT_contra]):
     async def range(
         self, proxy_ids: Sequence[ProxyIdT_contra]
     ) -> Sequence[ProxyModelT_co]: ...
+
+
+@runtime_checkable
+class IAsyncPageableProxy(
+    IAsyncGenericProxy[ProxyModelT_co, ProxyIdT_contra],
+    Protocol[ProxyModelT_co, ProxyIdT_contra],
+):
+    @abstractmethod
+    async def page(
+        self,
+        after: ProxyIdT_contra | None = None,
+        limit: int = DEFAULT_CHUNK_SIZE,
+    ) -> Page[ProxyModelT_co, ProxyIdT_contra]: ...
+
+    def iter_range(
+        self,
+        proxy_ids: Iterable[ProxyIdT_contra],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[ProxyModelT_co]:
+        return aiter_chunks(self.range, proxy_ids, chunk_size)
+
+    async def iter_all(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[ProxyModelT_co]:
+        after: ProxyIdT_contra | None = None
+        while True:
+            page: Page[ProxyModelT_co, ProxyIdT_contra] = await self.page(
+                after, chunk_size
+            )
+            for model in page.items:
+                yield model
+            if page.next_cursor is None:
+                return
+            after = page.next_cursor
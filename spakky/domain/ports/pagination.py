@@ -0,0 +1,62 @@
+from itertools import islice
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generic,
+    Iterable,
+    Iterator,
+    TypeVar,
+)
+
+from spakky.core.mutability import immutable
+
+DEFAULT_CHUNK_SIZE = 1000
+
+ItemT = TypeVar("ItemT")
+KeyT = TypeVar("KeyT")
+ItemT_co = TypeVar("ItemT_co", covariant=True)
+CursorT_co = TypeVar("CursorT_co", covariant=True)
+
+
+@immutable
+class Page(Generic[ItemT_co, CursorT_co]):
+    items: tuple[ItemT_co, ...]
+    # Keyset cursor, the key of the last item when more items may follow
+    next_cursor: CursorT_co | None = None
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+
+def check_chunk_size(chunk_size: int) -> None:
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be at least 1")
+
+
+def chunked(iterable: Iterable[ItemT], chunk_size: int) -> Iterator[list[ItemT]]:
+    check_chunk_size(chunk_size)
+    iterator: Iterator[ItemT] = iter(iterable)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def iter_chunks(
+    load: Callable[[list[KeyT]], Iterable[ItemT]],
+    keys: Iterable[KeyT],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[ItemT]:
+    # Keys are consumed lazily, only one chunk of items is alive at a time
+    for chunk in chunked(keys, chunk_size):
+        yield from load(chunk)
+
+
+async def aiter_chunks(
+    load: Callable[[list[KeyT]], Awaitable[Iterable[ItemT]]],
+    keys: Iterable[KeyT],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> AsyncIterator[ItemT]:
+    for chunk in chunked(keys, chunk_size):
+        for item in await load(chunk):
+            yield item
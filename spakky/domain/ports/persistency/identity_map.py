@@ -0,0 +1,327 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Generic, Iterable, Iterator, Sequence, TypeVar
+
+from spakky.core.interfaces.context_bound import IContextBound
+from spakky.core.interfaces.equatable import IEquatable
+from spakky.domain.models.aggregate_root import AggregateRootT
+from spakky.domain.ports.pagination import (
+    DEFAULT_CHUNK_SIZE,
+    Page,
+    check_chunk_size,
+    chunked,
+)
+from spakky.domain.ports.persistency.repository import (
+    EntityNotFoundError,
+    IAsyncPageableRepository,
+    IPageableRepository,
+)
+from spakky.domain.ports.persistency.transaction import (
+    AbstractAsyncTransaction,
+    AbstractTransaction,
+)
+
+AggregateIdT = TypeVar("AggregateIdT", bound=IEquatable)
+
+
+class _IdentityMap(Generic[AggregateRootT, AggregateIdT]):
+    __aggregates: dict[AggregateIdT, AggregateRootT]
+
+    def __init__(self) -> None:
+        self.__aggregates = {}
+
+    def __contains__(self, aggregate_id: AggregateIdT) -> bool:
+        return aggregate_id in self.__aggregates
+
+    def get(self, aggregate_id: AggregateIdT) -> AggregateRootT | None:
+        return self.__aggregates.get(aggregate_id)
+
+    def register(self, aggregate: AggregateRootT) -> AggregateRootT:
+        # The first instance loaded in a context wins, so every caller in that
+        # context observes the same object even when loads raced each other
+        return self.__aggregates.setdefault(aggregate.uid, aggregate)
+
+    def resolve(self, aggregate: AggregateRootT) -> AggregateRootT:
+        # Hands out the mapped instance without retaining unmapped ones
+        return self.__aggregates.get(aggregate.uid, aggregate)
+
+    def replace(self, aggregate: AggregateRootT) -> AggregateRootT:
+        self.__aggregates[aggregate.uid] = aggregate
+        return aggregate
+
+    def evict(self, aggregate_ids: Iterable[AggregateIdT]) -> None:
+        for aggregate_id in aggregate_ids:
+            self.__aggregates.pop(aggregate_id, None)
+
+    def clear(self) -> None:
+        self.__aggregates.clear()
+
+    def misses(self, aggregate_ids: Sequence[AggregateIdT]) -> list[AggregateIdT]:
+        # Deduplicated while keeping request order for the backing store
+        return [
+            aggregate_id
+            for aggregate_id in dict.fromkeys(aggregate_ids)
+            if aggregate_id not in self.__aggregates
+        ]
+
+    def collect(self, aggregate_ids: Sequence[AggregateIdT]) -> list[AggregateRootT]:
+        return [
+            self.__aggregates[aggregate_id]
+            for aggregate_id in aggregate_ids
+            if aggregate_id in self.__aggregates
+        ]
+
+
+class AbstractIdentityMapRepository(
+    IPageableRepository[AggregateRootT, AggregateIdT],
+    IContextBound,
+    Generic[AggregateRootT, AggregateIdT],
+    ABC,
+):
+    __identity_map: _IdentityMap[AggregateRootT, AggregateIdT]
+    __transaction: AbstractTransaction | None
+
+    def __init__(self, transaction: AbstractTransaction | None = None) -> None:
+        self.__identity_map = _IdentityMap()
+        self.__transaction = transaction
+
+    @abstractmethod
+    def _load(self, aggregate_ids: Sequence[AggregateIdT]) -> Sequence[AggregateRootT]:
+        # Only called with ids missing from the map, at most once per call
+        ...
+
+    @abstractmethod
+    def _page(
+        self, after: AggregateIdT | None, limit: int
+    ) -> Page[AggregateRootT, AggregateIdT]: ...
+
+    @abstractmethod
+    def _store(
+        self, aggregates: Sequence[AggregateRootT]
+    ) -> Sequence[AggregateRootT]: ...
+
+    @abstractmethod
+    def _remove(
+        self, aggregates: Sequence[AggregateRootT]
+    ) -> Sequence[AggregateRootT]: ...
+
+    def is_loaded(self, aggregate_id: AggregateIdT) -> bool:
+        return aggregate_id in self.__identity_map
+
+    def evict(self, *aggregate_ids: AggregateIdT) -> None:
+        self.__identity_map.evict(aggregate_ids)
+
+    def clear(self) -> None:
+        self.__identity_map.clear()
+
+    def __track(self, aggregates: Sequence[AggregateRootT]) -> None:
+        # Their events are published in one batch once the transaction commits
+        if self.__transaction is not None:
+            self.__transaction.track(*aggregates)
+
+    def __fill(self, aggregate_ids: Sequence[AggregateIdT]) -> None:
+        misses: list[AggregateIdT] = self.__identity_map.misses(aggregate_ids)
+        if not misses:
+            return
+        for aggregate in self._load(misses):
+            self.__identity_map.register(aggregate)
+
+    def get(self, aggregate_id: AggregateIdT) -> AggregateRootT:
+        aggregate: AggregateRootT | None = self.get_or_none(aggregate_id)
+        if aggregate is None:
+            raise EntityNotFoundError(aggregate_id)
+        return aggregate
+
+    def get_or_none(self, aggregate_id: AggregateIdT) -> AggregateRootT | None:
+        self.__fill((aggregate_id,))
+        return self.__identity_map.get(aggregate_id)
+
+    def contains(self, aggregate_id: AggregateIdT) -> bool:
+        return self.get_or_none(aggregate_id) is not None
+
+    def range(self, aggregate_ids: Sequence[AggregateIdT]) -> Sequence[AggregateRootT]:
+        self.__fill(aggregate_ids)
+        return self.__identity_map.collect(aggregate_ids)
+
+    def page(
+        self,
+        after: AggregateIdT | None = None,
+        limit: int = DEFAULT_CHUNK_SIZE,
+    ) -> Page[AggregateRootT, AggregateIdT]:
+        check_chunk_size(limit)
+        page: Page[AggregateRootT, AggregateIdT] = self._page(after, limit)
+        # Scans bypass the map so they run in constant memory, while aggregates
+        # already loaded in this context still come back as the same instance
+        return Page(
+            items=tuple(self.__identity_map.resolve(item) for item in page.items),
+            next_cursor=page.next_cursor,
+        )
+
+    def iter_range(
+        self,
+        aggregate_ids: Iterable[AggregateIdT],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[AggregateRootT]:
+        for chunk in chunked(aggregate_ids, chunk_size):
+            misses: list[AggregateIdT] = self.__identity_map.misses(chunk)
+            loaded: dict[AggregateIdT, AggregateRootT] = (
+                {aggregate.uid: aggregate for aggregate in self._load(misses)}
+                if misses
+                else {}
+            )
+            for aggregate_id in chunk:
+                aggregate: AggregateRootT | None = self.__identity_map.get(aggregate_id)
+                if aggregate is None:
+                    aggregate = loaded.get(aggregate_id)
+                if aggregate is not None:
+                    yield aggregate
+
+    def save(self, aggregate: AggregateRootT) -> AggregateRootT:
+        return self.save_all((aggregate,))[0]
+
+    def save_all(
+        self, aggregates: Sequence[AggregateRootT]
+    ) -> Sequence[AggregateRootT]:
+        stored: Sequence[AggregateRootT] = self._store(aggregates)
+        self.__track(aggregates)
+        return [self.__identity_map.replace(aggregate) for aggregate in stored]
+
+    def delete(self, aggregate: AggregateRootT) -> AggregateRootT:
+        return self.delete_all((aggregate,))[0]
+
+    def delete_all(
+        self, aggregates: Sequence[AggregateRootT]
+    ) -> Sequence[AggregateRootT]:
+        removed: Sequence[AggregateRootT] = self._remove(aggregates)
+        self.__track(aggregates)
+        self.__identity_map.evict(aggregate.uid for aggregate in aggregates)
+        return removed
+
+
+class AbstractAsyncIdentityMapRepository(
+    IAsyncPageableRepository[AggregateRootT, AggregateIdT],
+    IContextBound,
+    Generic[AggregateRootT, AggregateIdT],
+    ABC,
+):
+    __identity_map: _IdentityMap[AggregateRootT, AggregateIdT]
+    __transaction: AbstractAsyncTransaction | None
+
+    def __init__(self, transaction: AbstractAsyncTransaction | None = None) -> None:
+        self.__identity_map = _IdentityMap()
+        self.__transaction = transaction
+
+    @abstractmethod
+    async def _load(
+        self, aggregate_ids: Sequence[AggregateIdT]
+    ) -> Sequence[AggregateRootT]:
+        # Only called with ids missing from the map, at most once per call
+        ...
+
+    @abstractmethod
+    async def _page(
+        self, after: AggregateIdT | None, limit: int
+    ) -> Page[AggregateRootT, AggregateIdT]: ...
+
+    @abstractmethod
+    async def _store(
+        self, aggregates: Sequence[AggregateRootT]
+    ) -> Sequence[AggregateRootT]: ...
+
+    @abstractmethod
+    async def _remove(
+        self, aggregates: Sequence[AggregateRootT]
+    ) -> Sequence[AggregateRootT]: ...
+
+    def is_loaded(self, aggregate_id: AggregateIdT) -> bool:
+        return aggregate_id in self.__identity_map
+
+    def evict(self, *aggregate_ids: AggregateIdT) -> None:
+        self.__identity_map.evict(aggregate_ids)
+
+    def clear(self) -> None:
+        self.__identity_map.clear()
+
+    def __track(self, aggregates: Sequence[AggregateRootT]) -> None:
+        # Their events are published in one batch once the transaction commits
+        if self.__transaction is not None:
+            self.__transaction.track(*aggregates)
+
+    async def __fill(self, aggregate_ids: Sequence[AggregateIdT]) -> None:
+        misses: list[AggregateIdT] = self.__identity_map.misses(aggregate_ids)
+        if not misses:
+            return
+        for aggregate in await self._load(misses):
+            self.__identity_map.register(aggregate)
+
+    async def get(self, aggregate_id: AggregateIdT) -> AggregateRootT:
+        aggregate: AggregateRootT | None = await self.get_or_none(aggregate_id)
+        if aggregate is None:
+            raise EntityNotFoundError(aggregate_id)
+        return aggregate
+
+    async def get_or_none(self, aggregate_id: AggregateIdT) -> AggregateRootT | None:
+        await self.__fill((aggregate_id,))
+        return self.__identity_map.get(aggregate_id)
+
+    async def contains(self, aggregate_id: AggregateIdT) -> bool:
+        return await self.get_or_none(aggregate_id) is not None
+
+    async def range(
+        self, aggregate_ids: Sequence[AggregateIdT]
+    ) -> Sequence[AggregateRootT]:
+        await self.__fill(aggregate_ids)
+        return self.__identity_map.collect(aggregate_ids)
+
+    async def page(
+        self,
+        after: AggregateIdT | None = None,
+        limit: int = DEFAULT_CHUNK_SIZE,
+    ) -> Page[AggregateRootT, AggregateIdT]:
+        check_chunk_size(limit)
+        page: Page[AggregateRootT, AggregateIdT] = await self._page(after, limit)
+        # Scans bypass the map so they run in constant memory, while aggregates
+        # already loaded in this context still come back as the same instance
+        return Page(
+            items=tuple(self.__identity_map.resolve(item) for item in page.items),
+            next_cursor=page.next_cursor,
+        )
+
+    async def iter_range(
+        self,
+        aggregate_ids: Iterable[AggregateIdT],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[AggregateRootT]:
+        for chunk in chunked(aggregate_ids, chunk_size):
+            misses: list[AggregateIdT] = self.__identity_map.misses(chunk)
+            loaded: dict[AggregateIdT, AggregateRootT] = (
+                {aggregate.uid: aggregate for aggregate in await self._load(misses)}
+                if misses
+                else {}
+            )
+            for aggregate_id in chunk:
+                aggregate: AggregateRootT | None = self.__identity_map.get(aggregate_id)
+                if aggregate is None:
+                    aggregate = loaded.get(aggregate_id)
+                if aggregate is not None:
+                    yield aggregate
+
+    async def save(self, aggregate: AggregateRootT) -> AggregateRootT:
+        return (await self.save_all((aggregate,)))[0]
+
+    async def save_all(
+        self, aggregates: Sequence[AggregateRootT]
+    ) -> Sequence[AggregateRootT]:
+        stored: Sequence[AggregateRootT] = await self._store(aggregates)
+        self.__track(aggregates)
+        return [self.__identity_map.replace(aggregate) for aggregate in stored]
+
+    async def delete(self, aggregate: AggregateRootT) -> AggregateRootT:
+        return (await self.delete_all((aggregate,)))[0]
+
+    async def delete_all(
+        self, aggregates: Sequence[AggregateRootT]
+    ) -> Sequence[AggregateRootT]:
+        removed: Sequence[AggregateRootT] = await self._remove(aggregates)
+        self.__track(aggregates)
+        self.__identity_map.evict(aggregate.uid for aggregate in aggregates)
+        return removed
@@ -0,0 +1,596 @@
+from bisect import bisect_left, bisect_right, insort
+from contextlib import ExitStack
+from contextvars import ContextVar
+from copy import deepcopy
+from dataclasses import dataclass
+from heapq import merge
+from itertools import islice
+from threading import RLock
+from typing import (
+    Any,
+    Generic,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+    TypeVar,
+)
+from uuid import UUID
+from weakref import WeakSet
+
+from spakky.core.interfaces.equatable import IEquatable
+from spakky.domain.models.aggregate_root import AggregateRootT
+from spakky.domain.ports.event.event_publisher import (
+    IAsyncEventPublisher,
+    IEventPublisher,
+)
+from spakky.domain.ports.pagination import DEFAULT_CHUNK_SIZE, Page, check_chunk_size
+from spakky.domain.ports.persistency.error import AbstractSpakkyPersistencyError
+from spakky.domain.ports.persistency.repository import (
+    ConcurrencyConflictError,
+    EntityNotFoundError,
+    IAsyncPageableRepository,
+    IPageableRepository,
+    check_version,
+)
+from spakky.domain.ports.persistency.transaction import (
+    AbstractAsyncTransaction,
+    AbstractTransaction,
+)
+
+AggregateIdT = TypeVar("AggregateIdT", bound=IEquatable)
+
+
+class IndexNotDeclaredError(AbstractSpakkyPersistencyError):
+    message = "Index is not declared on the store"
+
+
+@dataclass
+class _Write(Generic[AggregateRootT]):
+    # Private copy to store, None for deletes
+    stored: AggregateRootT | None
+    # Version the store must still hold when the write is applied
+    expected: UUID | None
+    # Aggregate that made the write, marked clean once it is committed
+    source: AggregateRootT
+
+
+class _State(Generic[AggregateRootT, AggregateIdT]):
+    rows: dict[AggregateIdT, AggregateRootT]
+    indexes: dict[str, dict[Any, set[AggregateIdT]]]
+    __keys: list[AggregateIdT] | None
+
+    def __init__(
+        self,
+        rows: dict[AggregateIdT, AggregateRootT],
+        indexes: dict[str, dict[Any, set[AggregateIdT]]],
+        keys: list[AggregateIdT] | None = None,
+    ) -> None:
+        self.rows = rows
+        self.indexes = indexes
+        self.__keys = keys
+
+    def version_of(self, aggregate_id: AggregateIdT) -> UUID | None:
+        row: AggregateRootT | None = self.rows.get(aggregate_id)
+        return None if row is None else row.version
+
+    def put(self, aggregate: AggregateRootT) -> None:
+        old: AggregateRootT | None = self.rows.get(aggregate.uid)
+        if old is not None:
+            self.__unindex(old)
+        elif self.__keys is not None:
+            insort(self.__keys, aggregate.uid)
+        self.rows[aggregate.uid] = aggregate
+        for name, index in self.indexes.items():
+            index.setdefault(getattr(aggregate, name), set()).add(aggregate.uid)
+
+    def remove(self, aggregate_id: AggregateIdT) -> None:
+        old: AggregateRootT | None = self.rows.pop(aggregate_id, None)
+        if old is None:
+            return
+        self.__unindex(old)
+        if self.__keys is not None:
+            del self.__keys[bisect_left(self.__keys, aggregate_id)]
+
+    def __unindex(self, aggregate: AggregateRootT) -> None:
+        for name, index in self.indexes.items():
+            value: Any = getattr(aggregate, name)
+            ids: set[AggregateIdT] = index[value]
+            ids.discard(aggregate.uid)
+            if not ids:
+                del index[value]
+
+    def keys_after(self, after: AggregateIdT | None) -> Iterator[AggregateIdT]:
+        if self.__keys is None:
+            # Sorted once on the first page, writes keep the order afterwards
+            self.__keys = sorted(self.rows)
+        keys: list[AggregateIdT] = self.__keys
+        start: int = 0 if after is None else bisect_right(keys, after)
+        return (keys[position] for position in range(start, len(keys)))
+
+    def find(self, name: str, value: Any) -> set[AggregateIdT]:
+        if name not in self.indexes:
+            raise IndexNotDeclaredError(name)
+        return self.indexes[name].get(value, set())
+
+
+class _Snapshot(Generic[AggregateRootT, AggregateIdT]):
+    state: _State[AggregateRootT, AggregateIdT]
+    # Rows as they were when the snapshot was taken, for ids written since
+    undo: dict[AggregateIdT, AggregateRootT | None]
+
+    def __init__(self, state: _State[AggregateRootT, AggregateIdT]) -> None:
+        self.state = state
+        self.undo = {}
+
+    def get(self, aggregate_id: AggregateIdT) -> AggregateRootT | None:
+        # The live row is read first, commits record the old row before replacing it
+        row: AggregateRootT | None = self.state.rows.get(aggregate_id)
+        return self.undo.get(aggregate_id, row)
+
+    def keys_after(self, after: AggregateIdT | None) -> Iterator[AggregateIdT]:
+        replaced: list[AggregateIdT] = sorted(
+            aggregate_id
+            for aggregate_id, row in self.undo.items()
+            if row is not None and (after is None or aggregate_id > after)
+        )
+        previous: AggregateIdT | None = None
+        for aggregate_id in merge(self.state.keys_after(after), replaced):
+            if aggregate_id == previous:
+                continue
+            previous = aggregate_id
+            if self.get(aggregate_id) is not None:
+                yield aggregate_id
+
+    def find(self, name: str, value: Any) -> set[AggregateIdT]:
+        candidates: set[AggregateIdT] = set(self.state.find(name, value))
+        candidates.update(
+            aggregate_id
+            for aggregate_id, row in self.undo.items()
+            if row is not None and getattr(row, name) == value
+        )
+        return {
+            aggregate_id
+            for aggregate_id in candidates
+            if (row := self.get(aggregate_id)) is not None
+            and getattr(row, name) == value
+        }
+
+
+class InMemoryStore(Generic[AggregateRootT, AggregateIdT]):
+    _lock: RLock
+    __state: _State[AggregateRootT, AggregateIdT]
+    __snapshots: "WeakSet[_Snapshot[AggregateRootT, AggregateIdT]]"
+
+    def __init__(self, indexes: Iterable[str] = ()) -> None:
+        self._lock = RLock()
+        self.__state = _State({}, {name: {} for name in indexes})
+        self.__snapshots = WeakSet()
+
+    def __len__(self) -> int:
+        return len(self.__state.rows)
+
+    @property
+    def indexes(self) -> frozenset[str]:
+        return frozenset(self.__state.indexes)
+
+    @property
+    def _current(self) -> _State[AggregateRootT, AggregateIdT]:
+        return self.__state
+
+    def _snapshot(self) -> _Snapshot[AggregateRootT, AggregateIdT]:
+        snapshot: _Snapshot[AggregateRootT, AggregateIdT] = _Snapshot(self.__state)
+        with self._lock:
+            # Released with its unit of work, commits stop recording for it then
+            self.__snapshots.add(snapshot)
+        return snapshot
+
+    def _detach(self, stored: AggregateRootT) -> AggregateRootT:
+        # A deep copy also gives every loaded aggregate its own events and dirty set
+        return deepcopy(stored)
+
+    def _capture(self, aggregate: AggregateRootT) -> AggregateRootT:
+        # Stored rows are clean and carry no events, later loads start fresh
+        stored: AggregateRootT = deepcopy(aggregate)
+        stored.mark_clean()
+        stored.pull_events()
+        return stored
+
+    def _validate(self, writes: Mapping[AggregateIdT, _Write[AggregateRootT]]) -> None:
+        for aggregate_id, write in writes.items():
+            stored_version: UUID | None = self.__state.version_of(aggregate_id)
+            if stored_version != write.expected:
+                raise ConcurrencyConflictError(aggregate_id, stored_version)
+
+    def _apply(self, writes: Mapping[AggregateIdT, _Write[AggregateRootT]]) -> None:
+        # Open snapshots keep only the rows a commit replaces, never a full copy
+        for snapshot in self.__snapshots:
+            for aggregate_id in writes:
+                snapshot.undo.setdefault(
+                    aggregate_id, self.__state.rows.get(aggregate_id)
+                )
+        for aggregate_id, write in writes.items():
+            if write.stored is None:
+                self.__state.remove(aggregate_id)
+            else:
+                self.__state.put(write.stored)
+
+
+class _Session(Generic[AggregateRootT, AggregateIdT]):
+    store: InMemoryStore[AggregateRootT, AggregateIdT]
+    snapshot: _Snapshot[AggregateRootT, AggregateIdT]
+    writes: dict[AggregateIdT, _Write[AggregateRootT]]
+
+    def __init__(
+        self,
+        store: InMemoryStore[AggregateRootT, AggregateIdT],
+        snapshot: _Snapshot[AggregateRootT, AggregateIdT],
+    ) -> None:
+        self.store = store
+        self.snapshot = snapshot
+        self.writes = {}
+
+    def get(self, aggregate_id: AggregateIdT) -> AggregateRootT | None:
+        if (write := self.writes.get(aggregate_id)) is not None:
+            return write.stored
+        return self.snapshot.get(aggregate_id)
+
+    def version_for(self, aggregate: AggregateRootT) -> UUID | None:
+        write: _Write[AggregateRootT] | None = self.writes.get(aggregate.uid)
+        if write is not None and write.source is aggregate:
+            # Its own earlier write is not committed yet, so it is not clean either
+            return write.expected
+        stored: AggregateRootT | None = self.get(aggregate.uid)
+        return None if stored is None else stored.version
+
+    def expected(self, aggregate_id: AggregateIdT, version: UUID | None) -> UUID | None:
+        # Repeated writes still expect what the store held before the first one
+        if (write := self.writes.get(aggregate_id)) is not None:
+            return write.expected
+        return version
+
+    def keys_after(self, after: AggregateIdT | None) -> Iterator[AggregateIdT]:
+        inserted: list[AggregateIdT] = sorted(
+            aggregate_id
+            for aggregate_id, write in self.writes.items()
+            if write.stored is not None
+            and self.snapshot.get(aggregate_id) is None
+            and (after is None or aggregate_id > after)
+        )
+        for aggregate_id in merge(self.snapshot.keys_after(after), inserted):
+            if self.get(aggregate_id) is not None:
+                yield aggregate_id
+
+    def find(self, name: str, value: Any) -> list[AggregateIdT]:
+        unchanged: list[AggregateIdT] = [
+            aggregate_id
+            for aggregate_id in self.snapshot.find(name, value)
+            if aggregate_id not in self.writes
+        ]
+        changed: list[AggregateIdT] = [
+            aggregate_id
+            for aggregate_id, write in self.writes.items()
+            if write.stored is not None and getattr(write.stored, name) == value
+        ]
+        return unchanged + changed
+
+
+class _UnitOfWork:
+    __sessions: dict[int, _Session[Any, Any]]
+
+    def __init__(self) -> None:
+        self.__sessions = {}
+
+    def session(
+        self, store: InMemoryStore[AggregateRootT, AggregateIdT]
+    ) -> _Session[AggregateRootT, AggregateIdT]:
+        if (session := self.__sessions.get(id(store))) is None:
+            # Snapshots are taken on first use, stores never touched stay unshared
+            session = _Session(store, store._snapshot())
+            self.__sessions[id(store)] = session
+        return session
+
+    def commit(self) -> None:
+        sessions: list[_Session[Any, Any]] = [
+            session for _, session in sorted(self.__sessions.items()) if session.writes
+        ]
+        with ExitStack() as stack:
+            # Locks are taken in a stable order so concurrent commits cannot deadlock
+            for session in sessions:
+                stack.enter_context(session.store._lock)
+            for session in sessions:
+                session.store._validate(session.writes)
+            for session in sessions:
+                session.store._apply(session.writes)
+        for session in sessions:
+            for write in session.writes.values():
+                write.source.mark_clean()
+
+
+class InMemoryTransaction(AbstractTransaction):
+    __unit_of_work: ContextVar[_UnitOfWork | None]
+
+    def __init__(
+        self,
+        autocommit: bool = True,
+        event_publisher: IEventPublisher | None = None,
+    ) -> None:
+        super().__init__(autocommit=autocommit, event_publisher=event_publisher)
+        # Concurrent units of work on a shared transaction keep separate sessions
+        self.__unit_of_work = ContextVar(
+            f"{type(self).__qualname__}.unit_of_work", default=None
+        )
+
+    def _session(
+        self, store: InMemoryStore[AggregateRootT, AggregateIdT]
+    ) -> _Session[AggregateRootT, AggregateIdT] | None:
+        if (unit_of_work := self.__unit_of_work.get()) is None:
+            return None
+        return unit_of_work.session(store)
+
+    def initialize(self) -> None:
+        self.__unit_of_work.set(_UnitOfWork())
+
+    def dispose(self) -> None:
+        self.__unit_of_work.set(None)
+
+    def commit(self) -> None:
+        if (unit_of_work := self.__unit_of_work.get()) is not None:
+            unit_of_work.commit()
+            self.__unit_of_work.set(_UnitOfWork())
+
+    def rollback(self) -> None:
+        if self.__unit_of_work.get() is not None:
+            self.__unit_of_work.set(_UnitOfWork())
+
+
+class AsyncInMemoryTransaction(AbstractAsyncTransaction):
+    __unit_of_work: ContextVar[_UnitOfWork | None]
+
+    def __init__(
+        self,
+        autocommit: bool = True,
+        event_publisher: IAsyncEventPublisher | None = None,
+    ) -> None:
+        super().__init__(autocommit=autocommit, event_publisher=event_publisher)
+        # Concurrent units of work on a shared transaction keep separate sessions
+        self.__unit_of_work = ContextVar(
+            f"{type(self).__qualname__}.unit_of_work", default=None
+        )
+
+    def _session(
+        self, store: InMemoryStore[AggregateRootT, AggregateIdT]
+    ) -> _Session[AggregateRootT, AggregateIdT] | None:
+        if (unit_of_work := self.__unit_of_work.get()) is None:
+            return None
+        return unit_of_work.session(store)
+
+    async def initialize(self) -> None:
+        self.__unit_of_work.set(_UnitOfWork())
+
+    async def dispose(self) -> None:
+        self.__unit_of_work.set(None)
+
+    async def commit(self) -> None:
+        if (unit_of_work := self.__unit_of_work.get()) is not None:
+            unit_of_work.commit()
+            self.__unit_of_work.set(_UnitOfWork())
+
+    async def rollback(self) -> None:
+        if self.__unit_of_work.get() is not None:
+            self.__unit_of_work.set(_UnitOfWork())
+
+
+class _InMemoryRepositoryCore(Generic[AggregateRootT, AggregateIdT]):
+    __store: InMemoryStore[AggregateRootT, AggregateIdT]
+    __transaction: InMemoryTransaction | AsyncInMemoryTransaction | None
+
+    def __init__(
+        self,
+        store: InMemoryStore[AggregateRootT, AggregateIdT],
+        transaction: InMemoryTransaction | AsyncInMemoryTransaction | None = None,
+    ) -> None:
+        self.__store = store
+        self.__transaction = transaction
+
+    def __session(self) -> _Session[AggregateRootT, AggregateIdT] | None:
+        if self.__transaction is None:
+            return None
+        return self.__transaction._session(self.__store)
+
+    def _get_or_none(self, aggregate_id: AggregateIdT) -> AggregateRootT | None:
+        session: _Session[AggregateRootT, AggregateIdT] | None = self.__session()
+        stored: AggregateRootT | None = (
+            self.__store._current.rows.get(aggregate_id)
+            if session is None
+            else session.get(aggregate_id)
+        )
+        return None if stored is None else self.__store._detach(stored)
+
+    def _contains(self, aggregate_id: AggregateIdT) -> bool:
+        session: _Session[AggregateRootT, AggregateIdT] | None = self.__session()
+        if session is None:
+            return aggregate_id in self.__store._current.rows
+        return session.get(aggregate_id) is not None
+
+    def _range(self, aggregate_ids: Sequence[AggregateIdT]) -> list[AggregateRootT]:
+        return [
+            aggregate
+            for aggregate_id in aggregate_ids
+            if (aggregate := self._get_or_none(aggregate_id)) is not None
+        ]
+
+    def _page(
+        self, after: AggregateIdT | None, limit: int
+    ) -> Page[AggregateRootT, AggregateIdT]:
+        check_chunk_size(limit)
+        session: _Session[AggregateRootT, AggregateIdT] | None = self.__session()
+        with self.__store._lock:
+            keys: list[AggregateIdT] = list(
+                islice(
+                    self.__store._current.keys_after(after)
+                    if session is None
+                    else session.keys_after(after),
+                    limit + 1,
+                )
+            )
+        items: tuple[AggregateRootT, ...] = tuple(self._range(keys[:limit]))
+        return Page(
+            items=items,
+            next_cursor=items[-1].uid if len(keys) > limit and items else None,
+        )
+
+    def _find_by(self, name: str, value: Any) -> list[AggregateRootT]:
+        session: _Session[AggregateRootT, AggregateIdT] | None = self.__session()
+        with self.__store._lock:
+            aggregate_ids: list[AggregateIdT] = (
+                list(self.__store._current.find(name, value))
+                if session is None
+                else session.find(name, value)
+            )
+        return self._range(aggregate_ids)
+
+    def _write(
+        self,
+        aggregates: Sequence[AggregateRootT],
+        delete: bool,
+    ) -> Sequence[AggregateRootT]:
+        session: _Session[AggregateRootT, AggregateIdT] | None = self.__session()
+        writes: dict[AggregateIdT, _Write[AggregateRootT]] = {}
+        for aggregate in aggregates:
+            stored: AggregateRootT | None = (
+                None if delete else self.__store._capture(aggregate)
+            )
+            if session is None:
+                writes[aggregate.uid] = _Write(
+                    stored, aggregate.persisted_version, aggregate
+                )
+                continue
+            # Conflicts with the transaction's own view surface on save already,
+            # conflicts with other writers when the transaction commits
+            check_version(aggregate, session.version_for(aggregate))
+            writes[aggregate.uid] = _Write(
+                stored,
+                session.expected(aggregate.uid, aggregate.persisted_version),
+                aggregate,
+            )
+        if session is not None:
+            # Aggregates are marked clean by the commit, a rollback leaves them dirty
+            session.writes.update(writes)
+            if self.__transaction is not None:
+                self.__transaction.track(*aggregates)
+            return aggregates
+        with self.__store._lock:
+            self.__store._validate(writes)
+            self.__store._apply(writes)
+        for aggregate in aggregates:
+            aggregate.mark_clean()
+        return aggregates
+
+
+class InMemoryRepository(
+    _InMemoryRepositoryCore[AggregateRootT, AggregateIdT],
+    IPageableRepository[AggregateRootT, AggregateIdT],
+):
+    def __init__(
+        self,
+        store: InMemoryStore[AggregateRootT, AggregateIdT],
+        transaction: InMemoryTransaction | None = None,
+    ) -> None:
+        super().__init__(store, transaction)
+
+    def get(self, aggregate_id: AggregateIdT) -> AggregateRootT:
+        aggregate: AggregateRootT | None = self._get_or_none(aggregate_id)
+        if aggregate is None:
+            raise EntityNotFoundError(aggregate_id)
+        return aggregate
+
+    def get_or_none(self, aggregate_id: AggregateIdT) -> AggregateRootT | None:
+        return self._get_or_none(aggregate_id)
+
+    def contains(self, aggregate_id: AggregateIdT) -> bool:
+        return self._contains(aggregate_id)
+
+    def range(self, aggregate_ids: Sequence[AggregateIdT]) -> Sequence[AggregateRootT]:
+        return self._range(aggregate_ids)
+
+    def page(
+        self,
+        after: AggregateIdT | None = None,
+        limit: int = DEFAULT_CHUNK_SIZE,
+    ) -> Page[AggregateRootT, AggregateIdT]:
+        return self._page(after, limit)
+
+    def find_by(self, name: str, value: Any) -> Sequence[AggregateRootT]:
+        return self._find_by(name, value)
+
+    def save(self, aggregate: AggregateRootT) -> AggregateRootT:
+        return self._write((aggregate,), delete=False)[0]
+
+    def save_all(
+        self, aggregates: Sequence[AggregateRootT]
+    ) -> Sequence[AggregateRootT]:
+        return self._write(aggregates, delete=False)
+
+    def delete(self, aggregate: AggregateRootT) -> AggregateRootT:
+        return self._write((aggregate,), delete=True)[0]
+
+    def delete_all(
+        self, aggregates: Sequence[AggregateRootT]
+    ) -> Sequence[AggregateRootT]:
+        return self._write(aggregates, delete=True)
+
+
+class AsyncInMemoryRepository(
+    _InMemoryRepositoryCore[AggregateRootT, AggregateIdT],
+    IAsyncPageableRepository[AggregateRootT, AggregateIdT],
+):
+    def __init__(
+        self,
+        store: InMemoryStore[AggregateRootT, AggregateIdT],
+        transaction: AsyncInMemoryTransaction | None = None,
+    ) -> None:
+        super().__init__(store, transaction)
+
+    async def get(self, aggregate_id: AggregateIdT) -> AggregateRootT:
+        aggregate: AggregateRootT | None = self._get_or_none(aggregate_id)
+        if aggregate is None:
+            raise EntityNotFoundError(aggregate_id)
+        return aggregate
+
+    async def get_or_none(self, aggregate_id: AggregateIdT) -> AggregateRootT | None:
+        return self._get_or_none(aggregate_id)
+
+    async def contains(self, aggregate_id: AggregateIdT) -> bool:
+        return self._contains(aggregate_id)
+
+    async def range(
+        self, aggregate_ids: Sequence[AggregateIdT]
+    ) -> Sequence[AggregateRootT]:
+        return self._range(aggregate_ids)
+
+    async def page(
+        self,
+        after: AggregateIdT | None = None,
+        limit: int = DEFAULT_CHUNK_SIZE,
+    ) -> Page[AggregateRootT, AggregateIdT]:
+        return self._page(after, limit)
+
+    async def find_by(self, name: str, value: Any) -> Sequence[AggregateRootT]:
+        return self._find_by(name, value)
+
+    async def save(self, aggregate: AggregateRootT) -> AggregateRootT:
+        return self._write((aggregate,), delete=False)[0]
+
+    async def save_all(
+        self, aggregates: Sequence[AggregateRootT]
+    ) -> Sequence[AggregateRootT]:
+        return self._write(aggregates, delete=False)
+
+    async def delete(self, aggregate: AggregateRootT) -> AggregateRootT:
+        return self._write((aggregate,), delete=True)[0]
+
+    async def delete_all(
+        self, aggregates: Sequence[AggregateRootT]
+    ) -> Sequence[AggregateRootT]:
+        return self._write(aggregates, delete=True)
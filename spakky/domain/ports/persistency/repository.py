@@ -1,9 +1,25 @@
 from abc import abstractmethod
-from typing import Protocol, Sequence, TypeVar, runtime_checkable
+from typing import (
+    Any,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    Protocol,
+    Sequence,
+    TypeVar,
+    runtime_checkable,
+)
+from uuid import UUID
 
 from spakky.core.interfaces.equatable import IEquatable
 from spakky.domain.error import AbstractSpakkyDomainError
-from spakky.domain.models.aggregate_root import AggregateRootT
+from spakky.domain.models.aggregate_root import AbstractAggregateRoot, AggregateRootT
+from spakky.domain.ports.pagination import (
+    DEFAULT_CHUNK_SIZE,
+    Page,
+    aiter_chunks,
+    iter_chunks,
+)
 
 AggregateIdT_contra = TypeVar(
     "AggregateIdT_contra", bound=IEquatable, contravariant=True
@@ -14,6 +30,20 @@ class EntityNotFoundError(AbstractSpakkyDomainError):
     message = "Entity not found by given id"
 
 
+class ConcurrencyConflictError(AbstractSpakkyDomainError):
+    message = "Entity was modified by another transaction"
+
+
+def check_version(
+    aggregate: AbstractAggregateRoot[Any],
+    stored_version: UUID | None,
+) -> None:
+    # save() and save_all() must reject aggregates whose stored row moved on
+    # since they were loaded, instead of locking the row for the whole use case
+    if stored_version != aggregate.persisted_version:
+        raise ConcurrencyConflictError(aggregate.uid, stored_version)
+
+
 @runtime_checkable
 class IGenericRepository(Protocol[AggregateRootT, AggregateIdT_contra]):
     @abstractmethod
@@ -49,6 +79,39 @@ class IGenericRepository(Protocol[AggregateRootT, AggregateIdT_contra]):
     ) -> Sequence[AggregateRootT]: ...
 
 
+@runtime_checkable
+class IPageableRepository(
+    IGenericRepository[AggregateRootT, AggregateIdT_contra],
+    Protocol[AggregateRootT, AggregateIdT_contra],
+):
+    @abstractmethod
+    def page(
+        self,
+        after: AggregateIdT_contra | None = None,
+        limit: int = DEFAULT_CHUNK_SIZE,
+    ) -> Page[AggregateRootT, AggregateIdT_contra]: ...
+
+    def iter_range(
+        self,
+        aggregate_ids: Iterable[AggregateIdT_contra],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[AggregateRootT]:
+        return iter_chunks(self.range, aggregate_ids, chunk_size)
+
+    def iter_all(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[AggregateRootT]:
+        after: AggregateIdT_contra | None = None
+        while True:
+            page: Page[AggregateRootT, AggregateIdT_contra] = self.page(
+                after, chunk_size
+            )
+            yield from page.items
+            if page.next_cursor is None:
+                return
+            after = page.next_cursor
+
+
 @runtime_checkable
 class IAsyncGenericRepository(Protocol[AggregateRootT, AggregateIdT_contra]):
     @abstractmethod
@@ -82,3 +145,37 @@ class IAsyncGenericRepository(Protocol[AggregateRootT, AggregateIdT_contra]):
     async def delete_all(
         self, aggregates: Sequence[AggregateRootT]
     ) -> Sequence[AggregateRootT]: ...
+
+
+@runtime_checkable
+class IAsyncPageableRepository(
+    IAsyncGenericRepository[AggregateRootT, AggregateIdT_contra],
+    Protocol[AggregateRootT, AggregateIdT_contra],
+):
+    @abstractmethod
+    async def page(
+        self,
+        after: AggregateIdT_contra | None = None,
+        limit: int = DEFAULT_CHUNK_SIZE,
+    ) -> Page[AggregateRootT, AggregateIdT_contra]: ...
+
+    def iter_range(
+        self,
+        aggregate_ids: Iterable[AggregateIdT_contra],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[AggregateRootT]:
+        return aiter_chunks(self.range, aggregate_ids, chunk_size)
+
+    async def iter_all(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AsyncIterator[AggregateRootT]:
+        after: AggregateIdT_contra | None = None
+        while True:
+            page: Page[AggregateRootT, AggregateIdT_contra] = await self.page(
+                after, chunk_size
+            )
+            for aggregate in page.items:
+                yield aggregate
+            if page.next_cursor is None:
+                return
+            after = page.next_cursor
@@ -1,25 +1,166 @@
 import sys
 from abc import ABC, abstractmethod
+from contextvars import ContextVar, Token
+from inspect import isawaitable
 from types import TracebackType
-from typing import final
+from typing import Any, Awaitable, Callable, Generic, Iterable, TypeVar, cast, final
 
 from spakky.core.interfaces.disposable import IAsyncDisposable, IDisposable
+from spakky.domain.models.aggregate_root import AbstractAggregateRoot
+from spakky.domain.models.event import AbstractDomainEvent
+from spakky.domain.ports.event.event_publisher import (
+    IAsyncEventPublisher,
+    IEventPublisher,
+    publish_all,
+    publish_all_async,
+)
+from spakky.domain.ports.persistency.error import AbstractSpakkyPersistencyError
 
 if sys.version_info >= (3, 11):
     from typing import Self  # pragma: no cover
 else:
     from typing_extensions import Self  # pragma: no cover
 
+TransactionHook = Callable[[], None]
+AsyncTransactionHook = Callable[[], Awaitable[None] | None]
+
+TransactionHookT = TypeVar("TransactionHookT", bound=TransactionHook)
+AsyncTransactionHookT = TypeVar("AsyncTransactionHookT", bound=AsyncTransactionHook)
+HookT = TypeVar("HookT")
+
+
+class TransactionNotActiveError(AbstractSpakkyPersistencyError):
+    message = "Transaction hooks can only be registered inside a unit of work"
+
+
+class CommitHookRequiresAutocommitError(AbstractSpakkyPersistencyError):
+    message = "Commit hooks cannot run when the transaction is committed manually"
+
+
+class _TransactionFrame(Generic[HookT]):
+    aggregates: dict[int, AbstractAggregateRoot[Any]]
+    before_commit: list[HookT]
+    after_commit: list[HookT]
+    on_rollback: list[HookT]
+    token: "Token[_TransactionFrame[HookT] | None] | None"
+
+    def __init__(self) -> None:
+        self.aggregates = {}
+        self.before_commit = []
+        self.after_commit = []
+        self.on_rollback = []
+        self.token = None
+
+
+_Frame = _TransactionFrame[TransactionHook]
+_AsyncFrame = _TransactionFrame[AsyncTransactionHook]
+
 
 class AbstractTransaction(IDisposable, ABC):
     autocommit_enabled: bool
+    __event_publisher: IEventPublisher | None
+    __frame: ContextVar[_Frame | None]
 
-    def __init__(self, autocommit: bool = True) -> None:
+    def __init__(
+        self,
+        autocommit: bool = True,
+        event_publisher: IEventPublisher | None = None,
+    ) -> None:
         self.autocommit_enabled = autocommit
+        self.__event_publisher = event_publisher
+        # A shared transaction serves many units of work at once, so their state
+        # lives in a frame bound to the running context instead of the instance
+        self.__frame = ContextVar(f"{type(self).__qualname__}.frame", default=None)
+
+    @property
+    def event_publisher(self) -> IEventPublisher | None:
+        return self.__event_publisher
+
+    def set_event_publisher(self, event_publisher: IEventPublisher) -> None:
+        self.__event_publisher = event_publisher
+
+    def __current_frame(self) -> _Frame:
+        if (frame := self.__frame.get()) is None:
+            frame = _Frame()
+            self.__frame.set(frame)
+        return frame
+
+    def __enter_frame(self) -> _Frame:
+        frame = _Frame()
+        frame.token = self.__frame.set(frame)
+        return frame
+
+    def __leave_frame(self, frame: _Frame) -> None:
+        self.__frame.reset(cast(Token[_Frame | None], frame.token))
+        if frame.aggregates:
+            # Aggregates of a manual commit stay tracked for publish_events
+            self.__current_frame().aggregates.update(frame.aggregates)
+
+    def track(self, *aggregates: AbstractAggregateRoot[Any]) -> None:
+        frame: _Frame = self.__current_frame()
+        for aggregate in aggregates:
+            frame.aggregates[id(aggregate)] = aggregate
+
+    def __collect_events(
+        self, aggregates: Iterable[AbstractAggregateRoot[Any]]
+    ) -> list[AbstractDomainEvent]:
+        return [event for aggregate in aggregates for event in aggregate.events]
+
+    def pending_events(self) -> list[AbstractDomainEvent]:
+        return self.__collect_events(self.__current_frame().aggregates.values())
+
+    def publish_events(self) -> None:
+        frame: _Frame = self.__current_frame()
+        aggregates: list[AbstractAggregateRoot[Any]] = list(frame.aggregates.values())
+        frame.aggregates.clear()
+        if self.__event_publisher is None:
+            return
+        events: list[AbstractDomainEvent] = self.__collect_events(aggregates)
+        if events:
+            # One batch for the whole unit of work instead of a call per event
+            publish_all(self.__event_publisher, events)
+        for aggregate in aggregates:
+            aggregate.clear_events()
+
+    def __active_frame(self, commit_hook: bool) -> _Frame:
+        frame: _Frame | None = self.__frame.get()
+        if frame is None or frame.token is None:
+            raise TransactionNotActiveError
+        if commit_hook and not self.autocommit_enabled:
+            # A manual commit() happens outside of the unit of work's control
+            raise CommitHookRequiresAutocommitError
+        return frame
+
+    def on_before_commit(self, hook: TransactionHookT) -> TransactionHookT:
+        self.__active_frame(commit_hook=True).before_commit.append(hook)
+        return hook
+
+    def on_after_commit(self, hook: TransactionHookT) -> TransactionHookT:
+        self.__active_frame(commit_hook=True).after_commit.append(hook)
+        return hook
+
+    def on_rollback(self, hook: TransactionHookT) -> TransactionHookT:
+        self.__active_frame(commit_hook=False).on_rollback.append(hook)
+        return hook
+
+    def __run_hooks(self, hooks: list[TransactionHook]) -> Exception | None:
+        # Every hook runs even if an earlier one failed, the first error is kept
+        error: Exception | None = None
+        for hook in hooks:
+            try:
+                hook()
+            except Exception as e:
+                error = error or e
+        return error
 
     @final
     def __enter__(self) -> Self:
-        self.initialize()
+        frame: _Frame = self.__enter_frame()
+        try:
+            self.initialize()
+        except:
+            self.__leave_frame(frame)
+            raise
         return self
 
     @final
@@ -29,18 +170,37 @@ class AbstractTransaction(IDisposable, ABC):
         __exc_value: BaseException | None,
         __traceback: TracebackType | None,
     ) -> bool | None:
-        if __exc_value is not None:
+        frame: _Frame = self.__current_frame()
+        try:
+            self.__complete(frame, __exc_value)
+        finally:
+            self.__leave_frame(frame)
+
+    def __complete(self, frame: _Frame, exception: BaseException | None) -> None:
+        if exception is not None:
+            frame.aggregates.clear()
             self.rollback()
+            # The original error wins over failures of rollback hooks
+            self.__run_hooks(frame.on_rollback)
             self.dispose()
             return
         try:
             if self.autocommit_enabled:
+                for hook in frame.before_commit:
+                    hook()
                 self.commit()
         except:
+            frame.aggregates.clear()
             self.rollback()
+            self.__run_hooks(frame.on_rollback)
             raise
         finally:
             self.dispose()
+        if self.autocommit_enabled:
+            # Events are published only once their changes are committed
+            self.publish_events()
+            if (error := self.__run_hooks(frame.after_commit)) is not None:
+                raise error
 
     @abstractmethod
     def initialize(self) -> None: ...
@@ -57,13 +217,115 @@ class AbstractTransaction(IDisposable, ABC):
 
 class AbstractAsyncTransaction(IAsyncDisposable, ABC):
     autocommit_enabled: bool
+    __event_publisher: IAsyncEventPublisher | None
+    __frame: ContextVar[_AsyncFrame | None]
 
-    def __init__(self, autocommit: bool = True) -> None:
+    def __init__(
+        self,
+        autocommit: bool = True,
+        event_publisher: IAsyncEventPublisher | None = None,
+    ) -> None:
         self.autocommit_enabled = autocommit
+        self.__event_publisher = event_publisher
+        # A shared transaction serves many units of work at once, so their state
+        # lives in a frame bound to the running context instead of the instance
+        self.__frame = ContextVar(f"{type(self).__qualname__}.frame", default=None)
+
+    @property
+    def event_publisher(self) -> IAsyncEventPublisher | None:
+        return self.__event_publisher
+
+    def set_event_publisher(self, event_publisher: IAsyncEventPublisher) -> None:
+        self.__event_publisher = event_publisher
+
+    def __current_frame(self) -> _AsyncFrame:
+        if (frame := self.__frame.get()) is None:
+            frame = _AsyncFrame()
+            self.__frame.set(frame)
+        return frame
+
+    def __enter_frame(self) -> _AsyncFrame:
+        frame = _AsyncFrame()
+        frame.token = self.__frame.set(frame)
+        return frame
+
+    def __leave_frame(self, frame: _AsyncFrame) -> None:
+        self.__frame.reset(cast(Token[_AsyncFrame | None], frame.token))
+        if frame.aggregates:
+            # Aggregates of a manual commit stay tracked for publish_events
+            self.__current_frame().aggregates.update(frame.aggregates)
+
+    def track(self, *aggregates: AbstractAggregateRoot[Any]) -> None:
+        frame: _AsyncFrame = self.__current_frame()
+        for aggregate in aggregates:
+            frame.aggregates[id(aggregate)] = aggregate
+
+    def __collect_events(
+        self, aggregates: Iterable[AbstractAggregateRoot[Any]]
+    ) -> list[AbstractDomainEvent]:
+        return [event for aggregate in aggregates for event in aggregate.events]
+
+    def pending_events(self) -> list[AbstractDomainEvent]:
+        return self.__collect_events(self.__current_frame().aggregates.values())
+
+    async def publish_events(self) -> None:
+        frame: _AsyncFrame = self.__current_frame()
+        aggregates: list[AbstractAggregateRoot[Any]] = list(frame.aggregates.values())
+        frame.aggregates.clear()
+        if self.__event_publisher is None:
+            return
+        events: list[AbstractDomainEvent] = self.__collect_events(aggregates)
+        if events:
+            # One batch for the whole unit of work instead of a call per event
+            await publish_all_async(self.__event_publisher, events)
+        for aggregate in aggregates:
+            aggregate.clear_events()
+
+    def __active_frame(self, commit_hook: bool) -> _AsyncFrame:
+        frame: _AsyncFrame | None = self.__frame.get()
+        if frame is None or frame.token is None:
+            raise TransactionNotActiveError
+        if commit_hook and not self.autocommit_enabled:
+            # A manual commit() happens outside of the unit of work's control
+            raise CommitHookRequiresAutocommitError
+        return frame
+
+    def on_before_commit(self, hook: AsyncTransactionHookT) -> AsyncTransactionHookT:
+        self.__active_frame(commit_hook=True).before_commit.append(hook)
+        return hook
+
+    def on_after_commit(self, hook: AsyncTransactionHookT) -> AsyncTransactionHookT:
+        self.__active_frame(commit_hook=True).after_commit.append(hook)
+        return hook
+
+    def on_rollback(self, hook: AsyncTransactionHookT) -> AsyncTransactionHookT:
+        self.__active_frame(commit_hook=False).on_rollback.append(hook)
+        return hook
+
+    async def __run_hook(self, hook: AsyncTransactionHook) -> None:
+        # Plain functions are called inline, coroutine results are awaited
+        result: Awaitable[None] | None = hook()
+        if isawaitable(result):
+            await result
+
+    async def __run_hooks(self, hooks: list[AsyncTransactionHook]) -> Exception | None:
+        # Every hook runs even if an earlier one failed, the first error is kept
+        error: Exception | None = None
+        for hook in hooks:
+            try:
+                await self.__run_hook(hook)
+            except Exception as e:
+                error = error or e
+        return error
 
     @final
     async def __aenter__(self) -> Self:
-        await self.initialize()
+        frame: _AsyncFrame = self.__enter_frame()
+        try:
+            await self.initialize()
+        except:
+            self.__leave_frame(frame)
+            raise
         return self
 
     @final
@@ -73,18 +335,41 @@ class AbstractAsyncTransaction(IAsyncDisposable, ABC):
         __exc_value: BaseException | None,
         __traceback: TracebackType | None,
     ) -> bool | None:
-        if __exc_value is not None:
+        frame: _AsyncFrame = self.__current_frame()
+        try:
+            await self.__complete(frame, __exc_value)
+        finally:
+            self.__leave_frame(frame)
+
+    async def __complete(
+        self,
+        frame: _AsyncFrame,
+        exception: BaseException | None,
+    ) -> None:
+        if exception is not None:
+            frame.aggregates.clear()
             await self.rollback()
+            # The original error wins over failures of rollback hooks
+            await self.__run_hooks(frame.on_rollback)
             await self.dispose()
             return
         try:
             if self.autocommit_enabled:
+                for hook in frame.before_commit:
+                    await self.__run_hook(hook)
                 await self.commit()
         except:
+            frame.aggregates.clear()
             await self.rollback()
+            await self.__run_hooks(frame.on_rollback)
             raise
         finally:
             await self.dispose()
+        if self.autocommit_enabled:
+            # Events are published only once their changes are committed
+            await self.publish_events()
+            if (error := await self.__run_hooks(frame.after_commit)) is not None:
+                raise error
 
     @abstractmethod
     async def initialize(self) -> None: ...
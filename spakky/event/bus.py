@@ -0,0 +1,194 @@
+from asyncio import (
+    AbstractEventLoop,
+    Queue,
+    gather,
+    get_running_loop,
+    run_coroutine_threadsafe,
+    to_thread,
+    wrap_future,
+)
+from functools import partial
+from inspect import getmembers, iscoroutinefunction, isfunction
+from typing import Any, Awaitable, Callable, Sequence, TypeAlias
+
+from spakky.domain.models.event import AbstractDomainEvent
+from spakky.domain.ports.event.error import AbstractSpakkyEventError
+from spakky.domain.ports.event.event_consumer import (
+    DomainEventT,
+    IAsyncEventConsumer,
+    IAsyncEventHandlerCallback,
+)
+from spakky.domain.ports.event.event_publisher import IAsyncBatchEventPublisher
+from spakky.pod.annotations.pod import Pod
+from spakky.pod.interfaces.aware.container_aware import IContainerAware
+from spakky.pod.interfaces.container import IContainer
+from spakky.service.background import AbstractAsyncBackgroundService
+from spakky.stereotype.event_handler import EventHandler, EventRoute
+
+Handler: TypeAlias = Callable[[Any], Awaitable[None]]
+
+
+class EventBusNotStartedError(AbstractSpakkyEventError):
+    message = "Event bus is not started"
+
+
+@Pod()
+class AsyncEventBus(
+    IAsyncBatchEventPublisher,
+    IAsyncEventConsumer,
+    IContainerAware,
+    AbstractAsyncBackgroundService,
+):
+    __queue_size: int
+    __concurrency: int
+    __container: IContainer | None
+    __callbacks: dict[type, list[Handler]]
+    __routes: dict[type, list[Handler]]
+    __dispatch_table: dict[type, tuple[Handler, ...]]
+    __queue: "Queue[AbstractDomainEvent] | None"
+    __loop: AbstractEventLoop | None
+
+    def __init__(self, queue_size: int = 1024, concurrency: int = 16) -> None:
+        if queue_size < 1:
+            raise ValueError("queue_size must be at least 1")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.__queue_size = queue_size
+        self.__concurrency = concurrency
+        self.__container = None
+        self.__callbacks = {}
+        self.__routes = {}
+        self.__dispatch_table = {}
+        self.__queue = None
+        self.__loop = None
+
+    def set_container(self, container: IContainer) -> None:
+        self.__container = container
+
+    @staticmethod
+    def __as_async(handler: Callable[[Any], Any]) -> Handler:
+        if iscoroutinefunction(handler):
+            return handler
+        # Blocking handlers must not stall the other handlers on the loop
+        return partial(to_thread, handler)
+
+    def register(
+        self,
+        event: type[DomainEventT],
+        handler: IAsyncEventHandlerCallback[DomainEventT],
+    ) -> None:
+        callback: Handler = self.__as_async(handler)
+        self.__callbacks.setdefault(event, []).append(callback)
+        if self.__loop is not None:
+            self.__routes.setdefault(event, []).append(callback)
+            self.__dispatch_table.clear()
+
+    def __index_routes(self) -> None:
+        self.__routes = {
+            event: list(handlers) for event, handlers in self.__callbacks.items()
+        }
+        if self.__container is not None:
+            for handler in self.__container.find(
+                lambda x: EventHandler.exists(x.target)
+            ):
+                # Inspect the class so instance properties are never evaluated
+                for name, function in getmembers(type(handler), isfunction):
+                    for route in EventRoute.all(function):
+                        self.__routes.setdefault(route.event_type, []).append(
+                            self.__as_async(getattr(handler, name))
+                        )
+        self.__dispatch_table = {}
+        pending: list[type] = list(self.__routes)
+        while pending:
+            # Subclasses already imported get their tables before the first publish
+            event_type: type = pending.pop()
+            if event_type not in self.__dispatch_table:
+                self.__resolve(event_type)
+                pending.extend(event_type.__subclasses__())
+
+    def __resolve(self, event_type: type) -> tuple[Handler, ...]:
+        handlers: tuple[Handler, ...] = tuple(
+            handler
+            for base in event_type.__mro__
+            for handler in self.__routes.get(base, ())
+        )
+        self.__dispatch_table[event_type] = handlers
+        return handlers
+
+    def __handlers_of(self, event_type: type) -> tuple[Handler, ...]:
+        if (handlers := self.__dispatch_table.get(event_type)) is not None:
+            return handlers
+        return self.__resolve(event_type)
+
+    async def __enqueue(
+        self,
+        queue: "Queue[AbstractDomainEvent]",
+        events: Sequence[AbstractDomainEvent],
+    ) -> None:
+        for event in events:
+            # Waits for a free slot when consumers fall behind
+            await queue.put(event)
+
+    async def publish(self, event: AbstractDomainEvent) -> None:
+        await self.publish_all((event,))
+
+    async def publish_all(self, events: Sequence[AbstractDomainEvent]) -> None:
+        if self.__queue is None or self.__loop is None:
+            raise EventBusNotStartedError
+        routed: list[AbstractDomainEvent] = [
+            event for event in events if self.__handlers_of(type(event))
+        ]
+        if not routed:
+            return
+        if get_running_loop() is self.__loop:
+            await self.__enqueue(self.__queue, routed)
+            return
+        # Queues are bound to the loop of the bus, the batch is handed over at once
+        await wrap_future(
+            run_coroutine_threadsafe(
+                self.__enqueue(self.__queue, routed),
+                self.__loop,
+            )
+        )
+
+    async def __dispatch(self, event: AbstractDomainEvent) -> None:
+        handlers: tuple[Handler, ...] = self.__handlers_of(type(event))
+        results: list[Any] = await gather(
+            *(handler(event) for handler in handlers),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                self._logger.error(
+                    f"[{type(self).__name__}] {event.event_name!r} handler failed",
+                    exc_info=result,
+                )
+
+    async def __consume(self, queue: "Queue[AbstractDomainEvent]") -> None:
+        while True:
+            event: AbstractDomainEvent = await queue.get()
+            try:
+                await self.__dispatch(event)
+            finally:
+                queue.task_done()
+
+    async def initialize_async(self) -> None:
+        self.__index_routes()
+        self.__queue = Queue(maxsize=self.__queue_size)
+        self.__loop = get_running_loop()
+
+    async def dispose_async(self) -> None:
+        self.__queue = None
+        self.__loop = None
+
+    async def run_async(self) -> None:
+        if self.__queue is None:  # pragma: no cover
+            raise EventBusNotStartedError
+        for index in range(self.__concurrency):
+            self.create_task(
+                self.__consume(self.__queue),
+                name=f"{type(self).__name__}-{index}",
+            )
+        await self._stop_event.wait()
+        # Events accepted before stopping are delivered, workers are then cancelled
+        await self.__queue.join()
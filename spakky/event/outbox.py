@@ -0,0 +1,296 @@
+import sqlite3
+from asyncio import tasks, to_thread
+from asyncio.exceptions import TimeoutError as AsyncTimeoutError
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+from time import time
+from typing import Sequence
+from uuid import UUID
+
+from spakky.domain.models.event import AbstractDomainEvent
+from spakky.domain.models.event_serializer import EventSerializerRegistry
+from spakky.domain.ports.event.error import AbstractSpakkyEventError
+from spakky.domain.ports.event.event_publisher import (
+    IAsyncEventPublisher,
+    IBatchEventPublisher,
+    IEventPublisher,
+    publish_all_async,
+)
+from spakky.domain.ports.persistency.transaction import (
+    AbstractTransaction,
+    TransactionNotActiveError,
+)
+from spakky.service.background import AbstractAsyncBackgroundService
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    sequence INTEGER PRIMARY KEY AUTOINCREMENT,
+    event_id TEXT NOT NULL UNIQUE,
+    event_name TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    created_at REAL NOT NULL,
+    sent_at REAL,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS outbox_pending ON outbox (sent_at, sequence);
+"""
+
+_IN_MEMORY = ":memory:"
+
+
+class OutboxDatabaseMismatchError(AbstractSpakkyEventError):
+    message = "Transaction and outbox must share one database file"
+
+
+@dataclass(frozen=True)
+class OutboxRecord:
+    sequence: int
+    event_id: UUID
+    event: AbstractDomainEvent
+
+
+class SqliteOutbox(IBatchEventPublisher):
+    __path: str | Path
+    __connection: sqlite3.Connection
+    __lock: Lock
+    __serializer: EventSerializerRegistry
+
+    def __init__(
+        self,
+        path: str | Path = _IN_MEMORY,
+        serializer: EventSerializerRegistry | None = None,
+    ) -> None:
+        self.__path = path
+        self.__serializer = serializer or EventSerializerRegistry()
+        # Shared by the request threads and the relay, serialized by the lock
+        self.__connection = sqlite3.connect(path, check_same_thread=False)
+        self.__lock = Lock()
+        with self.__lock, self.__connection:
+            self.__connection.executescript(_SCHEMA)
+
+    @property
+    def path(self) -> str | Path:
+        return self.__path
+
+    def __insert(
+        self,
+        connection: sqlite3.Connection,
+        events: Sequence[AbstractDomainEvent],
+    ) -> None:
+        # Appending an event that is already stored, sent or not, is a no-op
+        connection.executemany(
+            "INSERT OR IGNORE INTO outbox "
+            "(event_id, event_name, payload, created_at) VALUES (?, ?, ?, ?)",
+            [
+                (
+                    str(event.event_id),
+                    event.event_name,
+                    self.__serializer.serialize(event),
+                    time(),
+                )
+                for event in events
+            ],
+        )
+
+    def append(
+        self,
+        events: Sequence[AbstractDomainEvent],
+        connection: sqlite3.Connection | None = None,
+    ) -> None:
+        if connection is not None:
+            # Joins the caller's transaction, committed or rolled back with it
+            self.__insert(connection, events)
+            return
+        with self.__lock, self.__connection:
+            self.__insert(self.__connection, events)
+
+    def publish(self, event: AbstractDomainEvent) -> None:
+        self.append((event,))
+
+    def publish_all(self, events: Sequence[AbstractDomainEvent]) -> None:
+        self.append(events)
+
+    def fetch(self, limit: int) -> list[OutboxRecord]:
+        records: list[OutboxRecord] = []
+        while not records:
+            with self.__lock:
+                rows: list[tuple[int, str, bytes]] = self.__connection.execute(
+                    "SELECT sequence, event_id, payload FROM outbox "
+                    "WHERE sent_at IS NULL AND error IS NULL ORDER BY sequence LIMIT ?",
+                    (limit,),
+                ).fetchall()
+            if not rows:
+                break
+            failures: list[tuple[str, str]] = []
+            for sequence, event_id, payload in rows:
+                try:
+                    event: AbstractDomainEvent = self.__serializer.deserialize(payload)
+                except Exception as e:
+                    failures.append((repr(e), event_id))
+                    continue
+                records.append(OutboxRecord(sequence, UUID(event_id), event))
+            if failures:
+                # Undecodable rows are set aside so they never block the rows behind
+                with self.__lock, self.__connection:
+                    self.__connection.executemany(
+                        "UPDATE outbox SET error = ? WHERE event_id = ?", failures
+                    )
+        return records
+
+    def count_quarantined(self) -> int:
+        with self.__lock:
+            (count,) = self.__connection.execute(
+                "SELECT COUNT(*) FROM outbox WHERE sent_at IS NULL AND error IS NOT NULL"
+            ).fetchone()
+        return count
+
+    def requeue_quarantined(self) -> None:
+        # Retried once the missing event types are registered
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                "UPDATE outbox SET error = NULL WHERE sent_at IS NULL"
+            )
+
+    def mark_sent(self, event_ids: Sequence[UUID]) -> None:
+        with self.__lock, self.__connection:
+            self.__connection.executemany(
+                "UPDATE outbox SET sent_at = ? WHERE event_id = ?",
+                [(time(), str(event_id)) for event_id in event_ids],
+            )
+
+    def count_pending(self) -> int:
+        with self.__lock:
+            (count,) = self.__connection.execute(
+                "SELECT COUNT(*) FROM outbox WHERE sent_at IS NULL AND error IS NULL"
+            ).fetchone()
+        return count
+
+    def purge(self, older_than: float) -> None:
+        # Sent rows are kept for deduplication until they are purged
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                "DELETE FROM outbox WHERE sent_at IS NOT NULL AND sent_at < ?",
+                (older_than,),
+            )
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__connection.close()
+
+
+class SqliteTransaction(AbstractTransaction):
+    __path: str | Path
+    __outbox: SqliteOutbox | None
+    __connection: ContextVar[sqlite3.Connection | None]
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        outbox: SqliteOutbox | None = None,
+        autocommit: bool = True,
+        event_publisher: IEventPublisher | None = None,
+    ) -> None:
+        super().__init__(autocommit=autocommit, event_publisher=event_publisher)
+        if outbox is not None:
+            # Outbox rows are written on the transaction's own connection
+            if str(outbox.path) in ("", _IN_MEMORY):
+                raise OutboxDatabaseMismatchError(outbox.path)
+            if path is None:
+                path = outbox.path
+            elif Path(path).resolve() != Path(outbox.path).resolve():
+                raise OutboxDatabaseMismatchError(path, outbox.path)
+        if path is None:
+            raise ValueError("path is required without an outbox")
+        self.__path = path
+        self.__outbox = outbox
+        # Each unit of work runs on its own connection, even on a shared transaction
+        self.__connection = ContextVar(
+            f"{type(self).__qualname__}.connection", default=None
+        )
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        if (connection := self.__connection.get()) is None:
+            raise TransactionNotActiveError
+        return connection
+
+    def initialize(self) -> None:
+        self.__connection.set(sqlite3.connect(self.__path))
+
+    def dispose(self) -> None:
+        self.connection.close()
+        self.__connection.set(None)
+
+    def commit(self) -> None:
+        if self.__outbox is not None:
+            # Tracked events are stored with the changes that raised them
+            self.__outbox.append(self.pending_events(), connection=self.connection)
+        self.connection.commit()
+
+    def rollback(self) -> None:
+        self.connection.rollback()
+
+
+class OutboxRelay(AbstractAsyncBackgroundService):
+    __outbox: SqliteOutbox
+    __publisher: IAsyncEventPublisher
+    __batch_size: int
+    __interval: float
+
+    def __init__(
+        self,
+        outbox: SqliteOutbox,
+        publisher: IAsyncEventPublisher,
+        batch_size: int = 100,
+        interval: float = 1.0,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.__outbox = outbox
+        self.__publisher = publisher
+        self.__batch_size = batch_size
+        self.__interval = interval
+
+    async def __wait_for_stop(self, delay: float) -> None:
+        try:
+            await tasks.wait_for(self._stop_event.wait(), delay)
+        except AsyncTimeoutError:
+            return
+
+    async def relay(self) -> int:
+        relayed: int = 0
+        while True:
+            records: list[OutboxRecord] = await to_thread(
+                self.__outbox.fetch, self.__batch_size
+            )
+            if not records:
+                return relayed
+            # Marked only after publishing, so a crash in between redelivers
+            await publish_all_async(
+                self.__publisher, [record.event for record in records]
+            )
+            await to_thread(
+                self.__outbox.mark_sent, [record.event_id for record in records]
+            )
+            relayed += len(records)
+
+    async def initialize_async(self) -> None:
+        return
+
+    async def dispose_async(self) -> None:
+        return
+
+    async def run_async(self) -> None:
+        while True:
+            try:
+                await self.relay()
+            except Exception:
+                self._logger.exception(f"[{type(self).__name__}] relay failed")
+            if self._stop_event.is_set():
+                return
+            # Events appended while stopping still get one last attempt
+            await self.__wait_for_stop(self.__interval)
@@ -0,0 +1,40 @@
+from logging import Logger
+
+from spakky.domain.ports.event.event_publisher import (
+    IAsyncEventPublisher,
+    IEventPublisher,
+)
+from spakky.domain.ports.persistency.transaction import (
+    AbstractAsyncTransaction,
+    AbstractTransaction,
+)
+from spakky.pod.annotations.pod import Pod
+from spakky.pod.interfaces.container import IContainer
+from spakky.pod.interfaces.post_processor import IPostProcessor
+
+
+@Pod()
+class TransactionEventPublisherPostProcessor(IPostProcessor):
+    __container: IContainer
+    __logger: Logger
+
+    def __init__(self, container: IContainer, logger: Logger) -> None:
+        super().__init__()
+        self.__container = container
+        self.__logger = logger
+
+    def post_process(self, pod: object) -> object:
+        # Transactions built without a publisher publish through the container's
+        if isinstance(pod, AbstractTransaction) and pod.event_publisher is None:
+            if self.__container.contains(IEventPublisher):
+                pod.set_event_publisher(self.__container.get(IEventPublisher))
+                self.__logger.debug(
+                    f"[{type(self).__name__}] {type(pod).__name__!r} publishes events"
+                )
+        if isinstance(pod, AbstractAsyncTransaction) and pod.event_publisher is None:
+            if self.__container.contains(IAsyncEventPublisher):
+                pod.set_event_publisher(self.__container.get(IAsyncEventPublisher))
+                self.__logger.debug(
+                    f"[{type(self).__name__}] {type(pod).__name__!r} publishes events"
+                )
+        return pod
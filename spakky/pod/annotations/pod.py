@@ -1,15 +1,33 @@
 import inspect
 from dataclasses import dataclass, field
 from enum import Enum, auto
+from hashlib import blake2b
 from inspect import Parameter, isclass, isfunction
 from types import NoneType
-from typing import Annotated, TypeAlias, TypeGuard, TypeVar, get_origin
+from typing import (
+    Annotated,
+    Any,
+    ClassVar,
+    Mapping,
+    TypeAlias,
+    TypeGuard,
+    TypeVar,
+    get_args,
+    get_origin,
+)
 from uuid import UUID, uuid4
 
 from spakky.core.annotation import Annotation
 from spakky.core.interfaces.equatable import IEquatable
 from spakky.core.metadata import get_metadata
 from spakky.core.mro import generic_mro
+from spakky.core.reference import (
+    CannotResolveReferenceError,
+    Reference,
+    from_reference,
+    get_reference_key,
+    to_reference,
+)
 from spakky.core.types import Class, Func, is_optional
 from spakky.pod.annotations.primary import Primary
 from spakky.pod.annotations.qualifier import Qualifier
@@ -28,10 +46,53 @@ class DependencyInfo:
 
 
 DependencyMap: TypeAlias = dict[str, DependencyInfo]
+
+
+@dataclass
+class PodRecord:
+    type_: Reference
+    base_types: list[Reference]
+    dependencies: list[dict[str, Any]]
+    fingerprint: str = ""
+
+
 PodType: TypeAlias = Func | Class
 PodT = TypeVar("PodT", bound=PodType)
 
 
+def _describe(value: Any) -> str:
+    # Stable across processes, unlike reprs that embed object addresses
+    if isinstance(value, dict):
+        return ",".join(f"{key}={_describe(x)}" for key, x in value.items())
+    if isinstance(value, (list, tuple)):
+        return f"({','.join(_describe(x) for x in value)})"
+    if (origin := get_origin(value)) is not None and origin is not value:
+        arguments: str = ",".join(_describe(x) for x in get_args(value))
+        return f"{_describe(origin)}[{arguments}]"
+    if hasattr(value, "__module__") and hasattr(value, "__qualname__"):
+        return get_reference_key(value)
+    if hasattr(value, "__dict__"):
+        return f"{type(value).__qualname__}({_describe(vars(value))})"
+    return repr(value)
+
+
+def get_fingerprint(obj: PodType) -> str:
+    # Cheap compared to introspection, yet changes whenever the signature,
+    # the constructor or the class hierarchy of the pod changes
+    digest = blake2b(digest_size=16)
+    if isclass(obj):
+        digest.update(_describe(list(obj.__mro__)).encode())
+        obj = obj.__init__
+    if (code := getattr(obj, "__code__", None)) is not None:
+        digest.update(code.co_code)
+        digest.update(repr(code.co_varnames[: code.co_argcount]).encode())
+        digest.update(repr(code.co_varnames[code.co_argcount :]).encode())
+        digest.update(repr((code.co_kwonlyargcount, code.co_posonlyargcount)).encode())
+    digest.update(_describe(getattr(obj, "__annotations__", {})).encode())
+    digest.update(repr(getattr(obj, "__defaults__", None) is not None).encode())
+    return digest.hexdigest()
+
+
 class CannotDeterminePodTypeError(PodAnnotationFailedError):
     message = "Cannot determine pod type"
 
@@ -71,6 +132,18 @@ class Pod(Annotation, IEquatable):
     target: PodType = field(init=False)
     dependencies: DependencyMap = field(init=False, default_factory=DependencyMap)
 
+    __records: ClassVar[Mapping[str, PodRecord]] = {}
+
+    @classmethod
+    def load_records(cls, records: Mapping[str, PodRecord]) -> None:
+        Pod.__records = records
+
+    @classmethod
+    def unload_records(cls, records: Mapping[str, PodRecord] | None = None) -> None:
+        # Records activated by another snapshot in the meantime stay active
+        if records is None or Pod.__records is records:
+            Pod.__records = {}
+
     def __get_dependencies(self, obj: PodType) -> DependencyMap:
         if isclass(obj):
             if has_default_constructor(obj):
@@ -111,7 +184,47 @@ class Pod(Annotation, IEquatable):
 
         return dependencies
 
+    def __restore(self, obj: PodType, record: PodRecord) -> bool:
+        # The pod itself is not bound to its module yet while being decorated
+        scope: dict[str, Any] = {get_reference_key(obj): obj}
+        try:
+            type_: type = from_reference(record.type_, scope)
+            base_types: set[type] = {
+                from_reference(x, scope) for x in record.base_types
+            }
+            dependencies: DependencyMap = {
+                x["name"]: DependencyInfo(
+                    name=x["name"],
+                    type_=from_reference(x["type_"], scope),
+                    has_default=x["has_default"],
+                    is_optional=x["is_optional"],
+                    qualifiers=[
+                        Qualifier(from_reference(selector, scope))
+                        for selector in x["qualifiers"]
+                    ],
+                )
+                for x in record.dependencies
+            }
+        except CannotResolveReferenceError:
+            return False
+        if not self.name:
+            self.name = pascal_to_snake(obj.__name__)
+        self.type_ = type_
+        self.base_types = base_types
+        self.target = obj
+        self.dependencies = dependencies
+        return True
+
     def __initialize(self, obj: PodType) -> None:
+        record: PodRecord | None = Pod.__records.get(get_reference_key(obj))
+        if (
+            record is not None
+            # Records of pods edited since the snapshot was taken are stale
+            and record.fingerprint == get_fingerprint(obj)
+            and self.__restore(obj, record)
+        ):
+            # Skip introspection if the pod was analyzed ahead of time
+            return
         type_: type | None = None
         dependencies: DependencyMap = self.__get_dependencies(obj)
         if isfunction(obj):
@@ -160,6 +273,26 @@ class Pod(Annotation, IEquatable):
             for name, dependency in self.dependencies.items()
         }
 
+    def to_record(self) -> PodRecord:
+        return PodRecord(
+            type_=to_reference(self.type_),
+            base_types=[to_reference(x) for x in self.base_types],
+            dependencies=[
+                {
+                    "name": dependency.name,
+                    "type_": to_reference(dependency.type_),
+                    "has_default": dependency.has_default,
+                    "is_optional": dependency.is_optional,
+                    "qualifiers": [
+                        to_reference(qualifier.selector)
+                        for qualifier in dependency.qualifiers
+                    ],
+                }
+                for dependency in self.dependencies.values()
+            ],
+            fingerprint=get_fingerprint(self.target),
+        )
+
     def is_family_with(self, type_: type) -> bool:
         return type_ == self.type_ or type_ in self.base_types
 
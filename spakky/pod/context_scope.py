@@ -0,0 +1,121 @@
+import sys
+from contextvars import ContextVar, Token
+from inspect import isawaitable, iscoroutine
+from logging import Logger
+from types import TracebackType
+from uuid import UUID, uuid4
+
+from spakky.core.interfaces.closeable import IAsyncCloseable, ICloseable
+from spakky.core.interfaces.disposable import IAsyncDisposable, IDisposable
+from spakky.pod.error import AbstractSpakkyPodError
+
+if sys.version_info >= (3, 11):
+    from typing import Self  # pragma: no cover
+else:
+    from typing_extensions import Self  # pragma: no cover
+
+
+class ContextScopeAlreadyEnteredError(AbstractSpakkyPodError):
+    message = "Context scope already entered"
+
+
+class ContextScope(IDisposable, IAsyncDisposable):
+    __variable: ContextVar["ContextScope | None"]
+    __logger: Logger
+    __token: Token["ContextScope | None"] | None
+    __id: UUID | None
+    instances: dict[str, object]
+
+    def __init__(
+        self,
+        variable: ContextVar["ContextScope | None"],
+        logger: Logger,
+    ) -> None:
+        self.__variable = variable
+        self.__logger = logger
+        self.__token = None
+        self.__id = None
+        self.instances = {}
+
+    @property
+    def id(self) -> UUID:
+        if self.__id is None:
+            self.__id = uuid4()
+        return self.__id
+
+    def __activate(self) -> None:
+        if self.__token is not None:
+            raise ContextScopeAlreadyEnteredError
+        self.__token = self.__variable.set(self)
+
+    def __deactivate(self) -> list[object]:
+        if self.__token is not None:
+            self.__variable.reset(self.__token)
+            self.__token = None
+        # Close in reverse creation order so dependents are released first
+        instances: list[object] = list(reversed(self.instances.values()))
+        self.instances.clear()
+        return instances
+
+    def __warn_not_closed(self, instance: object) -> None:
+        self.__logger.warning(
+            f"[{type(self).__name__}] {type(instance).__name__!r} "
+            "cannot be closed in a synchronous scope"
+        )
+
+    def __enter__(self) -> Self:
+        self.__activate()
+        return self
+
+    def __exit__(
+        self,
+        __exc_type: type[BaseException] | None,
+        __exc_value: BaseException | None,
+        __traceback: TracebackType | None,
+    ) -> bool | None:
+        error: Exception | None = None
+        for instance in self.__deactivate():
+            try:
+                # Context managers are driven by the application, only close() is ours
+                if isinstance(instance, ICloseable):
+                    if iscoroutine(result := instance.close()):
+                        # An asynchronous close() is discarded, never left unawaited
+                        result.close()
+                        self.__warn_not_closed(instance)
+                elif isinstance(instance, IAsyncCloseable):
+                    self.__warn_not_closed(instance)
+            except Exception as e:
+                self.__logger.exception(
+                    f"[{type(self).__name__}] Failed to close {type(instance).__name__!r}"
+                )
+                error = error or e
+        if error is not None and __exc_value is None:
+            raise error
+        return None
+
+    async def __aenter__(self) -> Self:
+        self.__activate()
+        return self
+
+    async def __aexit__(
+        self,
+        __exc_type: type[BaseException] | None,
+        __exc_value: BaseException | None,
+        __traceback: TracebackType | None,
+    ) -> bool | None:
+        error: Exception | None = None
+        for instance in self.__deactivate():
+            try:
+                if isinstance(instance, IAsyncCloseable):
+                    await instance.close_async()
+                elif isinstance(instance, ICloseable):
+                    if isawaitable(result := instance.close()):
+                        await result
+            except Exception as e:
+                self.__logger.exception(
+                    f"[{type(self).__name__}] Failed to close {type(instance).__name__!r}"
+                )
+                error = error or e
+        if error is not None and __exc_value is None:
+            raise error
+        return None
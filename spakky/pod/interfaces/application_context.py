@@ -1,11 +1,15 @@
 from abc import abstractmethod
-from asyncio import locks
-from threading import Event
-from typing import Protocol, runtime_checkable
+from concurrent.futures import Future
+from typing import Any, Coroutine, Protocol, TypeVar, runtime_checkable
 
 from spakky.application.error import AbstractSpakkyApplicationError
+from spakky.application.profiler import StartupProfiler
 from spakky.pod.interfaces.container import IContainer
 from spakky.service.interfaces.service import IAsyncService, IService
+from spakky.service.stop_event import TaskStopEvent, ThreadStopEvent
+from spakky.service.supervision import ServiceStatus
+
+T = TypeVar("T")
 
 
 class ApplicationContextAlreadyStartedError(AbstractSpakkyApplicationError):
@@ -28,18 +32,38 @@ class EventLoopThreadAlreadyStartedInApplicationContextError(
     message = "Event loop thread already started in application context"
 
 
+class ServiceStartTimeoutError(AbstractSpakkyApplicationError):
+    message = "Service did not start within the timeout"
+
+
+class ServiceStopTimeoutError(AbstractSpakkyApplicationError):
+    message = "Service did not stop within the timeout"
+
+
 @runtime_checkable
 class IApplicationContext(IContainer, Protocol):
-    thread_stop_event: Event
-    task_stop_event: locks.Event
+    thread_stop_event: ThreadStopEvent
+    task_stop_event: TaskStopEvent
+    profiler: StartupProfiler | None
 
     @property
     @abstractmethod
     def is_started(self) -> bool: ...
 
+    @property
+    @abstractmethod
+    def service_statuses(self) -> dict[str, ServiceStatus]: ...
+
     @abstractmethod
     def add_service(self, service: IService | IAsyncService) -> None: ...
 
+    @abstractmethod
+    def submit(
+        self,
+        coroutine: Coroutine[Any, Any, T],
+        loop: int | None = None,
+    ) -> Future[T]: ...
+
     @abstractmethod
     def start(self) -> None: ...
 
@@ -4,6 +4,7 @@ from uuid import UUID
 
 from spakky.core.types import ObjectT
 from spakky.pod.annotations.pod import Pod, PodType
+from spakky.pod.context_scope import ContextScope
 from spakky.pod.error import AbstractSpakkyPodError
 
 
@@ -27,6 +28,10 @@ class PodNameAlreadyExistsError(AbstractSpakkyPodError):
     message = "Pod name already exists"
 
 
+class ContextBoundPodNotContextScopedError(AbstractSpakkyPodError):
+    message = "Context-bound pods must use the context scope"
+
+
 @runtime_checkable
 class IContainer(Protocol):
     @property
@@ -69,6 +74,9 @@ class IContainer(Protocol):
     @abstractmethod
     def find(self, selector: Callable[[Pod], bool]) -> set[object]: ...
 
+    @abstractmethod
+    def scope(self) -> ContextScope: ...
+
     @abstractmethod
     def get_context_id(self) -> UUID: ...
 
@@ -0,0 +1,95 @@
+import json
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, ClassVar, Iterable, Mapping
+
+from spakky.core.reference import CannotReferenceObjectError, get_reference_key
+from spakky.pod.annotations.pod import Pod, PodRecord
+from spakky.pod.error import AbstractSpakkyPodError
+
+if sys.version_info >= (3, 11):
+    from typing import Self  # pragma: no cover
+else:
+    from typing_extensions import Self  # pragma: no cover
+
+
+class IncompatiblePodSnapshotError(AbstractSpakkyPodError):
+    message = "Pod snapshot was built by an incompatible runtime"
+
+
+def get_runtime_version() -> str:
+    return f"{sys.version_info.major}.{sys.version_info.minor}"
+
+
+@dataclass
+class PodSnapshot:
+    FORMAT_VERSION: ClassVar[int] = 3
+
+    records: dict[str, PodRecord] = field(default_factory=dict[str, PodRecord])
+    aspect_matches: dict[str, list[str]] = field(default_factory=dict[str, list[str]])
+    # Matches are only reused while the aspects and the matched pods are unchanged
+    aspect_fingerprints: dict[str, str] = field(default_factory=dict[str, str])
+    match_fingerprints: dict[str, str] = field(default_factory=dict[str, str])
+
+    @classmethod
+    def capture(
+        cls,
+        pods: Iterable[Pod],
+        aspect_matches: Mapping[str, list[str]] | None = None,
+        aspect_fingerprints: Mapping[str, str] | None = None,
+        match_fingerprints: Mapping[str, str] | None = None,
+    ) -> Self:
+        records: dict[str, PodRecord] = {}
+        for pod in pods:
+            try:
+                records[get_reference_key(pod.target)] = pod.to_record()
+            except CannotReferenceObjectError:
+                # Pods that cannot be referenced by import path (local classes,
+                # lambda qualifiers, etc.) are still introspected at boot
+                continue
+        return cls(
+            records=records,
+            aspect_matches=dict(aspect_matches or {}),
+            aspect_fingerprints=dict(aspect_fingerprints or {}),
+            match_fingerprints=dict(match_fingerprints or {}),
+        )
+
+    def activate(self) -> None:
+        Pod.load_records(self.records)
+
+    def deactivate(self) -> None:
+        Pod.unload_records(self.records)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "format": self.FORMAT_VERSION,
+            "runtime": get_runtime_version(),
+            "records": {key: asdict(record) for key, record in self.records.items()},
+            "aspect_matches": self.aspect_matches,
+            "aspect_fingerprints": self.aspect_fingerprints,
+            "match_fingerprints": self.match_fingerprints,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> Self:
+        if (
+            data.get("format") != cls.FORMAT_VERSION
+            or data.get("runtime") != get_runtime_version()
+        ):
+            raise IncompatiblePodSnapshotError(data.get("format"), data.get("runtime"))
+        return cls(
+            records={
+                key: PodRecord(**record) for key, record in data["records"].items()
+            },
+            aspect_matches=dict(data["aspect_matches"]),
+            aspect_fingerprints=dict(data["aspect_fingerprints"]),
+            match_fingerprints=dict(data["match_fingerprints"]),
+        )
+
+    def save(self, path: str | Path) -> None:
+        Path(path).write_text(json.dumps(self.to_dict()), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: str | Path) -> Self:
+        return cls.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
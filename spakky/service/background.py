@@ -1,22 +1,77 @@
 from abc import ABC, abstractmethod
 from asyncio import locks, tasks
+from asyncio.exceptions import TimeoutError as AsyncTimeoutError
+from dataclasses import replace
+from logging import Logger, getLogger
 from threading import Event as ThreadEvent
 from threading import Thread
+from typing import Any, Coroutine, TypeVar
 
+from spakky.pod.interfaces.aware.logger_aware import ILoggerAware
 from spakky.service.interfaces.service import IAsyncService, IService
+from spakky.service.supervision import (
+    UNSUPERVISED,
+    ServiceState,
+    ServiceStatus,
+    Supervised,
+)
 
+T = TypeVar("T")
 
-class AbstractBackgroundService(IService, ABC):
+
+class AbstractBackgroundService(IService, ILoggerAware, ABC):
     _thread: Thread | None
     _stop_event: ThreadEvent
+    _logger: Logger = getLogger()
+    _status: ServiceStatus | None = None
+
+    @property
+    def status(self) -> ServiceStatus:
+        if self._status is None:
+            return ServiceStatus(type(self).__name__)
+        return replace(self._status)
+
+    def set_logger(self, logger: Logger) -> None:
+        self._logger = logger
 
     def set_stop_event(self, stop_event: ThreadEvent) -> None:
         self._stop_event = stop_event
 
+    def __supervise(self, status: ServiceStatus) -> None:
+        policy: Supervised = Supervised.get_or_default(self, UNSUPERVISED)
+        while True:
+            try:
+                if status.restart_count > 0:
+                    self.dispose()
+                    self.initialize()
+                status.state = ServiceState.RUNNING
+                self.run()
+                return
+            except Exception as e:
+                status.last_error = e
+                self._logger.exception(
+                    f"[{type(self).__name__}] crashed ({status.restart_count}/{policy.max_restarts} restarts)"
+                )
+                if self._stop_event.is_set():
+                    return
+                if status.restart_count >= policy.max_restarts:
+                    status.state = ServiceState.FAILED
+                    return
+                status.state = ServiceState.RESTARTING
+                if self._stop_event.wait(policy.delay(status.restart_count)):
+                    return
+                status.restart_count += 1
+
     def start(self) -> None:
         self._stop_event.clear()
+        self._status = ServiceStatus(type(self).__name__, ServiceState.RUNNING)
         self.initialize()
-        self._thread = Thread(target=self.run, daemon=True, name=type(self).__name__)
+        self._thread = Thread(
+            target=self.__supervise,
+            args=(self._status,),
+            daemon=True,
+            name=type(self).__name__,
+        )
         self._thread.start()
 
     def stop(self) -> None:
@@ -24,6 +79,12 @@ class AbstractBackgroundService(IService, ABC):
         if self._thread:
             self._thread.join()
         self.dispose()
+        if self._status is not None and self._status.state != ServiceState.FAILED:
+            self._status.state = ServiceState.STOPPED
+
+    def restart(self) -> None:
+        self.stop()
+        self.start()
 
     @abstractmethod
     def initialize(self) -> None: ...
@@ -35,23 +96,93 @@ class AbstractBackgroundService(IService, ABC):
     def run(self) -> None: ...
 
 
-class AbstractAsyncBackgroundService(IAsyncService, ABC):
+class AbstractAsyncBackgroundService(IAsyncService, ILoggerAware, ABC):
     _task: tasks.Task[None] | None
     _stop_event: locks.Event
+    _tasks: set[tasks.Task[Any]]
+    _logger: Logger = getLogger()
+    _status: ServiceStatus | None = None
+
+    @property
+    def status(self) -> ServiceStatus:
+        if self._status is None:
+            return ServiceStatus(type(self).__name__)
+        return replace(self._status)
+
+    def set_logger(self, logger: Logger) -> None:
+        self._logger = logger
 
     def set_stop_event(self, stop_event: locks.Event) -> None:
         self._stop_event = stop_event
 
+    def create_task(
+        self,
+        coroutine: Coroutine[Any, Any, T],
+        name: str | None = None,
+    ) -> tasks.Task[T]:
+        # Tasks created here are cancelled when the service stops
+        task: tasks.Task[T] = tasks.create_task(coroutine, name=name)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def __wait_for_stop(self, delay: float) -> bool:
+        try:
+            await tasks.wait_for(self._stop_event.wait(), delay)
+        except AsyncTimeoutError:
+            return False
+        return True
+
+    async def __supervise_async(self, status: ServiceStatus) -> None:
+        policy: Supervised = Supervised.get_or_default(self, UNSUPERVISED)
+        while True:
+            try:
+                if status.restart_count > 0:
+                    await self.dispose_async()
+                    await self.initialize_async()
+                status.state = ServiceState.RUNNING
+                await self.run_async()
+                return
+            except Exception as e:
+                status.last_error = e
+                self._logger.exception(
+                    f"[{type(self).__name__}] crashed ({status.restart_count}/{policy.max_restarts} restarts)"
+                )
+                if self._stop_event.is_set():
+                    return
+                if status.restart_count >= policy.max_restarts:
+                    status.state = ServiceState.FAILED
+                    return
+                status.state = ServiceState.RESTARTING
+                if await self.__wait_for_stop(policy.delay(status.restart_count)):
+                    return
+                status.restart_count += 1
+
     async def start_async(self) -> None:
         self._stop_event.clear()
+        self._tasks = set()
+        self._status = ServiceStatus(type(self).__name__, ServiceState.RUNNING)
         await self.initialize_async()
-        self._task = tasks.create_task(coro=self.run_async(), name=type(self).__name__)
+        self._task = tasks.create_task(
+            coro=self.__supervise_async(self._status),
+            name=type(self).__name__,
+        )
 
     async def stop_async(self) -> None:
         self._stop_event.set()
         if self._task:
             await self._task
+        children: list[tasks.Task[Any]] = list(self._tasks)
+        for child in children:
+            child.cancel()
+        await tasks.gather(*children, return_exceptions=True)
         await self.dispose_async()
+        if self._status is not None and self._status.state != ServiceState.FAILED:
+            self._status.state = ServiceState.STOPPED
+
+    async def restart_async(self) -> None:
+        await self.stop_async()
+        await self.start_async()
 
     @abstractmethod
     async def initialize_async(self) -> None: ...
@@ -0,0 +1,106 @@
+from datetime import datetime, timedelta
+
+from spakky.service.error import AbstractSpakkyServiceError
+
+FIELD_RANGES: tuple[tuple[int, int], ...] = (
+    (0, 59),  # minute
+    (0, 23),  # hour
+    (1, 31),  # day of month
+    (1, 12),  # month
+    (0, 7),  # day of week, both 0 and 7 are Sunday
+)
+MAX_SEARCH_YEARS = 5
+
+
+class InvalidCronExpressionError(AbstractSpakkyServiceError):
+    message = "Invalid cron expression"
+
+
+def _parse_field(field: str, minimum: int, maximum: int) -> frozenset[int]:
+    values: set[int] = set()
+    for part in field.split(","):
+        step: int = 1
+        if "/" in part:
+            part, raw_step = part.split("/", 1)
+            step = int(raw_step)
+            if step < 1:
+                raise ValueError(step)
+        if part == "*":
+            start, end = minimum, maximum
+        elif "-" in part:
+            raw_start, raw_end = part.split("-", 1)
+            start, end = int(raw_start), int(raw_end)
+        else:
+            start = int(part)
+            end = maximum if step > 1 else start
+        if start < minimum or end > maximum or start > end:
+            raise ValueError(part)
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+class CronExpression:
+    __expression: str
+    __minutes: frozenset[int]
+    __hours: frozenset[int]
+    __days: frozenset[int]
+    __months: frozenset[int]
+    __weekdays: frozenset[int]
+    __is_day_restricted: bool
+    __is_weekday_restricted: bool
+
+    def __init__(self, expression: str) -> None:
+        fields: list[str] = expression.split()
+        if len(fields) != len(FIELD_RANGES):
+            raise InvalidCronExpressionError(expression)
+        try:
+            (
+                self.__minutes,
+                self.__hours,
+                self.__days,
+                self.__months,
+                self.__weekdays,
+            ) = (
+                _parse_field(field, minimum, maximum)
+                for field, (minimum, maximum) in zip(fields, FIELD_RANGES)
+            )
+        except ValueError as e:
+            raise InvalidCronExpressionError(expression) from e
+        self.__weekdays = frozenset(x % 7 for x in self.__weekdays)
+        self.__expression = expression
+        self.__is_day_restricted = not fields[2].startswith("*")
+        self.__is_weekday_restricted = not fields[4].startswith("*")
+
+    def __repr__(self) -> str:
+        return f"CronExpression({self.__expression!r})"
+
+    def __matches_day(self, moment: datetime) -> bool:
+        day: bool = moment.day in self.__days
+        weekday: bool = (moment.weekday() + 1) % 7 in self.__weekdays
+        if self.__is_day_restricted and self.__is_weekday_restricted:
+            # Standard cron semantics: either restricted day field may match
+            return day or weekday
+        return day and weekday
+
+    def next_after(self, moment: datetime) -> datetime:
+        candidate: datetime = moment.replace(second=0, microsecond=0) + timedelta(
+            minutes=1
+        )
+        limit: int = candidate.year + MAX_SEARCH_YEARS
+        while candidate.year <= limit:
+            if candidate.month not in self.__months:
+                candidate = (candidate.replace(day=1) + timedelta(days=32)).replace(
+                    day=1, hour=0, minute=0
+                )
+                continue
+            if not self.__matches_day(candidate):
+                candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0)
+                continue
+            if candidate.hour not in self.__hours:
+                candidate = (candidate + timedelta(hours=1)).replace(minute=0)
+                continue
+            if candidate.minute not in self.__minutes:
+                candidate += timedelta(minutes=1)
+                continue
+            return candidate
+        raise InvalidCronExpressionError(self.__expression)
@@ -0,0 +1,6 @@
+from abc import ABC
+
+from spakky.core.error import AbstractSpakkyCoreError
+
+
+class AbstractSpakkyServiceError(AbstractSpakkyCoreError, ABC): ...
@@ -3,6 +3,8 @@ from asyncio import locks
 from threading import Event
 from typing import Protocol, runtime_checkable
 
+from spakky.service.supervision import ServiceStatus
+
 
 @runtime_checkable
 class IService(Protocol):
@@ -26,3 +28,10 @@ class IAsyncService(Protocol):
 
     @abstractmethod
     async def stop_async(self) -> None: ...
+
+
+@runtime_checkable
+class ISupervisedService(Protocol):
+    @property
+    @abstractmethod
+    def status(self) -> ServiceStatus: ...
@@ -1,15 +1,19 @@
 from logging import Logger
 
+from spakky.pod.annotations.lazy import Lazy
 from spakky.pod.annotations.pod import Pod
 from spakky.pod.interfaces.application_context import IApplicationContext
 from spakky.pod.interfaces.post_processor import IPostProcessor
 from spakky.service.interfaces.service import IAsyncService, IService
+from spakky.service.scheduled import get_scheduled_methods
+from spakky.service.scheduler import ScheduledJob, Scheduler
 
 
 @Pod()
 class ServicePostProcessor(IPostProcessor):
     __application_context: IApplicationContext
     __logger: Logger
+    __scheduler: Scheduler | None
 
     def __init__(
         self, application_context: IApplicationContext, logger: Logger
@@ -17,18 +21,45 @@ class ServicePostProcessor(IPostProcessor):
         super().__init__()
         self.__application_context = application_context
         self.__logger = logger
+        self.__scheduler = None
+        if any(
+            Lazy.exists(pod.target) and get_scheduled_methods(pod.type_)
+            for pod in application_context.pods.values()
+        ):
+            # Lazy pods may be created after services started, so the scheduler
+            # they need is registered before the context starts its services
+            self.__get_scheduler()
+
+    def __get_scheduler(self) -> Scheduler:
+        if self.__scheduler is None:
+            # Scheduler is registered only when a scheduled method exists
+            self.__scheduler = Scheduler(self.__logger)
+            self.__application_context.add_service(self.__scheduler)
+        return self.__scheduler
 
     def post_process(self, pod: object) -> object:
         if isinstance(pod, IService):
-            pod.set_stop_event(self.__application_context.thread_stop_event)
+            # Each service gets its own event derived from the context-level one
+            pod.set_stop_event(self.__application_context.thread_stop_event.spawn())
             self.__application_context.add_service(pod)
             self.__logger.debug(
                 (f"[{type(self).__name__}] {type(pod).__name__!r} added to container")
             )
         if isinstance(pod, IAsyncService):
-            pod.set_stop_event(self.__application_context.task_stop_event)
             self.__application_context.add_service(pod)
             self.__logger.debug(
                 (f"[{type(self).__name__}] {type(pod).__name__!r} added to container")
             )
+        # Only singletons get here once, other scopes are rejected on registration
+        for name, scheduled in get_scheduled_methods(type(pod)):
+            self.__get_scheduler().add_job(
+                ScheduledJob(
+                    name=f"{type(pod).__name__}.{name}",
+                    method=getattr(pod, name),
+                    scheduled=scheduled,
+                )
+            )
+            self.__logger.debug(
+                (f"[{type(self).__name__}] {type(pod).__name__}.{name!r} scheduled")
+            )
         return pod
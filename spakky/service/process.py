@@ -0,0 +1,186 @@
+import multiprocessing
+import os
+import time
+from abc import ABC, abstractmethod
+from ctypes import Array, c_double
+from dataclasses import dataclass
+from multiprocessing.context import BaseContext
+from multiprocessing.process import BaseProcess
+from multiprocessing.synchronize import Event as ProcessEvent
+from threading import Event as ThreadEvent
+from threading import Thread
+from typing import ClassVar
+
+from spakky.application.application import SpakkyApplication
+from spakky.service.interfaces.service import IService
+
+HEARTBEAT_MISSING = 0.0
+
+_current_worker_index: int | None = None
+
+
+def get_worker_index() -> int | None:
+    return _current_worker_index
+
+
+def _set_worker_index(index: int) -> None:
+    global _current_worker_index
+    _current_worker_index = index
+
+
+@dataclass(frozen=True)
+class WorkerHealth:
+    index: int
+    pid: int | None
+    is_alive: bool
+    exitcode: int | None
+    last_heartbeat: float | None
+
+
+def _run_worker(
+    service_type: "type[AbstractProcessBackgroundService]",
+    index: int,
+    stop_event: ProcessEvent,
+    heartbeats: "Array[c_double]",
+) -> None:
+    # Services started by the worker's own context must not fork again
+    _set_worker_index(index)
+    application: SpakkyApplication = service_type.create_application().start()
+    try:
+        service: AbstractProcessBackgroundService = application.container.get(
+            service_type
+        )
+        service._attach_worker(index, stop_event, heartbeats)
+        service.initialize()
+        try:
+            service.heartbeat()
+            service.run()
+        finally:
+            service.dispose()
+    finally:
+        application.stop()
+
+
+class AbstractProcessBackgroundService(IService, ABC):
+    worker_count: ClassVar[int] = os.cpu_count() or 1
+    # Forking a process that already runs threads can copy held locks into the
+    # child, so fork is opt-in and service types must be importable by default
+    start_method: ClassVar[str] = "spawn"
+    stop_timeout: ClassVar[float | None] = 10.0
+
+    _stop_event: ThreadEvent | ProcessEvent
+    _worker_index: int | None = None
+    _heartbeats: "Array[c_double] | None" = None
+    __processes: tuple[BaseProcess, ...] = ()
+    __process_stop_event: ProcessEvent | None = None
+    __propagator: Thread | None = None
+
+    @classmethod
+    @abstractmethod
+    def create_application(cls) -> SpakkyApplication: ...
+
+    def __propagate_stop(self, stop_event: ThreadEvent, target: ProcessEvent) -> None:
+        stop_event.wait()
+        target.set()
+
+    def _attach_worker(
+        self,
+        index: int,
+        stop_event: ProcessEvent,
+        heartbeats: "Array[c_double]",
+    ) -> None:
+        self._worker_index = index
+        self._stop_event = stop_event
+        self._heartbeats = heartbeats
+
+    @property
+    def worker_index(self) -> int | None:
+        return self._worker_index
+
+    def set_stop_event(self, stop_event: ThreadEvent) -> None:
+        if self._worker_index is None:
+            self._stop_event = stop_event
+
+    def heartbeat(self) -> None:
+        if self._heartbeats is not None and self._worker_index is not None:
+            self._heartbeats[self._worker_index] = time.time()
+
+    def start(self) -> None:
+        if get_worker_index() is not None:
+            # Inside a worker process this service is driven by the worker itself
+            return
+        context: BaseContext = multiprocessing.get_context(self.start_method)
+        self._stop_event.clear()
+        self.__process_stop_event = context.Event()
+        self._heartbeats = context.Array("d", self.worker_count, lock=False)
+        self.__processes = tuple(
+            context.Process(
+                target=_run_worker,
+                args=(type(self), index, self.__process_stop_event, self._heartbeats),
+                daemon=True,
+                name=f"{type(self).__name__}-{index}",
+            )
+            for index in range(self.worker_count)
+        )
+        for process in self.__processes:
+            process.start()
+        self.__propagator = Thread(
+            target=self.__propagate_stop,
+            args=(self._stop_event, self.__process_stop_event),
+            daemon=True,
+            name=f"{type(self).__name__}-stop",
+        )
+        self.__propagator.start()
+
+    def stop(self) -> None:
+        if get_worker_index() is not None:
+            return
+        self._stop_event.set()
+        if self.__process_stop_event is not None:
+            self.__process_stop_event.set()
+        for process in self.__processes:
+            process.join(self.stop_timeout)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        if self.__propagator is not None:
+            self.__propagator.join()
+            self.__propagator = None
+
+    def health(self) -> list[WorkerHealth]:
+        return [
+            WorkerHealth(
+                index=index,
+                pid=process.pid,
+                is_alive=process.is_alive(),
+                exitcode=process.exitcode,
+                last_heartbeat=self._heartbeats[index]
+                if self._heartbeats is not None
+                and self._heartbeats[index] != HEARTBEAT_MISSING
+                else None,
+            )
+            for index, process in enumerate(self.__processes)
+        ]
+
+    def is_healthy(self, max_heartbeat_age: float | None = None) -> bool:
+        now: float = time.time()
+        return all(
+            worker.is_alive
+            and (
+                max_heartbeat_age is None
+                or (
+                    worker.last_heartbeat is not None
+                    and now - worker.last_heartbeat <= max_heartbeat_age
+                )
+            )
+            for worker in self.health()
+        )
+
+    @abstractmethod
+    def initialize(self) -> None: ...
+
+    @abstractmethod
+    def dispose(self) -> None: ...
+
+    @abstractmethod
+    def run(self) -> None: ...
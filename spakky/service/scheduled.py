@@ -0,0 +1,92 @@
+from abc import abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from inspect import getmembers, isfunction
+from typing import Protocol, runtime_checkable
+
+from spakky.core.annotation import FunctionAnnotation
+from spakky.service.cron import CronExpression
+from spakky.service.error import AbstractSpakkyServiceError
+
+
+class ScheduledPodNotSingletonError(AbstractSpakkyServiceError):
+    message = "Scheduled methods are only allowed on singleton pods"
+
+
+@runtime_checkable
+class ITrigger(Protocol):
+    @abstractmethod
+    def next(self, previous: float | None, now: float) -> float: ...
+
+
+class IntervalTrigger(ITrigger):
+    __interval: float
+
+    def __init__(self, interval: float) -> None:
+        self.__interval = interval
+
+    def next(self, previous: float | None, now: float) -> float:
+        if previous is None:
+            return now + self.__interval
+        # Anchored to the previous schedule instead of the end of the last run,
+        # so execution time does not accumulate as drift
+        next_run: float = previous + self.__interval
+        if next_run <= now:
+            # Runs that were missed while the job was still executing are skipped
+            missed: int = int((now - next_run) // self.__interval) + 1
+            next_run += missed * self.__interval
+        return next_run
+
+
+class CronTrigger(ITrigger):
+    __expression: CronExpression
+    __last: datetime | None
+
+    def __init__(self, expression: CronExpression) -> None:
+        self.__expression = expression
+        self.__last = None
+
+    def next(self, previous: float | None, now: float) -> float:
+        wall: datetime = datetime.now()
+        # Timers may fire slightly early, never schedule the same minute twice
+        base: datetime = wall if self.__last is None else max(wall, self.__last)
+        self.__last = self.__expression.next_after(base)
+        return now + (self.__last - wall).total_seconds()
+
+
+@dataclass
+class Scheduled(FunctionAnnotation):
+    interval: float | timedelta | None = field(default=None)
+    cron: str | None = field(default=None)
+    jitter: float = field(default=0)
+
+    def __post_init__(self) -> None:
+        if (self.interval is None) == (self.cron is None):
+            raise ValueError("Exactly one of interval or cron must be specified")
+        if self.seconds is not None and self.seconds <= 0:
+            raise ValueError("Interval must be positive")
+        if self.jitter < 0:
+            raise ValueError("Jitter cannot be negative")
+        if self.cron is not None:
+            # Fail on decoration rather than when the scheduler starts
+            CronExpression(self.cron)
+
+    @property
+    def seconds(self) -> float | None:
+        if isinstance(self.interval, timedelta):
+            return self.interval.total_seconds()
+        return self.interval
+
+    def create_trigger(self) -> ITrigger:
+        if self.cron is not None:
+            return CronTrigger(CronExpression(self.cron))
+        return IntervalTrigger(self.seconds or 0)
+
+
+def get_scheduled_methods(type_: type) -> list[tuple[str, Scheduled]]:
+    # Inspect the class so instance properties are never evaluated
+    return [
+        (name, scheduled)
+        for name, function in getmembers(type_, isfunction)
+        if (scheduled := Scheduled.get_or_none(function)) is not None
+    ]
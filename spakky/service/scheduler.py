@@ -0,0 +1,99 @@
+from asyncio import AbstractEventLoop, get_running_loop, tasks
+from asyncio.exceptions import TimeoutError as AsyncTimeoutError
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from dataclasses import dataclass
+from inspect import iscoroutinefunction
+from logging import Logger
+from random import uniform
+from typing import Any, Callable
+
+from spakky.service.background import AbstractAsyncBackgroundService
+from spakky.service.scheduled import ITrigger, Scheduled
+
+
+@dataclass
+class ScheduledJob:
+    name: str
+    method: Callable[[], Any]
+    scheduled: Scheduled
+
+
+class Scheduler(AbstractAsyncBackgroundService):
+    __jobs: list[ScheduledJob]
+    __max_workers: int | None
+    __executor: ThreadPoolExecutor | None
+    __loop: AbstractEventLoop | None
+
+    def __init__(self, logger: Logger, max_workers: int | None = None) -> None:
+        self.set_logger(logger)
+        self.__jobs = []
+        self.__max_workers = max_workers
+        self.__executor = None
+        self.__loop = None
+
+    @property
+    def jobs(self) -> list[ScheduledJob]:
+        return list(self.__jobs)
+
+    def add_job(self, job: ScheduledJob) -> None:
+        self.__jobs.append(job)
+        if self.__loop is not None:
+            # Jobs of lazily created pods join the running scheduler
+            self.__loop.call_soon_threadsafe(self.__spawn, job)
+
+    def __spawn(self, job: ScheduledJob) -> None:
+        self.create_task(self.__run_job(job), name=job.name)
+
+    async def __wait_for_stop(self, delay: float) -> bool:
+        try:
+            await tasks.wait_for(self._stop_event.wait(), max(delay, 0))
+        except AsyncTimeoutError:
+            return False
+        return True
+
+    async def __execute(self, job: ScheduledJob) -> None:
+        try:
+            if iscoroutinefunction(job.method):
+                await job.method()
+                return
+            await get_running_loop().run_in_executor(
+                self.__executor,
+                copy_context().run,
+                job.method,
+            )
+        except Exception:
+            self._logger.exception(f"[{type(self).__name__}] {job.name!r} failed")
+
+    async def __run_job(self, job: ScheduledJob) -> None:
+        loop: AbstractEventLoop = get_running_loop()
+        trigger: ITrigger = job.scheduled.create_trigger()
+        next_run: float = trigger.next(None, loop.time())
+        while not self._stop_event.is_set():
+            # Jitter delays a single run and never shifts the schedule itself
+            delay: float = next_run - loop.time() + uniform(0, job.scheduled.jitter)
+            if await self.__wait_for_stop(delay):
+                break
+            # Runs are awaited in place, so a job never overlaps with itself
+            await self.__execute(job)
+            next_run = trigger.next(next_run, loop.time())
+
+    async def initialize_async(self) -> None:
+        self.__loop = get_running_loop()
+        self.__executor = ThreadPoolExecutor(
+            max_workers=self.__max_workers,
+            thread_name_prefix=type(self).__name__,
+        )
+
+    async def dispose_async(self) -> None:
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=False, cancel_futures=True)
+            self.__executor = None
+
+    async def run_async(self) -> None:
+        for job in self.__jobs:
+            self.__spawn(job)
+        await self._stop_event.wait()
+        self.__loop = None
+        # Let running jobs finish, leftovers are cancelled by stop_async
+        await tasks.gather(*self._tasks, return_exceptions=True)
@@ -0,0 +1,62 @@
+import threading
+from asyncio import locks
+from weakref import WeakSet
+
+
+class ThreadStopEvent(threading.Event):
+    __parent: "ThreadStopEvent | None"
+    __children: "WeakSet[ThreadStopEvent]"
+    __lock: threading.Lock
+
+    def __init__(self, parent: "ThreadStopEvent | None" = None) -> None:
+        super().__init__()
+        self.__parent = parent
+        self.__children = WeakSet()
+        self.__lock = threading.Lock()
+
+    @property
+    def parent(self) -> "ThreadStopEvent | None":
+        return self.__parent
+
+    def spawn(self) -> "ThreadStopEvent":
+        child = ThreadStopEvent(self)
+        with self.__lock:
+            self.__children.add(child)
+        if self.is_set():
+            child.set()
+        return child
+
+    def set(self) -> None:
+        # Setting a parent stops every derived event, clearing never propagates
+        super().set()
+        with self.__lock:
+            children: list[ThreadStopEvent] = list(self.__children)
+        for child in children:
+            child.set()
+
+
+class TaskStopEvent(locks.Event):
+    __parent: "TaskStopEvent | None"
+    __children: "WeakSet[TaskStopEvent]"
+
+    def __init__(self, parent: "TaskStopEvent | None" = None) -> None:
+        super().__init__()
+        self.__parent = parent
+        self.__children = WeakSet()
+
+    @property
+    def parent(self) -> "TaskStopEvent | None":
+        return self.__parent
+
+    def spawn(self) -> "TaskStopEvent":
+        child = TaskStopEvent(self)
+        self.__children.add(child)
+        if self.is_set():
+            child.set()
+        return child
+
+    def set(self) -> None:
+        # Setting a parent stops every derived event, clearing never propagates
+        super().set()
+        for child in list(self.__children):
+            child.set()
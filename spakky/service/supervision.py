@@ -0,0 +1,42 @@
+from dataclasses import dataclass, field
+from enum import Enum
+
+from spakky.core.annotation import ClassAnnotation
+
+
+class ServiceState(str, Enum):
+    STOPPED = "stopped"
+    RUNNING = "running"
+    RESTARTING = "restarting"
+    FAILED = "failed"
+
+
+@dataclass
+class ServiceStatus:
+    name: str
+    state: ServiceState = ServiceState.STOPPED
+    restart_count: int = 0
+    last_error: BaseException | None = None
+
+
+@dataclass
+class Supervised(ClassAnnotation):
+    max_restarts: int = field(default=3)
+    backoff: float = field(default=1.0)
+    multiplier: float = field(default=2.0)
+    max_backoff: float = field(default=30.0)
+
+    def __post_init__(self) -> None:
+        if self.max_restarts < 0:
+            raise ValueError("max_restarts cannot be negative")
+        if self.backoff < 0 or self.max_backoff < 0:
+            raise ValueError("Backoff cannot be negative")
+        if self.multiplier < 1:
+            raise ValueError("Multiplier must be at least 1")
+
+    def delay(self, attempt: int) -> float:
+        return min(self.backoff * self.multiplier**attempt, self.max_backoff)
+
+
+# Unsupervised services are never restarted, their crashes are still reported
+UNSUPERVISED = Supervised(max_restarts=0)
@@ -1,4 +1,5 @@
 from spakky.application.application import SpakkyApplication
+from spakky.domain.ports.pagination import iter_chunks
 from tests.application.apps.adapter.api.users import UserController
 from tests.application.apps.domain.port.repository.user import IUserRepository
 
@@ -17,3 +18,5 @@ def test_spakky_application(application: SpakkyApplication) -> None:
     assert user.email == "email@test.com"
     assert user.password == "password"
     assert user.username == "username"
+
+    assert list(iter_chunks(repository.range, [user_id])) == [user]
@@ -1,6 +1,8 @@
 import asyncio
+import threading
 from abc import abstractmethod
 from dataclasses import dataclass
+from time import perf_counter, sleep
 from typing import Annotated, Any, Protocol, runtime_checkable
 from uuid import UUID, uuid4
 
@@ -16,9 +18,11 @@ from spakky.core.annotation import ClassAnnotation
 from spakky.core.mutability import immutable
 from spakky.domain.usecases.command import AbstractCommand, ICommandUseCase
 from spakky.pod.annotations.lazy import Lazy
+from spakky.pod.annotations.order import Order
 from spakky.pod.annotations.pod import Pod, PodInstantiationFailedError
 from spakky.pod.annotations.primary import Primary
 from spakky.pod.annotations.qualifier import Qualifier
+from spakky.pod.interfaces.application_context import ServiceStartTimeoutError
 from spakky.pod.interfaces.container import CannotRegisterNonPodObjectError
 
 
@@ -691,3 +695,116 @@ async def test_application_context_get_context_id() -> None:
 
     await asyncio.gather(*(task_logic() for _ in range(5)))
     assert len(set(results)) == 5
+
+
+def test_application_context_starts_services_concurrently_in_order() -> None:
+    events: list[str] = []
+    lock = threading.Lock()
+
+    class RecordingService:
+        delay: float = 0.2
+
+        def set_stop_event(self, stop_event: threading.Event) -> None:
+            return
+
+        def start(self) -> None:
+            sleep(self.delay)
+            with lock:
+                events.append(f"start:{type(self).__name__}")
+
+        def stop(self) -> None:
+            with lock:
+                events.append(f"stop:{type(self).__name__}")
+
+    class RecordingAsyncService:
+        def set_stop_event(self, stop_event: asyncio.locks.Event) -> None:
+            return
+
+        async def start_async(self) -> None:
+            await asyncio.sleep(0.2)
+            events.append(f"start:{type(self).__name__}")
+
+        async def stop_async(self) -> None:
+            events.append(f"stop:{type(self).__name__}")
+
+    @Order(0)
+    @Pod()
+    class Database(RecordingService): ...
+
+    @Order(1)
+    @Pod()
+    class FirstWorker(RecordingService): ...
+
+    @Order(1)
+    @Pod()
+    class SecondWorker(RecordingService): ...
+
+    @Order(1)
+    @Pod()
+    class AsyncWorker(RecordingAsyncService): ...
+
+    context = ApplicationContext()
+    context.add(SecondWorker)
+    context.add(Database)
+    context.add(FirstWorker)
+    context.add(AsyncWorker)
+
+    started = perf_counter()
+    context.start()
+    elapsed = perf_counter() - started
+
+    # Workers in the same group warm up together after the database
+    assert elapsed < 0.6
+    assert events[0] == "start:Database"
+    assert set(events[1:]) == {
+        "start:FirstWorker",
+        "start:SecondWorker",
+        "start:AsyncWorker",
+    }
+
+    events.clear()
+    context.stop()
+    assert events[-1] == "stop:Database"
+    assert set(events[:-1]) == {
+        "stop:FirstWorker",
+        "stop:SecondWorker",
+        "stop:AsyncWorker",
+    }
+
+
+def test_application_context_service_timeouts() -> None:
+    @Pod()
+    class SlowAsyncService:
+        def set_stop_event(self, stop_event: asyncio.locks.Event) -> None:
+            return
+
+        async def start_async(self) -> None:
+            return
+
+        async def stop_async(self) -> None:
+            await asyncio.sleep(10)
+
+    context = ApplicationContext(service_stop_timeout=0.1)
+    context.add(SlowAsyncService)
+    context.start()
+
+    started = perf_counter()
+    context.stop()
+    assert perf_counter() - started < 5
+
+    @Pod()
+    class SlowService:
+        def set_stop_event(self, stop_event: threading.Event) -> None:
+            return
+
+        def start(self) -> None:
+            sleep(0.5)
+
+        def stop(self) -> None:
+            return
+
+    context = ApplicationContext(service_start_timeout=0.1)
+    context.add(SlowService)
+    with pytest.raises(ServiceStartTimeoutError):
+        context.start()
+    context.stop()
@@ -0,0 +1,80 @@
+import asyncio
+import threading
+
+import pytest
+
+from spakky.application.application_context import ApplicationContext
+from spakky.application.event_loop import EventLoopThread
+from spakky.pod.annotations.pod import Pod
+from spakky.pod.interfaces.application_context import (
+    EventLoopThreadAlreadyStartedInApplicationContextError,
+    EventLoopThreadNotStartedInApplicationContextError,
+)
+from spakky.service.background import AbstractAsyncBackgroundService
+
+
+def test_async_services_distributed_across_event_loops() -> None:
+    threads: dict[str, str] = {}
+
+    class ThreadRecordingService(AbstractAsyncBackgroundService):
+        async def initialize_async(self) -> None:
+            threads[type(self).__name__] = threading.current_thread().name
+
+        async def dispose_async(self) -> None:
+            return
+
+        async def run_async(self) -> None:
+            await self._stop_event.wait()
+
+    @Pod()
+    class FirstConsumer(ThreadRecordingService): ...
+
+    @Pod()
+    class SecondConsumer(ThreadRecordingService): ...
+
+    context = ApplicationContext(event_loop_count=2)
+    context.add(FirstConsumer)
+    context.add(SecondConsumer)
+    context.start()
+
+    assert set(threads) == {"FirstConsumer", "SecondConsumer"}
+    assert threads["FirstConsumer"] != threads["SecondConsumer"]
+    context.stop()
+
+
+def test_submit_coroutine_to_event_loops() -> None:
+    async def current_thread_name() -> str:
+        await asyncio.sleep(0)
+        return threading.current_thread().name
+
+    context = ApplicationContext(event_loop_count=2)
+    with pytest.raises(EventLoopThreadNotStartedInApplicationContextError):
+        context.submit(current_thread_name())
+    context.start()
+
+    first = context.submit(current_thread_name(), loop=0).result()
+    second = context.submit(current_thread_name(), loop=1).result()
+    assert first != second
+    assert context.submit(current_thread_name()).result() in {first, second}
+    context.stop()
+
+
+def test_event_loop_thread_lifecycle() -> None:
+    event_loop = EventLoopThread("lifecycle")
+    assert event_loop.is_running is False
+    with pytest.raises(EventLoopThreadNotStartedInApplicationContextError):
+        event_loop.loop
+    with pytest.raises(EventLoopThreadNotStartedInApplicationContextError):
+        event_loop.stop()
+
+    event_loop.start()
+    with pytest.raises(EventLoopThreadAlreadyStartedInApplicationContextError):
+        event_loop.start()
+    assert event_loop.name == "lifecycle"
+    assert event_loop.submit(asyncio.sleep(0, result=1)).result() == 1
+    event_loop.stop()
+
+
+def test_event_loop_count_expect_value_error() -> None:
+    with pytest.raises(ValueError):
+        ApplicationContext(event_loop_count=0)
@@ -0,0 +1,91 @@
+import json
+from pathlib import Path
+
+from spakky.application.application import SpakkyApplication
+from spakky.application.application_context import ApplicationContext
+from spakky.application.profiler import (
+    SpanCategory,
+    StartupProfiler,
+    TimelineFormat,
+)
+from spakky.pod.annotations.pod import Pod
+from tests.application import apps
+
+
+def test_profiler_records_nested_pod_instantiation() -> None:
+    @Pod()
+    class A: ...
+
+    @Pod()
+    class B:
+        def __init__(self, a: A) -> None:
+            self.a = a
+
+    profiler = StartupProfiler()
+    context = ApplicationContext(profiler=profiler)
+    context.add(B)
+    context.add(A)
+    context.start()
+
+    pods = {x.name: x for x in profiler.spans if x.category == SpanCategory.POD}
+    assert set(pods) == {"a", "b"}
+    assert pods["a"].depth == pods["b"].depth + 1
+    assert pods["b"].children_duration >= pods["a"].duration
+    assert pods["b"].self_duration <= pods["b"].duration
+    assert any(x.name == "start" for x in profiler.spans)
+    assert any(x.category == SpanCategory.POST_PROCESSOR for x in profiler.spans)
+    context.stop()
+
+
+def test_profiler_stops_recording_after_start() -> None:
+    @Pod(scope=Pod.Scope.PROTOTYPE)
+    class A: ...
+
+    profiler = StartupProfiler()
+    context = ApplicationContext(profiler=profiler)
+    context.add(A)
+    context.start()
+
+    recorded: int = len(profiler.spans)
+    context.get(A)
+    context.get(A)
+
+    assert profiler.is_finished is True
+    assert len(profiler.spans) == recorded
+    context.stop()
+
+
+def test_profiler_export_timeline(tmp_path: Path) -> None:
+    application = (
+        SpakkyApplication(ApplicationContext())
+        .enable_profiling()
+        .enable_logging()
+        .enable_transactional()
+        .scan(apps)
+        .load_plugins()
+        .start()
+    )
+    profiler = application.profiler
+    assert profiler is not None
+
+    categories = {x.category for x in profiler.spans}
+    assert SpanCategory.PHASE in categories
+    assert SpanCategory.SCAN in categories
+    assert SpanCategory.POD in categories
+
+    json_path = tmp_path / "timeline.json"
+    profiler.export(json_path)
+    timeline = json.loads(json_path.read_text())
+    assert timeline["total_ms"] > 0
+    assert {x["name"] for x in timeline["spans"]} >= {"scan", "start"}
+
+    trace_path = tmp_path / "trace.json"
+    profiler.export(trace_path, TimelineFormat.CHROME_TRACE)
+    trace = json.loads(trace_path.read_text())
+    assert all(x["ph"] == "X" for x in trace["traceEvents"])
+    assert len(trace["traceEvents"]) == len(profiler.spans)
+
+    slowest = profiler.slowest(SpanCategory.POD, limit=3)
+    assert len(slowest) <= 3
+    assert all(x.category == SpanCategory.POD for x in slowest)
+    application.stop()
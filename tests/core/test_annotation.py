@@ -1,5 +1,6 @@
 import inspect
 from dataclasses import dataclass
+from functools import wraps
 from uuid import UUID, uuid4
 
 import pytest
@@ -203,3 +204,43 @@ def test_class_annotation_inheritance_expect_fail() -> None:
     assert Foo.exists(Dummy2)
     with pytest.raises(AssertionError):
         assert Baz.exists(Dummy2)
+
+
+def test_class_annotation_does_not_leak_into_base_class() -> None:
+    @dataclass
+    class Foo(ClassAnnotation): ...
+
+    @dataclass
+    class Bar(ClassAnnotation): ...
+
+    @Foo()
+    class Base: ...
+
+    @Bar()
+    class Derived(Base): ...
+
+    assert Foo.exists(Derived)
+    assert Bar.exists(Derived)
+    assert Foo.exists(Base)
+    assert not Bar.exists(Base)
+
+
+def test_function_annotation_does_not_leak_into_wrapped_function() -> None:
+    @dataclass
+    class Foo(FunctionAnnotation): ...
+
+    @dataclass
+    class Bar(FunctionAnnotation): ...
+
+    @Foo()
+    def original() -> None: ...
+
+    @Bar()
+    @wraps(original)
+    def wrapper() -> None: ...
+
+    assert Foo.exists(wrapper)
+    assert Bar.exists(wrapper)
+    assert Foo.get(original) == Foo()
+    assert Bar.get_or_none(original) is None
+    assert Bar.all(original) == []
@@ -1,8 +1,10 @@
+import gc
 from typing import Generic, Protocol, TypeVar, runtime_checkable
 
 import pytest
 
-from spakky.core.mro import generic_mro
+from spakky.core import mro
+from spakky.core.mro import clear_mro_cache, generic_mro, is_family_with
 
 
 def test_generic_mro_normal_inheritance() -> None:
@@ -125,3 +127,63 @@ def test_generic_mro_with_non_class_object() -> None:
 
     with pytest.raises(TypeError):
         generic_mro(a)
+
+
+def test_generic_mro_returns_independent_copies() -> None:
+    T = TypeVar("T")
+
+    class A(Generic[T]): ...
+
+    class B(A[int]): ...
+
+    first = generic_mro(B)
+    first.clear()
+    assert generic_mro(B) == [B, A[int], Generic, object]
+    assert generic_mro(A[str]) == [A[str], Generic, object]
+
+
+def test_is_family_with() -> None:
+    T = TypeVar("T")
+
+    class A(Generic[T]): ...
+
+    class B(A[int]): ...
+
+    class C: ...
+
+    assert is_family_with(B, B) is True
+    assert is_family_with(B, A[int]) is True
+    assert is_family_with(B, A[str]) is False
+    assert is_family_with(B, object) is True
+    assert is_family_with(C, A[int]) is False
+    assert is_family_with(A[int], A[int]) is True
+    assert is_family_with(A[int], Generic) is True
+
+
+def test_generic_mro_cache_does_not_keep_classes_alive() -> None:
+    clear_mro_cache()
+
+    class A: ...
+
+    class B(A): ...
+
+    assert generic_mro(B) == [B, A, object]
+    assert len(mro._class_cache) == 1  # pyright: ignore[reportPrivateUsage]
+
+    del A, B
+    gc.collect()
+    assert len(mro._class_cache) == 0  # pyright: ignore[reportPrivateUsage]
+
+
+def test_generic_mro_alias_cache_is_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    T = TypeVar("T")
+
+    class A(Generic[T]): ...
+
+    clear_mro_cache()
+    monkeypatch.setattr(mro, "MRO_CACHE_SIZE", 2)
+    generic_mro(A[int])
+    generic_mro(A[str])
+    generic_mro(A[float])
+    assert list(mro._alias_cache) == [A[str], A[float]]  # pyright: ignore[reportPrivateUsage]
+    assert generic_mro(A[int]) == [A[int], Generic, object]
@@ -1,3 +1,4 @@
+import weakref
 from dataclasses import FrozenInstanceError
 
 import pytest
@@ -58,3 +59,80 @@ def test_immutable_is_dataclass() -> None:
     assert ImmutableDataClassWithEquatable(
         name="John"
     ) == ImmutableDataClassWithEquatable(name="John")
+
+
+def test_immutable_with_slots() -> None:
+    @immutable(slots=True)
+    class Point:
+        x: int
+        y: int
+
+    point = Point(x=1, y=2)
+    assert Point.__slots__ == ("x", "y")  # type: ignore
+    assert not hasattr(point, "__dict__")
+    with pytest.raises(FrozenInstanceError):
+        point.x = 3  # type: ignore
+    with pytest.raises(TypeError):
+        Point(1, 2)  # type: ignore
+
+
+def test_mutable_with_slots() -> None:
+    @mutable(slots=True)
+    class Counter:
+        value: int
+
+    counter = Counter(value=1)
+    counter.value = 2
+    assert counter.value == 2
+    assert not hasattr(counter, "__dict__")
+    with pytest.raises(AttributeError):
+        counter.other = 1  # type: ignore
+
+
+def test_slots_keep_zero_argument_super() -> None:
+    class Base:
+        def describe(self) -> str:
+            return "base"
+
+    @immutable(slots=True)
+    class Child(Base):
+        name: str
+
+        def describe(self) -> str:
+            return f"{super().describe()}:{self.name}"
+
+        @classmethod
+        def create(cls) -> "Child":
+            return super().__new__(cls)
+
+        @property
+        def upper(self) -> str:
+            return super().describe().upper()
+
+        def __init_subclass__(cls) -> None:
+            super().__init_subclass__()
+
+    class GrandChild(Child): ...
+
+    assert Child(name="john").describe() == "base:john"
+    assert Child(name="john").upper == "BASE"
+    assert isinstance(Child.create(), Child)
+    assert GrandChild(name="jane").describe() == "base:jane"
+
+
+def test_weakref_slot_supports_weak_references() -> None:
+    @immutable(slots=True, weakref_slot=True)
+    class Code:
+        value: str
+
+        def upper(self) -> str:
+            return super().__str__().upper()
+
+    code = Code(value="kr")
+    assert weakref.ref(code)() is code
+    assert not hasattr(code, "__dict__")
+    assert code.upper()
+    with pytest.raises(FrozenInstanceError):
+        code.value = "us"  # type: ignore
+    with pytest.raises(TypeError):
+        mutable(weakref_slot=True)(type("Plain", (), {"__annotations__": {}}))
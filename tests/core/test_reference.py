@@ -0,0 +1,57 @@
+from collections.abc import Callable
+from typing import Any, Generic, Optional, TypeVar
+
+import pytest
+
+from spakky.core.reference import (
+    CannotReferenceObjectError,
+    CannotResolveReferenceError,
+    from_reference,
+    to_reference,
+)
+
+T = TypeVar("T")
+
+
+class Box(Generic[T]): ...
+
+
+def test_reference_round_trip() -> None:
+    for obj in [
+        int,
+        None,
+        "ForwardReference",
+        Box,
+        Box[int],
+        Box[T],
+        Generic,
+        Any,
+        Optional[int],
+        int | str,
+        dict[str, list[Box[int]]],
+        Callable[[int], str],
+    ]:
+        assert from_reference(to_reference(obj)) == obj
+
+
+def test_reference_local_object_expect_error() -> None:
+    class Local: ...
+
+    with pytest.raises(CannotReferenceObjectError):
+        to_reference(Local)
+    with pytest.raises(CannotReferenceObjectError):
+        to_reference(lambda: None)
+
+
+def test_reference_with_scope() -> None:
+    class Local: ...
+
+    reference = ["object", __name__, "Unbound"]
+    assert from_reference(reference, {f"{__name__}:Unbound": Local}) is Local
+
+
+def test_reference_unresolvable_expect_error() -> None:
+    with pytest.raises(CannotResolveReferenceError):
+        from_reference(["object", __name__, "DoesNotExist"])
+    with pytest.raises(CannotResolveReferenceError):
+        from_reference(["unknown"])
@@ -94,3 +94,55 @@ def test_aggregate_root_clear_events() -> None:
     assert isinstance(user.events[0], User.Created)
     user.clear_events()
     assert len(user.events) == 0
+
+
+def test_aggregate_root_events_are_immutable_snapshot() -> None:
+    @mutable
+    class User(AbstractAggregateRoot[UUID]):
+        name: str
+
+        def validate(self) -> None:
+            return
+
+        @immutable
+        class Created(AbstractIntegrationEvent):
+            name: str
+
+        @classmethod
+        def next_id(cls) -> UUID:
+            return uuid4()
+
+    user: User = User(uid=uuid4(), name="John")
+    event = User.Created(name=user.name)
+    user.add_event(event)
+    events = user.events
+    assert events == (event,)
+    assert events[0] is event
+    user.add_event(User.Created(name="Jane"))
+    assert len(events) == 1
+    assert len(user.events) == 2
+
+
+def test_aggregate_root_pull_events() -> None:
+    @mutable
+    class User(AbstractAggregateRoot[UUID]):
+        name: str
+
+        def validate(self) -> None:
+            return
+
+        @immutable
+        class Created(AbstractIntegrationEvent):
+            name: str
+
+        @classmethod
+        def next_id(cls) -> UUID:
+            return uuid4()
+
+    user: User = User(uid=uuid4(), name="John")
+    first, second = User.Created(name="John"), User.Created(name="Jane")
+    user.add_event(first)
+    user.add_event(second)
+    assert user.pull_events() == (first, second)
+    assert user.events == ()
+    assert user.pull_events() == ()
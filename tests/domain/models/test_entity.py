@@ -1,4 +1,5 @@
 import sys
+from typing import ClassVar
 from uuid import UUID, uuid4
 
 import pytest
@@ -245,3 +246,117 @@ def test_entity_attribute_will_not_change_if_validation_error_raised() -> None:
     with pytest.raises(AbstractDomainValidationError):
         user.update_name("John")
     assert user.name == "Sam"
+
+
+@mutable
+class Account(AbstractEntity[UUID]):
+    name: str
+    age: int
+    validations: ClassVar[int] = 0
+
+    def validate(self) -> None:
+        Account.validations += 1
+        if len(self.name) > 4:
+            raise AbstractDomainValidationError
+        if self.age < 0:
+            raise AbstractDomainValidationError
+
+    @classmethod
+    def next_id(cls) -> UUID:
+        return uuid4()
+
+
+def test_entity_batch_update_validates_once() -> None:
+    account = Account(uid=uuid4(), name="John", age=20)
+    Account.validations = 0
+    account.mark_clean()
+
+    with account.batch_update() as batch:
+        batch.name = "Jane"
+        batch.age = 30
+        with account.batch_update():
+            account.age = 31
+
+    assert Account.validations == 1
+    assert (account.name, account.age) == ("Jane", 31)
+    assert account.dirty_fields == {"name", "age", "version"}
+
+
+def test_entity_batch_update_rolls_back_every_field() -> None:
+    account = Account(uid=uuid4(), name="John", age=20)
+    account.mark_clean()
+
+    with pytest.raises(AbstractDomainValidationError):
+        with account.batch_update():
+            account.age = 30
+            account.name = "Too long"
+
+    with pytest.raises(RuntimeError):
+        with account.batch_update():
+            account.age = 40
+            raise RuntimeError
+
+    assert (account.name, account.age) == ("John", 20)
+    assert account.is_dirty is False
+
+
+def test_entity_update_applies_changes_at_once() -> None:
+    account = Account(uid=uuid4(), name="John", age=20)
+    account.mark_clean()
+    Account.validations = 0
+
+    account.update(name="Jane", age=21)
+
+    assert Account.validations == 1
+    assert account.dirty_fields == {"name", "age", "version"}
+    with pytest.raises(CannotMonkeyPatchEntityError):
+        account.update(nickname="J")
+
+
+def test_entity_tracks_dirty_fields_since_clean() -> None:
+    account = Account(uid=uuid4(), name="John", age=20)
+    assert account.is_dirty is False
+
+    account.age = 20
+    assert account.is_dirty is False
+    account.name = "Jane"
+    assert account.dirty_fields == {"name", "version"}
+    with pytest.raises(AbstractDomainValidationError):
+        account.age = -1
+    assert account.dirty_fields == {"name", "version"}
+
+    account.mark_clean()
+    assert account.dirty_fields == frozenset()
+
+
+def test_entity_version_bumps_once_per_change_set() -> None:
+    account = Account(uid=uuid4(), name="John", age=20)
+    assert account.persisted_version is None
+    account.mark_clean()
+    loaded = account.version
+    assert account.persisted_version == loaded
+
+    account.age = 20
+    assert account.version == loaded
+    account.name = "Jane"
+    changed = account.version
+    assert changed != loaded
+    account.age = 21
+    assert account.version == changed
+    assert account.persisted_version == loaded
+
+    account.mark_clean()
+    assert account.persisted_version == changed
+    account.update(name="Joe", age=22)
+    assert account.version not in (loaded, changed)
+
+
+def test_entity_failed_change_keeps_version() -> None:
+    account = Account(uid=uuid4(), name="John", age=20)
+    account.mark_clean()
+    version = account.version
+    with pytest.raises(AbstractDomainValidationError):
+        account.update(name="Too long")
+    with pytest.raises(AbstractDomainValidationError):
+        account.age = -1
+    assert account.version == version
@@ -0,0 +1,287 @@
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Optional
+from uuid import UUID, uuid4
+
+import pytest
+
+from spakky.core.mutability import immutable
+from spakky.domain.models.event import AbstractDomainEvent
+from spakky.domain.models.event_serializer import (
+    EventSchemaVersionError,
+    EventSerializerRegistry,
+    InvalidSerializedEventError,
+    UnknownEventTypeError,
+    UnsupportedEventFieldTypeError,
+)
+
+
+class Grade(Enum):
+    BRONZE = 1
+    GOLD = 2
+
+
+@dataclass(frozen=True)
+class Address:
+    city: str
+    zip_code: str | None = None
+
+
+@dataclass(frozen=True)
+class Node:
+    value: int
+    children: tuple["Node", ...] = ()
+
+
+@immutable
+class MemberJoined(AbstractDomainEvent):
+    member_id: UUID
+    name: str
+    age: int
+    score: float
+    active: bool
+    avatar: bytes
+    birthday: date
+    balance: Decimal
+    grade: Grade
+    nickname: Optional[str]
+    tags: list[str]
+    roles: frozenset[str]
+    point: tuple[int, int]
+    history: tuple[datetime, ...]
+    limits: dict[str, int]
+    owners: dict[UUID, Grade]
+    address: Address
+    tree: Node
+
+
+@immutable
+class Renamed(AbstractDomainEvent):
+    name: str
+
+
+@immutable
+class RenamedV2(AbstractDomainEvent):
+    name: str
+    reason: str
+
+
+@immutable
+class Priced(AbstractDomainEvent):
+    amount: int
+    currency: str
+
+
+@immutable
+class PricedV2(AbstractDomainEvent):
+    currency: str
+    amount: Decimal
+
+
+@immutable
+class Untyped(AbstractDomainEvent):
+    payload: Any
+
+
+def create_member() -> MemberJoined:
+    return MemberJoined(
+        member_id=uuid4(),
+        name="한국어 name",
+        age=-42,
+        score=1.5,
+        active=True,
+        avatar=b"\x00\xff",
+        birthday=date(1990, 1, 2),
+        balance=Decimal("10.25"),
+        grade=Grade.GOLD,
+        nickname=None,
+        tags=["a", "b"],
+        roles=frozenset({"admin"}),
+        point=(1, -2),
+        history=(
+            datetime(2024, 1, 1, 12, 30, 15, 123456),
+            datetime(2024, 1, 1, tzinfo=timezone(timedelta(hours=9))),
+        ),
+        limits={"daily": 10**20},
+        owners={uuid4(): Grade.BRONZE},
+        address=Address(city="Seoul"),
+        tree=Node(1, (Node(2), Node(3, (Node(4),)))),
+    )
+
+
+def assert_same_event(
+    actual: AbstractDomainEvent, expected: AbstractDomainEvent
+) -> None:
+    assert type(actual) is type(expected)
+    assert actual == expected
+    assert actual.__dict__ == expected.__dict__
+
+
+def test_binary_round_trip() -> None:
+    registry = EventSerializerRegistry()
+    event = create_member()
+    data: bytes = registry.serialize(event)
+    assert_same_event(registry.deserialize(data), event)
+    assert registry.deserialize(data).timestamp.tzinfo == timezone.utc
+    # Positional fields without names keep the payload compact
+    assert len(data) < len(registry.serialize_json(event))
+
+
+def test_json_round_trip() -> None:
+    registry = EventSerializerRegistry()
+    event = create_member()
+    data: str = registry.serialize_json(event)
+    assert '"grade":"GOLD"' in data
+    assert_same_event(registry.deserialize_json(data), event)
+
+
+def test_deserialize_resolves_allowlisted_event_by_path() -> None:
+    event = Renamed(name="john")
+    data: bytes = EventSerializerRegistry().serialize(event)
+    json_data: str = EventSerializerRegistry().serialize_json(event)
+    allowed = EventSerializerRegistry(allowed_modules=[__name__.rpartition(".")[0]])
+    assert_same_event(allowed.deserialize(data), event)
+    assert_same_event(allowed.deserialize_json(json_data), event)
+
+    with pytest.raises(UnknownEventTypeError):
+        EventSerializerRegistry().deserialize(data)
+    with pytest.raises(UnknownEventTypeError):
+        EventSerializerRegistry(allowed_modules=["tests.domain.model"]).deserialize(
+            data
+        )
+
+
+def test_serializer_is_generated_once_per_event_type() -> None:
+    registry = EventSerializerRegistry()
+    assert registry.get(Renamed) is registry.get(Renamed)
+    assert registry.get_by_name(registry.get(Renamed).name) is registry.get(Renamed)
+
+
+def test_upcasts_older_schema_versions() -> None:
+    old = EventSerializerRegistry()
+    old.register(Renamed, name="renamed")
+    event = Renamed(name="john")
+    data: bytes = old.serialize(event)
+    json_data: str = old.serialize_json(event)
+
+    new = EventSerializerRegistry()
+    serializer = new.register(
+        RenamedV2,
+        name="renamed",
+        version=2,
+        upcasters={1: lambda data: {**data, "reason": "unknown"}},
+        layouts={1: Renamed},
+    )
+    assert serializer.version == 2
+    assert serializer.event_type is RenamedV2
+    for upcasted in (new.deserialize(data), new.deserialize_json(json_data)):
+        assert isinstance(upcasted, RenamedV2)
+        assert upcasted.event_id == event.event_id
+        assert upcasted.reason == "unknown"
+
+
+def test_decodes_older_versions_with_their_own_layout() -> None:
+    old = EventSerializerRegistry()
+    old.register(Priced, name="priced")
+    event = Priced(amount=3, currency="KRW")
+    data: bytes = old.serialize(event)
+    json_data: str = old.serialize_json(event)
+
+    new = EventSerializerRegistry()
+    new.register(
+        PricedV2,
+        name="priced",
+        version=2,
+        upcasters={1: lambda data: {**data, "amount": Decimal(data["amount"])}},
+        layouts={1: Priced},
+    )
+    for upcasted in (new.deserialize(data), new.deserialize_json(json_data)):
+        assert isinstance(upcasted, PricedV2)
+        assert upcasted.amount == Decimal(3)
+        assert upcasted.currency == "KRW"
+
+    # Without the old layout the positional fields would be misread
+    unknown = EventSerializerRegistry()
+    unknown.register(
+        PricedV2,
+        name="priced",
+        version=2,
+        upcasters={1: lambda data: data},
+    )
+    with pytest.raises(EventSchemaVersionError):
+        unknown.deserialize(data)
+    with pytest.raises(EventSchemaVersionError):
+        unknown.deserialize_json(json_data)
+    with pytest.raises(ValueError):
+        unknown.register(PricedV2, version=2, layouts={2: Priced})
+    with pytest.raises(UnsupportedEventFieldTypeError):
+        unknown.register(PricedV2, version=2, layouts={1: Grade})
+
+
+def test_rejects_unknown_schema_versions() -> None:
+    newer = EventSerializerRegistry()
+    newer.register(Renamed, name="renamed", version=3)
+    data: bytes = newer.serialize(Renamed(name="john"))
+
+    older = EventSerializerRegistry()
+    older.register(Renamed, name="renamed", version=2)
+    with pytest.raises(EventSchemaVersionError):
+        older.deserialize(data)
+
+    oldest = EventSerializerRegistry()
+    oldest.register(Renamed, name="renamed")
+    legacy = EventSerializerRegistry()
+    legacy.register(Renamed, name="renamed", version=4)
+    with pytest.raises(EventSchemaVersionError):
+        legacy.deserialize(oldest.serialize(Renamed(name="john")))
+    with pytest.raises(ValueError):
+        legacy.register(Renamed, version=0)
+
+
+def test_rejects_unknown_or_malformed_payloads() -> None:
+    registry = EventSerializerRegistry()
+    data: bytes = registry.serialize(Renamed(name="john"))
+    with pytest.raises(InvalidSerializedEventError):
+        registry.deserialize(b"\x02" + data[1:])
+    with pytest.raises(InvalidSerializedEventError):
+        registry.deserialize(data[:-1])
+    with pytest.raises(InvalidSerializedEventError):
+        registry.deserialize(data + b"\x00")
+    with pytest.raises(InvalidSerializedEventError):
+        registry.deserialize(b"")
+    mismatched = EventSerializerRegistry()
+    mismatched.register(RenamedV2, name=registry.get(Renamed).name)
+    with pytest.raises(InvalidSerializedEventError):
+        mismatched.deserialize(data)
+    allowed = EventSerializerRegistry(allowed_modules=["missing", __name__])
+    with pytest.raises(UnknownEventTypeError):
+        allowed.get_by_name("missing.module:Event")
+    with pytest.raises(UnknownEventTypeError):
+        allowed.get_by_name(f"{__name__}:Grade")
+
+
+def test_rejects_unsupported_field_types() -> None:
+    @immutable
+    class UnionEvent(AbstractDomainEvent):
+        value: int | str
+
+    registry = EventSerializerRegistry()
+    with pytest.raises(UnsupportedEventFieldTypeError):
+        registry.get(Untyped)
+    with pytest.raises(UnsupportedEventFieldTypeError):
+        registry.get(UnionEvent)
+
+
+def test_local_event_types_need_explicit_registration() -> None:
+    @immutable
+    class LocalEvent(AbstractDomainEvent):
+        values: set[int] = field(default_factory=set)
+
+    event = LocalEvent(values={1, 2})
+    registry = EventSerializerRegistry()
+    registry.register(LocalEvent, name="local")
+    assert_same_event(registry.deserialize(registry.serialize(event)), event)
+    with pytest.raises(UnknownEventTypeError):
+        EventSerializerRegistry().deserialize(registry.serialize(event))
@@ -1,7 +1,13 @@
+import gc
+import weakref
+from collections.abc import Hashable
+from copy import copy
+from dataclasses import asdict, astuple, fields
+
 import pytest
 
 from spakky.core.mutability import immutable
-from spakky.domain.models.value_object import AbstractValueObject
+from spakky.domain.models.value_object import AbstractValueObject, Interned
 
 
 def test_value_object_equals() -> None:
@@ -104,3 +110,177 @@ def test_value_object_can_only_composed_by_hashable_objects_expect_error() -> No
 
             def validate(self) -> None:
                 return
+
+
+def test_value_object_with_slots_has_no_instance_dict() -> None:
+    @immutable(slots=True)
+    class Money(AbstractValueObject):
+        amount: int
+        currency: str
+
+        def validate(self) -> None:
+            return
+
+    money = Money(amount=1, currency="KRW")
+    assert not hasattr(money, "__dict__")
+    assert money == Money(amount=1, currency="KRW")
+    assert money != Money(amount=2, currency="KRW")
+    assert hash(money) == hash(Money(amount=1, currency="KRW"))
+    assert money.clone() == money
+
+
+def test_value_object_cached_hash_is_not_a_field() -> None:
+    @immutable(slots=True)
+    class Money(AbstractValueObject):
+        amount: int
+        currency: str
+
+        def validate(self) -> None:
+            return
+
+    money = Money(amount=1, currency="KRW")
+    before = asdict(money)
+    hash(money)
+    assert asdict(money) == before == {"amount": 1, "currency": "KRW"}
+    assert astuple(money) == (1, "KRW")
+    assert [x.name for x in fields(money)] == ["amount", "currency"]
+    assert copy(money) == money and hash(copy(money)) == hash(money)
+
+
+def test_value_object_equality_uses_nested_equality() -> None:
+    @immutable(slots=True)
+    class Currency(AbstractValueObject):
+        code: str
+
+        def validate(self) -> None:
+            return
+
+    @immutable(slots=True)
+    class Money(AbstractValueObject):
+        amount: int
+        currency: Currency
+
+        def validate(self) -> None:
+            return
+
+    @immutable
+    class Single(AbstractValueObject):
+        value: int
+
+        def validate(self) -> None:
+            return
+
+    @immutable
+    class Empty(AbstractValueObject):
+        def validate(self) -> None:
+            return
+
+    krw = Money(amount=1, currency=Currency(code="KRW"))
+    assert krw == Money(amount=1, currency=Currency(code="KRW"))
+    assert krw != Money(amount=1, currency=Currency(code="USD"))
+    assert krw == krw
+    assert Single(value=1) == Single(value=1)
+    assert hash(Single(value=1)) == hash(Single(value=1))
+    assert Empty() == Empty()
+    assert hash(Empty()) == hash(Empty())
+
+
+def test_value_object_hash_is_cached() -> None:
+    calls: list[int] = []
+
+    class Tracked(str):
+        def __hash__(self) -> int:
+            calls.append(1)
+            return super().__hash__()
+
+    @immutable(slots=True)
+    class Name(AbstractValueObject):
+        value: str
+
+        def validate(self) -> None:
+            return
+
+    name = Name(value=Tracked("john"))
+    assert hash(name) == hash(name)
+    assert len(calls) == 1
+
+
+def test_interned_value_object_returns_canonical_instance() -> None:
+    validations: list[str] = []
+
+    @Interned()
+    @immutable
+    class Currency(AbstractValueObject):
+        code: str
+        precision: int = 2
+
+        def validate(self) -> None:
+            validations.append(self.code)
+
+    krw = Currency(code="KRW")
+    assert Currency(code="KRW") is krw
+    assert validations == ["KRW"]
+    assert Currency(code="KRW", precision=2) is krw
+    assert Currency(precision=2, code="KRW") is krw
+    assert Currency(code="USD") is not krw
+    assert Currency(code="KRW", precision=0) is not krw
+    # Each new spelling of the arguments is validated once, then canonicalized
+    assert validations.count("KRW") == 4
+    assert krw.clone() is krw
+    assert copy(krw) is krw
+
+
+def test_interned_value_object_distinguishes_equal_values_of_other_types() -> None:
+    @Interned()
+    @immutable
+    class Amount(AbstractValueObject):
+        value: Hashable
+
+        def validate(self) -> None:
+            return
+
+    assert Amount(value=1) is Amount(value=1)
+    assert Amount(value=True) is not Amount(value=1)
+    assert type(Amount(value=1.0).value) is float
+
+
+def test_interned_value_object_is_released_when_unused() -> None:
+    @Interned()
+    @immutable(slots=True, weakref_slot=True)
+    class Country(AbstractValueObject):
+        code: str
+
+        def validate(self) -> None:
+            return
+
+    korea = Country(code="KR")
+    assert Country(code="KR") is korea
+    reference = weakref.ref(korea)
+    del korea
+    gc.collect()
+    assert reference() is None
+    assert Country(code="KR").code == "KR"
+
+
+def test_interned_value_object_with_unhashable_arguments_is_not_interned() -> None:
+    @Interned()
+    @immutable
+    class Tags(AbstractValueObject):
+        values: tuple[str, ...]
+
+        def validate(self) -> None:
+            return
+
+    assert Tags(values=["a"]) is not Tags(values=["a"])  # type: ignore
+
+
+def test_interned_requires_weak_references() -> None:
+    with pytest.raises(TypeError):
+
+        @Interned()
+        @immutable(slots=True)
+        class Code(AbstractValueObject):
+            value: str
+
+            def validate(self) -> None:
+                return
@@ -0,0 +1,141 @@
+from asyncio import CancelledError, create_task, gather, sleep
+from typing import Sequence
+
+import pytest
+
+from spakky.application.application_context import ApplicationContext
+from spakky.core.mutability import immutable
+from spakky.domain.ports.external.batching import BatchingAsyncProxy
+from spakky.domain.ports.external.proxy import (
+    IAsyncGenericProxy,
+    ProxyModel,
+    ProxyModelNotFoundError,
+)
+from spakky.pod.annotations.pod import Pod
+from spakky.pod.interfaces.container import ContextBoundPodNotContextScopedError
+
+
+@immutable
+class Product(ProxyModel[int]):
+    name: str
+
+
+class RemoteProductProxy(IAsyncGenericProxy[Product, int]):
+    calls: list[list[int]]
+    failures: int
+
+    def __init__(self, failures: int = 0) -> None:
+        self.calls = []
+        self.failures = failures
+
+    async def get(self, proxy_id: int) -> Product:
+        raise NotImplementedError
+
+    async def get_or_none(self, proxy_id: int) -> Product | None:
+        raise NotImplementedError
+
+    async def contains(self, proxy_id: int) -> bool:
+        raise NotImplementedError
+
+    async def range(self, proxy_ids: Sequence[int]) -> Sequence[Product]:
+        self.calls.append(list(proxy_ids))
+        await sleep(0)
+        if self.failures > 0:
+            self.failures -= 1
+            raise ConnectionError
+        return [Product(id=i, name=f"product-{i}") for i in proxy_ids if i < 100]
+
+
+async def test_batching_proxy_coalesces_concurrent_gets() -> None:
+    remote = RemoteProductProxy()
+    proxy = BatchingAsyncProxy(remote)
+
+    products = await gather(*(proxy.get(i) for i in (3, 1, 3, 2)))
+
+    assert [product.id for product in products] == [3, 1, 3, 2]
+    assert products[0] is products[2]
+    assert remote.calls == [[3, 1, 2]]
+
+
+async def test_batching_proxy_caches_hits_and_misses() -> None:
+    remote = RemoteProductProxy()
+    proxy = BatchingAsyncProxy(remote)
+
+    assert await proxy.get_or_none(100) is None
+    with pytest.raises(ProxyModelNotFoundError):
+        await proxy.get(100)
+    assert await proxy.contains(1) is True
+    assert await proxy.contains(1) is True
+    assert remote.calls == [[100], [1]]
+
+    proxy.evict(1)
+    await proxy.get(1)
+    proxy.clear()
+    await proxy.get(99)
+    assert remote.calls == [[100], [1], [1], [99]]
+
+
+async def test_batching_proxy_range_joins_one_batch() -> None:
+    remote = RemoteProductProxy()
+    proxy = BatchingAsyncProxy(remote, max_batch_size=2)
+    await proxy.get(1)
+
+    products, product = await gather(proxy.range([1, 2, 100, 3, 2]), proxy.get(4))
+
+    assert [product.id for product in products] == [1, 2, 3, 2]
+    assert product.id == 4
+    assert remote.calls == [[1], [2, 100], [3, 4]]
+
+
+async def test_batching_proxy_does_not_cache_failures() -> None:
+    remote = RemoteProductProxy(failures=1)
+    proxy = BatchingAsyncProxy(remote)
+
+    results = await gather(proxy.get(1), proxy.get(2), return_exceptions=True)
+    assert all(isinstance(result, ConnectionError) for result in results)
+    assert (await proxy.get(1)).id == 1
+    assert remote.calls == [[1, 2], [1]]
+
+
+async def test_batching_proxy_survives_cancelled_callers() -> None:
+    remote = RemoteProductProxy()
+    proxy = BatchingAsyncProxy(remote)
+
+    cancelled = create_task(proxy.get(1))
+    waiting = create_task(proxy.get(1))
+    await sleep(0)
+    cancelled.cancel()
+
+    with pytest.raises(CancelledError):
+        await cancelled
+    assert (await waiting).id == 1
+    assert remote.calls == [[1]]
+
+
+def test_batching_proxy_rejects_invalid_batch_size() -> None:
+    with pytest.raises(ValueError):
+        BatchingAsyncProxy(RemoteProductProxy(), max_batch_size=0)
+
+
+def test_batching_proxy_pods_follow_context_scope() -> None:
+    class ProductProxy(BatchingAsyncProxy[Product, int]): ...
+
+    remote = RemoteProductProxy()
+
+    @Pod()
+    def get_singleton_proxy() -> ProductProxy:
+        return ProductProxy(remote)
+
+    @Pod(scope=Pod.Scope.CONTEXT)
+    def get_context_proxy() -> ProductProxy:
+        return ProductProxy(remote)
+
+    context = ApplicationContext()
+    with pytest.raises(ContextBoundPodNotContextScopedError):
+        context.add(get_singleton_proxy)
+    context.add(get_context_proxy)
+    with context.scope():
+        proxy = context.get(ProductProxy)
+        assert context.get(ProductProxy) is proxy
+    with context.scope():
+        assert context.get(ProductProxy) is not proxy
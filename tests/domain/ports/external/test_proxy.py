@@ -0,0 +1,143 @@
+from typing import Sequence
+
+from spakky.core.mutability import immutable
+from spakky.domain.ports.external.proxy import (
+    IAsyncGenericProxy,
+    IAsyncPageableProxy,
+    IGenericProxy,
+    IPageableProxy,
+    ProxyModel,
+)
+from spakky.domain.ports.pagination import Page, aiter_chunks, iter_chunks
+
+
+@immutable
+class Product(ProxyModel[int]):
+    name: str
+
+
+PRODUCTS: dict[int, Product] = {
+    index: Product(id=index, name=f"product-{index}") for index in range(5)
+}
+
+
+def page_of(after: int | None, limit: int) -> Page[Product, int]:
+    keys: list[int] = [key for key in sorted(PRODUCTS) if after is None or key > after]
+    items: tuple[Product, ...] = tuple(PRODUCTS[key] for key in keys[:limit])
+    return Page(items=items, next_cursor=items[-1].id if len(keys) > limit else None)
+
+
+class ProductProxy(IGenericProxy[Product, int]):
+    ranges: list[list[int]]
+
+    def __init__(self) -> None:
+        self.ranges = []
+
+    def get(self, proxy_id: int) -> Product:
+        return PRODUCTS[proxy_id]
+
+    def get_or_none(self, proxy_id: int) -> Product | None:
+        return PRODUCTS.get(proxy_id)
+
+    def contains(self, proxy_id: int) -> bool:
+        return proxy_id in PRODUCTS
+
+    def range(self, proxy_ids: Sequence[int]) -> Sequence[Product]:
+        self.ranges.append(list(proxy_ids))
+        return [PRODUCTS[proxy_id] for proxy_id in proxy_ids]
+
+
+class PageableProductProxy(ProductProxy, IPageableProxy[Product, int]):
+    def page(self, after: int | None = None, limit: int = 1000) -> Page[Product, int]:
+        return page_of(after, limit)
+
+
+class AsyncProductProxy(IAsyncGenericProxy[Product, int]):
+    ranges: list[list[int]]
+
+    def __init__(self) -> None:
+        self.ranges = []
+
+    async def get(self, proxy_id: int) -> Product:
+        return PRODUCTS[proxy_id]
+
+    async def get_or_none(self, proxy_id: int) -> Product | None:
+        return PRODUCTS.get(proxy_id)
+
+    async def contains(self, proxy_id: int) -> bool:
+        return proxy_id in PRODUCTS
+
+    async def range(self, proxy_ids: Sequence[int]) -> Sequence[Product]:
+        self.ranges.append(list(proxy_ids))
+        return [PRODUCTS[proxy_id] for proxy_id in proxy_ids]
+
+
+class AsyncPageableProductProxy(AsyncProductProxy, IAsyncPageableProxy[Product, int]):
+    async def page(
+        self, after: int | None = None, limit: int = 1000
+    ) -> Page[Product, int]:
+        return page_of(after, limit)
+
+
+def test_generic_proxy_protocols_stay_structural() -> None:
+    class StructuralProxy:
+        def get(self, proxy_id: int) -> Product:
+            return PRODUCTS[proxy_id]
+
+        def get_or_none(self, proxy_id: int) -> Product | None:
+            return PRODUCTS.get(proxy_id)
+
+        def contains(self, proxy_id: int) -> bool:
+            return proxy_id in PRODUCTS
+
+        def range(self, proxy_ids: Sequence[int]) -> Sequence[Product]:
+            return [PRODUCTS[proxy_id] for proxy_id in proxy_ids]
+
+    assert isinstance(StructuralProxy(), IGenericProxy)
+    assert not isinstance(StructuralProxy(), IPageableProxy)
+    assert [product.id for product in iter_chunks(StructuralProxy().range, [1, 3])] == [
+        1,
+        3,
+    ]
+
+
+def test_proxy_streams_ids_in_chunks() -> None:
+    proxy = PageableProductProxy()
+    products = list(proxy.iter_range(iter([4, 0, 2]), chunk_size=2))
+    assert [product.id for product in products] == [4, 0, 2]
+    assert proxy.ranges == [[4, 0], [2]]
+
+
+def test_proxy_iterates_all_pages() -> None:
+    assert [
+        product.id for product in PageableProductProxy().iter_all(chunk_size=2)
+    ] == [
+        0,
+        1,
+        2,
+        3,
+        4,
+    ]
+
+
+async def test_async_proxy_streams_ids_and_pages() -> None:
+    proxy = AsyncPageableProductProxy()
+    products = [product async for product in proxy.iter_range([3, 1, 4], 2)]
+    assert [product.id for product in products] == [3, 1, 4]
+    assert proxy.ranges == [[3, 1], [4]]
+    assert [product.id async for product in proxy.iter_all(chunk_size=3)] == [
+        0,
+        1,
+        2,
+        3,
+        4,
+    ]
+
+
+async def test_async_generic_proxy_streams_through_helper() -> None:
+    proxy = AsyncProductProxy()
+    assert [product.id async for product in aiter_chunks(proxy.range, [2, 0], 1)] == [
+        2,
+        0,
+    ]
+    assert proxy.ranges == [[2], [0]]
@@ -0,0 +1,371 @@
+from typing import Sequence
+from uuid import UUID, uuid4
+
+import pytest
+
+from spakky.application.application_context import ApplicationContext
+from spakky.core.mutability import immutable, mutable
+from spakky.domain.models.aggregate_root import AbstractAggregateRoot
+from spakky.domain.models.event import AbstractDomainEvent, AbstractIntegrationEvent
+from spakky.domain.ports.pagination import Page
+from spakky.domain.ports.persistency.identity_map import (
+    AbstractAsyncIdentityMapRepository,
+    AbstractIdentityMapRepository,
+)
+from spakky.domain.ports.persistency.repository import EntityNotFoundError
+from spakky.domain.ports.persistency.transaction import (
+    AbstractAsyncTransaction,
+    AbstractTransaction,
+)
+from spakky.pod.annotations.pod import Pod
+from spakky.pod.interfaces.container import ContextBoundPodNotContextScopedError
+from spakky.stereotype.repository import Repository
+
+
+@mutable
+class User(AbstractAggregateRoot[UUID]):
+    name: str
+
+    @immutable
+    class Renamed(AbstractIntegrationEvent):
+        name: str
+
+    def validate(self) -> None:
+        return
+
+    @classmethod
+    def next_id(cls) -> UUID:
+        return uuid4()
+
+    def rename(self, name: str) -> None:
+        self.name = name
+        self.add_event(self.Renamed(name=name))
+
+
+class Transaction(AbstractTransaction):
+    def initialize(self) -> None: ...
+
+    def dispose(self) -> None: ...
+
+    def commit(self) -> None: ...
+
+    def rollback(self) -> None: ...
+
+
+class AsyncTransaction(AbstractAsyncTransaction):
+    async def initialize(self) -> None: ...
+
+    async def dispose(self) -> None: ...
+
+    async def commit(self) -> None: ...
+
+    async def rollback(self) -> None: ...
+
+
+class EventPublisher:
+    published: list[AbstractDomainEvent]
+
+    def __init__(self) -> None:
+        self.published = []
+
+    def publish(self, event: AbstractDomainEvent) -> None:
+        self.published.append(event)
+
+
+class AsyncEventPublisher:
+    published: list[AbstractDomainEvent]
+
+    def __init__(self) -> None:
+        self.published = []
+
+    async def publish(self, event: AbstractDomainEvent) -> None:
+        self.published.append(event)
+
+
+class UserRepository(AbstractIdentityMapRepository[User, UUID]):
+    rows: dict[UUID, str]
+    loads: list[list[UUID]]
+
+    def __init__(
+        self, rows: dict[UUID, str], transaction: AbstractTransaction | None = None
+    ) -> None:
+        super().__init__(transaction)
+        self.rows = rows
+        self.loads = []
+
+    def _load(self, aggregate_ids: Sequence[UUID]) -> Sequence[User]:
+        self.loads.append(list(aggregate_ids))
+        return [
+            User(uid=uid, name=self.rows[uid])
+            for uid in aggregate_ids
+            if uid in self.rows
+        ]
+
+    def _page(self, after: UUID | None, limit: int) -> Page[User, UUID]:
+        keys: list[UUID] = sorted(
+            key for key in self.rows if after is None or key > after
+        )
+        items: tuple[User, ...] = tuple(
+            User(uid=key, name=self.rows[key]) for key in keys[:limit]
+        )
+        return Page(
+            items=items,
+            next_cursor=items[-1].uid if len(keys) > limit else None,
+        )
+
+    def _store(self, aggregates: Sequence[User]) -> Sequence[User]:
+        for aggregate in aggregates:
+            self.rows[aggregate.uid] = aggregate.name
+        return aggregates
+
+    def _remove(self, aggregates: Sequence[User]) -> Sequence[User]:
+        for aggregate in aggregates:
+            self.rows.pop(aggregate.uid, None)
+        return aggregates
+
+
+class AsyncUserRepository(AbstractAsyncIdentityMapRepository[User, UUID]):
+    rows: dict[UUID, str]
+    loads: list[list[UUID]]
+
+    def __init__(
+        self,
+        rows: dict[UUID, str],
+        transaction: AbstractAsyncTransaction | None = None,
+    ) -> None:
+        super().__init__(transaction)
+        self.rows = rows
+        self.loads = []
+
+    async def _load(self, aggregate_ids: Sequence[UUID]) -> Sequence[User]:
+        self.loads.append(list(aggregate_ids))
+        return [
+            User(uid=uid, name=self.rows[uid])
+            for uid in aggregate_ids
+            if uid in self.rows
+        ]
+
+    async def _page(self, after: UUID | None, limit: int) -> Page[User, UUID]:
+        keys: list[UUID] = sorted(
+            key for key in self.rows if after is None or key > after
+        )
+        items: tuple[User, ...] = tuple(
+            User(uid=key, name=self.rows[key]) for key in keys[:limit]
+        )
+        return Page(
+            items=items,
+            next_cursor=items[-1].uid if len(keys) > limit else None,
+        )
+
+    async def _store(self, aggregates: Sequence[User]) -> Sequence[User]:
+        for aggregate in aggregates:
+            self.rows[aggregate.uid] = aggregate.name
+        return aggregates
+
+    async def _remove(self, aggregates: Sequence[User]) -> Sequence[User]:
+        for aggregate in aggregates:
+            self.rows.pop(aggregate.uid, None)
+        return aggregates
+
+
+def test_identity_map_returns_same_instance_and_loads_once() -> None:
+    uid = uuid4()
+    repository = UserRepository({uid: "John"})
+
+    user = repository.get(uid)
+    assert repository.get(uid) is user
+    assert repository.get_or_none(uid) is user
+    assert repository.contains(uid) is True
+    assert repository.is_loaded(uid) is True
+    assert repository.loads == [[uid]]
+
+
+def test_identity_map_batches_range_misses() -> None:
+    first, second, third, missing = uuid4(), uuid4(), uuid4(), uuid4()
+    repository = UserRepository({first: "A", second: "B", third: "C"})
+
+    loaded = repository.get(second)
+    users = repository.range([third, second, missing, third, first])
+
+    assert [user.name for user in users] == ["C", "B", "C", "A"]
+    assert users[1] is loaded
+    assert repository.loads == [[second], [third, missing, first]]
+
+    repository.range([first, second, third])
+    assert len(repository.loads) == 2
+
+
+def test_identity_map_misses_raise_or_return_none() -> None:
+    repository = UserRepository({})
+    with pytest.raises(EntityNotFoundError):
+        repository.get(uuid4())
+    assert repository.get_or_none(uuid4()) is None
+    assert repository.contains(uuid4()) is False
+
+
+def test_identity_map_tracks_save_delete_and_eviction() -> None:
+    repository = UserRepository({})
+    user = User(uid=uuid4(), name="John")
+
+    assert repository.save(user) is user
+    assert repository.get(user.uid) is user
+    assert repository.loads == []
+
+    repository.evict(user.uid)
+    assert repository.is_loaded(user.uid) is False
+    assert repository.get(user.uid) is not user
+
+    repository.clear()
+    assert repository.delete(repository.get(user.uid)).uid == user.uid
+    assert repository.is_loaded(user.uid) is False
+    assert repository.get_or_none(user.uid) is None
+
+
+def test_identity_map_follows_context_scope() -> None:
+    uid = uuid4()
+    rows: dict[UUID, str] = {uid: "John"}
+
+    @Repository(scope=Pod.Scope.CONTEXT)
+    def get_user_repository() -> UserRepository:
+        return UserRepository(rows)
+
+    context = ApplicationContext()
+    context.add(get_user_repository)
+    context.start()
+
+    with context.scope():
+        user = context.get(UserRepository).get(uid)
+        assert context.get(UserRepository).get(uid) is user
+    with context.scope():
+        assert context.get(UserRepository).get(uid) is not user
+    context.stop()
+
+
+def test_identity_map_rejects_non_context_scoped_pods() -> None:
+    @Repository()
+    def get_user_repository() -> UserRepository:
+        return UserRepository({})
+
+    @Repository(scope=Pod.Scope.PROTOTYPE)
+    def get_async_user_repository() -> AsyncUserRepository:
+        return AsyncUserRepository({})
+
+    context = ApplicationContext()
+    with pytest.raises(ContextBoundPodNotContextScopedError):
+        context.add(get_user_repository)
+    with pytest.raises(ContextBoundPodNotContextScopedError):
+        context.add(get_async_user_repository)
+
+
+async def test_async_identity_map_returns_same_instance_and_batches() -> None:
+    first, second, missing = uuid4(), uuid4(), uuid4()
+    repository = AsyncUserRepository({first: "A", second: "B"})
+
+    user = await repository.get(first)
+    assert await repository.get(first) is user
+    assert await repository.contains(first) is True
+    assert [u.name for u in await repository.range([second, missing, first])] == [
+        "B",
+        "A",
+    ]
+    assert repository.loads == [[first], [second, missing]]
+
+    with pytest.raises(EntityNotFoundError):
+        await repository.get(missing)
+    assert await repository.get_or_none(uuid4()) is None
+
+
+async def test_async_identity_map_tracks_save_delete_and_eviction() -> None:
+    repository = AsyncUserRepository({})
+    user = User(uid=uuid4(), name="John")
+
+    assert await repository.save(user) is user
+    assert await repository.get(user.uid) is user
+    assert repository.loads == []
+
+    repository.evict(user.uid)
+    assert repository.is_loaded(user.uid) is False
+    assert await repository.get(user.uid) is not user
+
+    repository.clear()
+    assert (await repository.delete(await repository.get(user.uid))).uid == user.uid
+    assert repository.is_loaded(user.uid) is False
+    assert await repository.get_or_none(user.uid) is None
+
+
+def test_identity_map_streams_without_retaining_aggregates() -> None:
+    uids: list[UUID] = sorted(uuid4() for _ in range(5))
+    repository = UserRepository({uid: str(index) for index, uid in enumerate(uids)})
+    loaded = repository.get(uids[2])
+
+    scanned = list(repository.iter_all(chunk_size=2))
+    assert [user.name for user in scanned] == ["0", "1", "2", "3", "4"]
+    assert scanned[2] is loaded
+
+    streamed = list(repository.iter_range(reversed(uids), chunk_size=2))
+    assert [user.name for user in streamed] == ["4", "3", "2", "1", "0"]
+    assert streamed[2] is loaded
+    assert repository.loads == [[uids[2]], [uids[4], uids[3]], [uids[1]], [uids[0]]]
+    assert [repository.is_loaded(uid) for uid in uids] == [
+        False,
+        False,
+        True,
+        False,
+        False,
+    ]
+
+    first = repository.page(limit=3)
+    assert first.has_next is True
+    assert repository.page(first.next_cursor, 3).has_next is False
+    with pytest.raises(ValueError):
+        repository.page(limit=0)
+
+
+async def test_async_identity_map_streams_without_retaining_aggregates() -> None:
+    uids: list[UUID] = sorted(uuid4() for _ in range(5))
+    repository = AsyncUserRepository(
+        {uid: str(index) for index, uid in enumerate(uids)}
+    )
+    loaded = await repository.get(uids[2])
+
+    scanned = [user async for user in repository.iter_all(chunk_size=2)]
+    assert [user.name for user in scanned] == ["0", "1", "2", "3", "4"]
+    assert scanned[2] is loaded
+
+    streamed = [
+        user async for user in repository.iter_range(reversed(uids), chunk_size=2)
+    ]
+    assert [user.name for user in streamed] == ["4", "3", "2", "1", "0"]
+    assert streamed[2] is loaded
+    assert repository.loads == [[uids[2]], [uids[4], uids[3]], [uids[1]], [uids[0]]]
+    assert repository.is_loaded(uids[0]) is False
+
+
+def test_identity_map_tracks_saved_aggregates_in_transaction() -> None:
+    publisher = EventPublisher()
+    transaction = Transaction(event_publisher=publisher)
+    john = User(uid=uuid4(), name="john")
+    repository = UserRepository({john.uid: "john"}, transaction)
+
+    with transaction:
+        user = repository.get(john.uid)
+        user.rename("jane")
+        repository.save(user)
+        assert publisher.published == []
+
+    assert [event.name for event in publisher.published] == ["jane"]  # type: ignore
+    assert user.events == ()
+
+
+async def test_async_identity_map_tracks_saved_aggregates_in_transaction() -> None:
+    publisher = AsyncEventPublisher()
+    transaction = AsyncTransaction(event_publisher=publisher)
+    john = User(uid=uuid4(), name="john")
+    repository = AsyncUserRepository({john.uid: "john"}, transaction)
+
+    async with transaction:
+        user = await repository.get(john.uid)
+        user.rename("jane")
+        await repository.delete(user)
+
+    assert [event.name for event in publisher.published] == ["jane"]  # type: ignore
@@ -0,0 +1,343 @@
+from asyncio import Event, gather
+from typing import Sequence
+from uuid import UUID, uuid4
+
+import pytest
+
+from spakky.core.mutability import immutable, mutable
+from spakky.domain.models.aggregate_root import AbstractAggregateRoot
+from spakky.domain.models.event import AbstractDomainEvent, AbstractIntegrationEvent
+from spakky.domain.ports.persistency.in_memory import (
+    AsyncInMemoryRepository,
+    AsyncInMemoryTransaction,
+    IndexNotDeclaredError,
+    InMemoryRepository,
+    InMemoryStore,
+    InMemoryTransaction,
+)
+from spakky.domain.ports.persistency.repository import (
+    ConcurrencyConflictError,
+    EntityNotFoundError,
+)
+
+
+@mutable
+class Member(AbstractAggregateRoot[UUID]):
+    team: str
+    tags: list[str]
+
+    @immutable
+    class Joined(AbstractIntegrationEvent):
+        uid: UUID
+
+    def validate(self) -> None:
+        return
+
+    @classmethod
+    def next_id(cls) -> UUID:
+        return uuid4()
+
+    @classmethod
+    def join(cls, team: str) -> "Member":
+        member = cls(uid=cls.next_id(), team=team, tags=[])
+        member.add_event(cls.Joined(uid=member.uid))
+        return member
+
+
+class EventPublisher:
+    published: list[AbstractDomainEvent]
+
+    def __init__(self) -> None:
+        self.published = []
+
+    def publish(self, event: AbstractDomainEvent) -> None:
+        self.published.append(event)
+
+    def publish_all(self, events: Sequence[AbstractDomainEvent]) -> None:
+        self.published.extend(events)
+
+
+def test_in_memory_repository_stores_private_copies() -> None:
+    repository = InMemoryRepository(InMemoryStore[Member, UUID]())
+    member = repository.save(Member.join("red"))
+
+    loaded = repository.get(member.uid)
+    assert loaded == member and loaded is not member
+    assert loaded.events == ()
+    assert loaded.is_dirty is False
+    assert loaded.persisted_version == member.version
+
+    loaded.tags.append("lead")
+    assert repository.get(member.uid).tags == []
+    repository.save(loaded)
+    assert repository.get(member.uid).tags == ["lead"]
+
+    assert repository.contains(member.uid) is True
+    assert repository.get_or_none(uuid4()) is None
+    with pytest.raises(EntityNotFoundError):
+        repository.get(uuid4())
+
+
+def test_in_memory_repository_rejects_stale_writes() -> None:
+    repository = InMemoryRepository(InMemoryStore[Member, UUID]())
+    member = repository.save(Member.join("red"))
+    first, second = repository.get(member.uid), repository.get(member.uid)
+
+    first.team = "blue"
+    repository.save(first)
+    second.team = "green"
+    with pytest.raises(ConcurrencyConflictError):
+        repository.save(second)
+    with pytest.raises(ConcurrencyConflictError):
+        repository.delete(second)
+
+    repository.delete(first)
+    assert repository.contains(member.uid) is False
+
+
+def test_in_memory_repository_maintains_secondary_indexes() -> None:
+    store = InMemoryStore[Member, UUID](indexes=("team",))
+    repository = InMemoryRepository(store)
+    red, blue = Member.join("red"), Member.join("blue")
+    repository.save_all([red, blue])
+    assert store.indexes == frozenset({"team"})
+    assert len(store) == 2
+
+    assert [member.uid for member in repository.find_by("team", "red")] == [red.uid]
+    red.team = "blue"
+    repository.save(red)
+    assert repository.find_by("team", "red") == []
+    assert {member.uid for member in repository.find_by("team", "blue")} == {
+        red.uid,
+        blue.uid,
+    }
+    repository.delete_all([red, blue])
+    assert repository.find_by("team", "blue") == []
+    with pytest.raises(IndexNotDeclaredError):
+        repository.find_by("tags", "lead")
+
+
+def test_in_memory_repository_pages_by_keyset() -> None:
+    repository = InMemoryRepository(InMemoryStore[Member, UUID]())
+    members = repository.save_all([Member.join("red") for _ in range(5)])
+    uids: list[UUID] = sorted(member.uid for member in members)
+
+    first = repository.page(limit=2)
+    assert [member.uid for member in first.items] == uids[:2]
+    assert first.next_cursor == uids[1]
+
+    late = repository.save(Member(uid=UUID(int=0), team="red", tags=[]))
+    repository.delete(repository.get(uids[2]))
+    assert [member.uid for member in repository.iter_all(chunk_size=2)] == [
+        late.uid,
+        *uids[:2],
+        *uids[3:],
+    ]
+    assert repository.page(uids[-1]).items == ()
+    with pytest.raises(ValueError):
+        repository.page(limit=0)
+
+
+def test_in_memory_transaction_commits_atomically_and_publishes() -> None:
+    store = InMemoryStore[Member, UUID](indexes=("team",))
+    publisher = EventPublisher()
+    transaction = InMemoryTransaction(event_publisher=publisher)
+    repository = InMemoryRepository(store, transaction)
+    outside = InMemoryRepository(store)
+
+    with transaction:
+        member = repository.save(Member.join("red"))
+        assert repository.get(member.uid).team == "red"
+        assert [found.uid for found in repository.find_by("team", "red")] == [
+            member.uid
+        ]
+        assert [found.uid for found in repository.page().items] == [member.uid]
+        assert outside.contains(member.uid) is False
+        assert publisher.published == []
+
+    assert outside.get(member.uid).team == "red"
+    assert [event.uid for event in publisher.published] == [member.uid]
+
+
+def test_in_memory_transaction_reads_from_snapshot() -> None:
+    store = InMemoryStore[Member, UUID](indexes=("team",))
+    outside = InMemoryRepository(store)
+    kept, moved, removed = outside.save_all([Member.join("red") for _ in range(3)])
+    transaction = InMemoryTransaction()
+    repository = InMemoryRepository(store, transaction)
+
+    with transaction:
+        assert len(repository.range([kept.uid, moved.uid, removed.uid])) == 3
+        moved.team = "blue"
+        outside.save(moved)
+        outside.delete(removed)
+        added = outside.save(Member.join("red"))
+
+        # Writes committed after the snapshot stay invisible to the transaction
+        assert repository.get(moved.uid).team == "red"
+        assert repository.contains(removed.uid) is True
+        assert repository.contains(added.uid) is False
+        assert len(repository.find_by("team", "red")) == 3
+
+        repository.delete(repository.get(kept.uid))
+        assert repository.get_or_none(kept.uid) is None
+        assert {member.uid for member in repository.iter_all()} == {
+            moved.uid,
+            removed.uid,
+        }
+
+    assert outside.contains(kept.uid) is False
+    assert outside.get(moved.uid).team == "blue"
+    assert len(outside.find_by("team", "red")) == 1
+
+
+def test_in_memory_transaction_rolls_back_and_detects_conflicts() -> None:
+    store = InMemoryStore[Member, UUID]()
+    outside = InMemoryRepository(store)
+    member = outside.save(Member.join("red"))
+    transaction = InMemoryTransaction()
+    repository = InMemoryRepository(store, transaction)
+
+    with pytest.raises(RuntimeError):
+        with transaction:
+            repository.save(Member.join("red"))
+            raise RuntimeError
+    assert len(store) == 1
+
+    with pytest.raises(ConcurrencyConflictError):
+        with transaction:
+            loaded = repository.get(member.uid)
+            loaded.team = "blue"
+            repository.save(loaded)
+            loaded.team = "green"
+            repository.save(loaded)
+            concurrent = outside.get(member.uid)
+            concurrent.team = "yellow"
+            outside.save(concurrent)
+    assert outside.get(member.uid).team == "yellow"
+
+    stale = outside.get(member.uid)
+    with transaction:
+        loaded = repository.get(member.uid)
+        loaded.team = "blue"
+        repository.save(loaded)
+        with pytest.raises(ConcurrencyConflictError):
+            repository.save(stale)
+
+
+def test_in_memory_transaction_marks_aggregates_clean_on_commit() -> None:
+    store = InMemoryStore[Member, UUID]()
+    outside = InMemoryRepository(store)
+    member = outside.save(Member.join("red"))
+    transaction = InMemoryTransaction()
+    repository = InMemoryRepository(store, transaction)
+    loaded = repository.get(member.uid)
+
+    with pytest.raises(RuntimeError):
+        with transaction:
+            loaded.team = "blue"
+            repository.save(loaded)
+            loaded.tags.append("lead")
+            repository.save(loaded)
+            raise RuntimeError
+    # A rolled back save leaves the aggregate as it was, so it can be retried
+    assert loaded.is_dirty is True
+    assert loaded.persisted_version == member.version
+
+    with transaction:
+        repository.save(loaded)
+        assert loaded.is_dirty is True
+    assert loaded.is_dirty is False
+    assert loaded.persisted_version == loaded.version
+    assert outside.get(member.uid).team == "blue"
+
+
+def test_in_memory_transaction_spans_stores() -> None:
+    members, others = InMemoryStore[Member, UUID](), InMemoryStore[Member, UUID]()
+    existing = InMemoryRepository(others).save(Member.join("red"))
+    transaction = InMemoryTransaction(autocommit=False)
+
+    with transaction:
+        InMemoryRepository(members, transaction).save(Member.join("red"))
+        loaded = InMemoryRepository(others, transaction).get(existing.uid)
+        loaded.team = "blue"
+        InMemoryRepository(others, transaction).save(loaded)
+        concurrent = InMemoryRepository(others).get(existing.uid)
+        concurrent.team = "green"
+        InMemoryRepository(others).save(concurrent)
+        with pytest.raises(ConcurrencyConflictError):
+            transaction.commit()
+        transaction.rollback()
+    assert len(members) == 0
+
+    with transaction:
+        InMemoryRepository(members, transaction).save(Member.join("red"))
+        transaction.commit()
+    assert len(members) == 1
+
+
+async def test_async_in_memory_repository_and_transaction() -> None:
+    store = InMemoryStore[Member, UUID](indexes=("team",))
+    transaction = AsyncInMemoryTransaction()
+    repository = AsyncInMemoryRepository(store, transaction)
+    outside = AsyncInMemoryRepository(store)
+
+    async with transaction:
+        red, blue = await repository.save_all([Member.join("red"), Member.join("blue")])
+        assert await outside.contains(red.uid) is False
+        assert (await repository.get(red.uid)).team == "red"
+    assert [member.uid for member in await outside.find_by("team", "blue")] == [
+        blue.uid
+    ]
+    assert len(await outside.range([red.uid, blue.uid, uuid4()])) == 2
+    assert len((await outside.page(limit=1)).items) == 1
+    assert await outside.get_or_none(uuid4()) is None
+    with pytest.raises(EntityNotFoundError):
+        await outside.get(uuid4())
+
+    with pytest.raises(RuntimeError):
+        async with transaction:
+            await repository.delete(await repository.get(red.uid))
+            raise RuntimeError
+    assert await outside.contains(red.uid) is True
+
+    await outside.delete_all([await outside.get(red.uid)])
+    await outside.delete(await outside.get(blue.uid))
+    assert len(store) == 0
+
+    async with AsyncInMemoryTransaction(autocommit=False) as manual:
+        await AsyncInMemoryRepository(store, manual).save(Member.join("red"))
+        await manual.commit()
+    assert len(store) == 1
+
+
+async def test_async_in_memory_transaction_isolates_concurrent_units_of_work() -> None:
+    store = InMemoryStore[Member, UUID]()
+    transaction = AsyncInMemoryTransaction()
+    repository = AsyncInMemoryRepository(store, transaction)
+    both_saved, failed = Event(), Event()
+    kept, dropped = Member.join("red"), Member.join("blue")
+
+    async def fail() -> None:
+        try:
+            async with transaction:
+                await repository.save(dropped)
+                await both_saved.wait()
+                assert await repository.contains(kept.uid) is False
+                raise RuntimeError
+        finally:
+            failed.set()
+
+    async def succeed() -> None:
+        async with transaction:
+            await repository.save(kept)
+            both_saved.set()
+            await failed.wait()
+
+    results = await gather(fail(), succeed(), return_exceptions=True)
+
+    assert isinstance(results[0], RuntimeError)
+    assert results[1] is None
+    outside = AsyncInMemoryRepository(store)
+    assert await outside.contains(kept.uid) is True
+    assert await outside.contains(dropped.uid) is False
@@ -0,0 +1,50 @@
+from uuid import UUID, uuid4
+
+import pytest
+
+from spakky.core.mutability import mutable
+from spakky.domain.models.aggregate_root import AbstractAggregateRoot
+from spakky.domain.ports.persistency.repository import (
+    ConcurrencyConflictError,
+    check_version,
+)
+
+
+@mutable
+class Counter(AbstractAggregateRoot[UUID]):
+    value: int
+
+    def validate(self) -> None:
+        return
+
+    @classmethod
+    def next_id(cls) -> UUID:
+        return uuid4()
+
+
+def test_check_version_accepts_unchanged_rows() -> None:
+    counter = Counter(uid=uuid4(), value=0)
+    check_version(counter, None)
+    counter.mark_clean()
+    counter.value = 1
+    check_version(counter, counter.persisted_version)
+
+
+def test_check_version_rejects_concurrent_writes() -> None:
+    stored = Counter(uid=uuid4(), value=0)
+    stored.mark_clean()
+    first = Counter(uid=stored.uid, value=0, version=stored.version)
+    second = Counter(uid=stored.uid, value=0, version=stored.version)
+    first.mark_clean()
+    second.mark_clean()
+
+    first.value = 1
+    check_version(first, stored.version)
+    stored_version: UUID = first.version
+    first.mark_clean()
+
+    second.value = 2
+    with pytest.raises(ConcurrencyConflictError):
+        check_version(second, stored_version)
+    with pytest.raises(ConcurrencyConflictError):
+        check_version(Counter(uid=stored.uid, value=0), stored_version)
@@ -1,11 +1,23 @@
-from typing import Any
+from asyncio import Event, gather
+from typing import Any, Sequence
+from uuid import UUID, uuid4
 
 import pytest
 
+from spakky.core.mutability import immutable, mutable
 from spakky.domain.models.aggregate_root import AbstractAggregateRoot
+from spakky.domain.models.event import AbstractDomainEvent, AbstractIntegrationEvent
+from spakky.domain.ports.event.event_publisher import (
+    IAsyncBatchEventPublisher,
+    IAsyncEventPublisher,
+    IBatchEventPublisher,
+    IEventPublisher,
+)
 from spakky.domain.ports.persistency.transaction import (
     AbstractAsyncTransaction,
     AbstractTransaction,
+    CommitHookRequiresAutocommitError,
+    TransactionNotActiveError,
 )
 
 
@@ -206,3 +218,390 @@ async def test_async_tranasction_rollback_when_raised() -> None:
 
     assert transaction.committed is False
     assert transaction.rolled_back is True
+
+
+@mutable
+class User(AbstractAggregateRoot[UUID]):
+    name: str
+
+    def validate(self) -> None:
+        return
+
+    @immutable
+    class Created(AbstractIntegrationEvent):
+        name: str
+
+    @classmethod
+    def next_id(cls) -> UUID:
+        return uuid4()
+
+    @classmethod
+    def create(cls, name: str) -> "User":
+        user = cls(uid=cls.next_id(), name=name)
+        user.add_event(cls.Created(name=name))
+        return user
+
+
+class InMemoryEventPublisher:
+    batches: list[list[AbstractDomainEvent]]
+
+    def __init__(self) -> None:
+        self.batches = []
+
+    def publish(self, event: AbstractDomainEvent) -> None:
+        self.publish_all([event])
+
+    def publish_all(self, events: Sequence[AbstractDomainEvent]) -> None:
+        self.batches.append(list(events))
+
+
+class AsyncInMemoryEventPublisher:
+    batches: list[list[AbstractDomainEvent]]
+
+    def __init__(self) -> None:
+        self.batches = []
+
+    async def publish(self, event: AbstractDomainEvent) -> None:
+        await self.publish_all([event])
+
+    async def publish_all(self, events: Sequence[AbstractDomainEvent]) -> None:
+        self.batches.append(list(events))
+
+
+class EventTransaction(AbstractTransaction):
+    fail_on_commit: bool = False
+
+    def initialize(self) -> None: ...
+
+    def dispose(self) -> None: ...
+
+    def commit(self) -> None:
+        if self.fail_on_commit:
+            raise RuntimeError
+
+    def rollback(self) -> None: ...
+
+
+class AsyncEventTransaction(AbstractAsyncTransaction):
+    async def initialize(self) -> None: ...
+
+    async def dispose(self) -> None: ...
+
+    async def commit(self) -> None: ...
+
+    async def rollback(self) -> None: ...
+
+
+def test_transaction_publishes_tracked_events_in_one_batch_after_commit() -> None:
+    publisher = InMemoryEventPublisher()
+    transaction = EventTransaction(event_publisher=publisher)
+    john, jane = User.create("John"), User.create("Jane")
+
+    with transaction:
+        transaction.track(john, jane)
+        transaction.track(john)
+        assert publisher.batches == []
+
+    assert len(publisher.batches) == 1
+    assert [event.name for event in publisher.batches[0]] == ["John", "Jane"]  # type: ignore
+    assert len(john.events) == 0
+    assert len(jane.events) == 0
+
+
+def test_transaction_does_not_publish_on_rollback() -> None:
+    publisher = InMemoryEventPublisher()
+    transaction = EventTransaction(event_publisher=publisher)
+    john = User.create("John")
+
+    with pytest.raises(RuntimeError):
+        with transaction:
+            transaction.track(john)
+            raise RuntimeError
+
+    transaction.fail_on_commit = True
+    with pytest.raises(RuntimeError):
+        with transaction:
+            transaction.track(john)
+
+    transaction.fail_on_commit = False
+    with transaction:
+        pass
+
+    assert publisher.batches == []
+    assert len(john.events) == 1
+
+
+def test_transaction_manual_commit_publishes_on_request() -> None:
+    publisher = InMemoryEventPublisher()
+    transaction = EventTransaction(autocommit=False)
+    transaction.set_event_publisher(publisher)
+    john = User.create("John")
+
+    with transaction:
+        transaction.track(john)
+    assert publisher.batches == []
+
+    transaction.publish_events()
+    assert len(publisher.batches) == 1
+
+
+def test_transaction_without_publisher_keeps_events() -> None:
+    transaction = EventTransaction()
+    john = User.create("John")
+
+    with transaction:
+        transaction.track(john)
+
+    assert len(john.events) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_transaction_publishes_tracked_events_after_commit() -> None:
+    publisher = AsyncInMemoryEventPublisher()
+    transaction = AsyncEventTransaction()
+    transaction.set_event_publisher(publisher)
+    john, jane = User.create("John"), User.create("Jane")
+
+    async with transaction:
+        transaction.track(john, jane)
+
+    assert len(publisher.batches) == 1
+    assert len(publisher.batches[0]) == 2
+    assert len(john.events) == 0
+
+    with pytest.raises(RuntimeError):
+        async with transaction:
+            transaction.track(john)
+            john.add_event(User.Created(name="John"))
+            raise RuntimeError
+
+    async with transaction:
+        pass
+
+    assert len(publisher.batches) == 1
+
+
+def test_event_publisher_publish_all_defaults_to_publish() -> None:
+    class SingleEventPublisher:
+        published: list[AbstractDomainEvent]
+
+        def __init__(self) -> None:
+            self.published = []
+
+        def publish(self, event: AbstractDomainEvent) -> None:
+            self.published.append(event)
+
+    publisher = SingleEventPublisher()
+    # Batching is opt-in, publishers with publish() alone still qualify
+    assert isinstance(publisher, IEventPublisher)
+    assert not isinstance(publisher, IBatchEventPublisher)
+    assert isinstance(InMemoryEventPublisher(), IBatchEventPublisher)
+    assert isinstance(AsyncInMemoryEventPublisher(), IAsyncBatchEventPublisher)
+    transaction = EventTransaction(event_publisher=publisher)
+    assert transaction.event_publisher is publisher
+    john, jane = User.create("John"), User.create("Jane")
+
+    with transaction:
+        transaction.track(john, jane)
+
+    assert [event.name for event in publisher.published] == ["John", "Jane"]  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_async_transaction_tracks_aggregates_per_unit_of_work() -> None:
+    class SingleEventPublisher(IAsyncEventPublisher):
+        published: list[AbstractDomainEvent]
+
+        def __init__(self) -> None:
+            self.published = []
+
+        async def publish(self, event: AbstractDomainEvent) -> None:
+            self.published.append(event)
+
+    publisher = SingleEventPublisher()
+    transaction = AsyncEventTransaction(event_publisher=publisher)
+    both_tracked, failed = Event(), Event()
+    john, jane = User.create("John"), User.create("Jane")
+
+    async def fail() -> None:
+        async with transaction:
+            transaction.track(jane)
+            await both_tracked.wait()
+            raise RuntimeError
+
+    async def succeed() -> None:
+        async with transaction:
+            transaction.track(john)
+            both_tracked.set()
+            # Rolling back the other unit of work must not drop john
+            await failed.wait()
+
+    async def failing() -> None:
+        try:
+            await fail()
+        finally:
+            failed.set()
+
+    results = await gather(failing(), succeed(), return_exceptions=True)
+
+    assert isinstance(results[0], RuntimeError)
+    assert results[1] is None
+    assert [event.name for event in publisher.published] == ["John"]  # type: ignore
+    assert len(jane.events) == 1
+
+
+def test_transaction_hooks_run_once_per_unit_of_work() -> None:
+    calls: list[str] = []
+    publisher = InMemoryEventPublisher()
+    transaction = EventTransaction(event_publisher=publisher)
+
+    with transaction:
+        transaction.track(User.create("John"))
+        transaction.on_before_commit(lambda: calls.append("before"))
+        transaction.on_after_commit(
+            lambda: calls.append(f"after:{len(publisher.batches)}")
+        )
+        transaction.on_rollback(lambda: calls.append("rollback"))
+        assert calls == []
+    assert calls == ["before", "after:1"]
+
+    with transaction:
+        pass
+    assert calls == ["before", "after:1"]
+
+
+def test_transaction_hooks_run_rollback_hooks_on_failure() -> None:
+    calls: list[str] = []
+    transaction = EventTransaction()
+
+    def fail() -> None:
+        calls.append("failing")
+        raise ValueError
+
+    with pytest.raises(RuntimeError):
+        with transaction:
+            transaction.on_after_commit(lambda: calls.append("after"))
+            transaction.on_rollback(fail)
+            transaction.on_rollback(lambda: calls.append("rollback"))
+            raise RuntimeError
+    assert calls == ["failing", "rollback"]
+
+    calls.clear()
+    with pytest.raises(ValueError):
+        with transaction:
+            transaction.on_before_commit(fail)
+            transaction.on_after_commit(lambda: calls.append("after"))
+            transaction.on_rollback(lambda: calls.append("rollback"))
+    assert calls == ["failing", "rollback"]
+
+    calls.clear()
+    transaction.fail_on_commit = True
+    with pytest.raises(RuntimeError):
+        with transaction:
+            transaction.on_rollback(lambda: calls.append("rollback"))
+    assert calls == ["rollback"]
+
+
+def test_transaction_after_commit_hooks_all_run_before_raising() -> None:
+    calls: list[str] = []
+    transaction = EventTransaction()
+
+    def fail() -> None:
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        with transaction:
+            transaction.on_after_commit(fail)
+            transaction.on_after_commit(lambda: calls.append("after"))
+    assert calls == ["after"]
+
+
+def test_transaction_hooks_require_unit_of_work() -> None:
+    transaction = EventTransaction()
+
+    with pytest.raises(TransactionNotActiveError):
+        transaction.on_before_commit(lambda: None)
+    with pytest.raises(TransactionNotActiveError):
+        transaction.on_rollback(lambda: None)
+
+
+def test_transaction_manual_commit_rejects_commit_hooks() -> None:
+    calls: list[str] = []
+    transaction = EventTransaction(autocommit=False)
+
+    with pytest.raises(RuntimeError):
+        with transaction:
+            with pytest.raises(CommitHookRequiresAutocommitError):
+                transaction.on_before_commit(lambda: calls.append("before"))
+            with pytest.raises(CommitHookRequiresAutocommitError):
+                transaction.on_after_commit(lambda: calls.append("after"))
+            transaction.on_rollback(lambda: calls.append("rollback"))
+            raise RuntimeError
+    assert calls == ["rollback"]
+
+
+@pytest.mark.asyncio
+async def test_async_transaction_hooks_are_isolated_per_unit_of_work() -> None:
+    calls: list[str] = []
+    transaction = AsyncEventTransaction()
+    both_registered, failed = Event(), Event()
+
+    async def fail() -> None:
+        try:
+            async with transaction:
+                transaction.on_after_commit(lambda: calls.append("failed:after"))
+                transaction.on_rollback(lambda: calls.append("failed:rollback"))
+                await both_registered.wait()
+                raise RuntimeError
+        finally:
+            failed.set()
+
+    async def succeed() -> None:
+        async with transaction:
+            transaction.on_after_commit(lambda: calls.append("committed:after"))
+            transaction.on_rollback(lambda: calls.append("committed:rollback"))
+            both_registered.set()
+            await failed.wait()
+
+    results = await gather(fail(), succeed(), return_exceptions=True)
+
+    assert isinstance(results[0], RuntimeError)
+    assert results[1] is None
+    assert calls == ["failed:rollback", "committed:after"]
+
+
+@pytest.mark.asyncio
+async def test_async_transaction_hooks_accept_sync_and_async_callbacks() -> None:
+    calls: list[str] = []
+    transaction = AsyncEventTransaction()
+
+    async def record_after() -> None:
+        calls.append("async-after")
+
+    async def fail() -> None:
+        raise ValueError
+
+    async with transaction:
+        transaction.on_before_commit(lambda: calls.append("before"))
+        transaction.on_after_commit(record_after)
+        transaction.on_after_commit(lambda: calls.append("after"))
+    assert calls == ["before", "async-after", "after"]
+
+    calls.clear()
+    with pytest.raises(RuntimeError):
+        async with transaction:
+            transaction.on_rollback(fail)
+            transaction.on_rollback(lambda: calls.append("rollback"))
+            raise RuntimeError
+    assert calls == ["rollback"]
+
+    calls.clear()
+    with pytest.raises(ValueError):
+        async with transaction:
+            transaction.on_before_commit(fail)
+            transaction.on_rollback(lambda: calls.append("rollback"))
+    assert calls == ["rollback"]
+
+    with pytest.raises(ValueError):
+        async with transaction:
+            transaction.on_after_commit(fail)
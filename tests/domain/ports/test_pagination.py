@@ -0,0 +1,37 @@
+import pytest
+
+from spakky.domain.ports.pagination import Page, aiter_chunks, chunked, iter_chunks
+
+
+def test_chunked_splits_lazily_into_fixed_size_chunks() -> None:
+    assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(chunked([], 2)) == []
+    assert next(chunked(iter(range(10**9)), 3)) == [0, 1, 2]
+
+
+def test_chunked_rejects_non_positive_chunk_size() -> None:
+    with pytest.raises(ValueError):
+        list(chunked(range(5), 0))
+
+
+def test_page_has_next_follows_cursor() -> None:
+    assert Page(items=(1, 2), next_cursor=2).has_next is True
+    assert Page(items=(1, 2)).has_next is False
+
+
+def test_iter_chunks_loads_one_chunk_at_a_time() -> None:
+    loads: list[list[int]] = []
+
+    def load(keys: list[int]) -> list[int]:
+        loads.append(keys)
+        return [key * 10 for key in keys]
+
+    assert list(iter_chunks(load, iter([3, 1, 2]), 2)) == [30, 10, 20]
+    assert loads == [[3, 1], [2]]
+
+
+async def test_aiter_chunks_awaits_each_chunk() -> None:
+    async def load(keys: list[int]) -> list[int]:
+        return [key * 10 for key in keys]
+
+    assert [item async for item in aiter_chunks(load, [3, 1, 2], 2)] == [30, 10, 20]
@@ -0,0 +1,222 @@
+import asyncio
+from threading import get_ident
+from time import sleep
+
+import pytest
+
+from spakky.application.application import SpakkyApplication
+from spakky.application.application_context import ApplicationContext
+from spakky.core.mutability import immutable
+from spakky.domain.models.event import AbstractDomainEvent
+from spakky.domain.ports.event.event_publisher import IAsyncEventPublisher
+from spakky.event.bus import AsyncEventBus, EventBusNotStartedError
+from spakky.pod.annotations.pod import Pod
+from spakky.stereotype.event_handler import EventHandler, on_event
+
+
+@immutable
+class UserCreated(AbstractDomainEvent):
+    name: str
+
+
+@immutable
+class AdminCreated(UserCreated): ...
+
+
+@immutable
+class Unhandled(AbstractDomainEvent): ...
+
+
+def wait_until(predicate, timeout: float = 3.0) -> bool:  # type: ignore
+    waited: float = 0
+    while not predicate():
+        if waited >= timeout:
+            return False
+        sleep(0.01)
+        waited += 0.01
+    return True
+
+
+def test_event_bus_dispatches_to_routes_by_mro() -> None:
+    received: list[tuple[str, str]] = []
+
+    @EventHandler()
+    class UserEventHandler:
+        @on_event(UserCreated)
+        async def on_user(self, event: UserCreated) -> None:
+            received.append(("user", event.name))
+
+        @on_event(AdminCreated)
+        def on_admin(self, event: AdminCreated) -> None:
+            received.append(("admin", event.name))
+
+    @Pod()
+    class UserService:
+        __publisher: IAsyncEventPublisher
+
+        def __init__(self, publisher: IAsyncEventPublisher) -> None:
+            self.__publisher = publisher
+
+        async def create(self, event: UserCreated) -> None:
+            await self.__publisher.publish(event)
+
+    context = ApplicationContext()
+    SpakkyApplication(context).enable_async_event_bus().add(UserEventHandler).add(
+        UserService
+    ).start()
+    try:
+        service: UserService = context.get(UserService)
+        context.submit(service.create(UserCreated(name="john"))).result()
+        context.submit(service.create(AdminCreated(name="root"))).result()
+        assert wait_until(lambda: len(received) == 3)
+        assert sorted(received) == [
+            ("admin", "root"),
+            ("user", "john"),
+            ("user", "root"),
+        ]
+    finally:
+        context.stop()
+
+
+def test_event_bus_registered_callbacks_and_late_subclasses() -> None:
+    received: list[AbstractDomainEvent] = []
+
+    async def callback(event: UserCreated) -> None:
+        received.append(event)
+
+    context = ApplicationContext()
+    context.add(AsyncEventBus)
+    context.start()
+    try:
+        bus: AsyncEventBus = context.get(AsyncEventBus)
+        bus.register(UserCreated, callback)
+
+        @immutable
+        class GuestCreated(UserCreated): ...
+
+        guest = GuestCreated(name="guest")
+        context.submit(bus.publish(guest)).result()
+        context.submit(bus.publish(Unhandled())).result()
+
+        async def late(event: Unhandled) -> None:
+            received.append(event)
+
+        bus.register(Unhandled, late)
+        unhandled = Unhandled()
+        context.submit(bus.publish(unhandled)).result()
+        assert wait_until(lambda: len(received) == 2)
+        assert received == [guest, unhandled]
+    finally:
+        context.stop()
+
+
+def test_event_bus_logs_failing_handler(caplog: pytest.LogCaptureFixture) -> None:
+    received: list[str] = []
+
+    @EventHandler()
+    class FailingEventHandler:
+        @on_event(UserCreated)
+        async def fail(self, event: UserCreated) -> None:
+            raise RuntimeError("broken handler")
+
+        @on_event(UserCreated)
+        async def succeed(self, event: UserCreated) -> None:
+            received.append(event.name)
+
+    context = ApplicationContext()
+    context.add(AsyncEventBus)
+    context.add(FailingEventHandler)
+    context.start()
+    try:
+        bus: AsyncEventBus = context.get(AsyncEventBus)
+        context.submit(bus.publish(UserCreated(name="john"))).result()
+        assert wait_until(lambda: received == ["john"])
+        assert wait_until(lambda: "'UserCreated' handler failed" in caplog.text)
+    finally:
+        context.stop()
+
+
+def test_event_bus_publish_from_another_loop() -> None:
+    threads: list[int] = []
+
+    async def callback(event: UserCreated) -> None:
+        threads.append(get_ident())
+
+    context = ApplicationContext()
+    context.add(AsyncEventBus)
+    context.start()
+    try:
+        bus: AsyncEventBus = context.get(AsyncEventBus)
+        bus.register(UserCreated, callback)
+        asyncio.run(bus.publish(UserCreated(name="john")))
+        assert wait_until(lambda: len(threads) == 1)
+        assert threads[0] != get_ident()
+    finally:
+        context.stop()
+
+
+def test_event_bus_drains_queue_on_stop_and_applies_backpressure() -> None:
+    received: list[str] = []
+
+    @EventHandler()
+    class SlowEventHandler:
+        @on_event(UserCreated)
+        async def handle(self, event: UserCreated) -> None:
+            await asyncio.sleep(0.01)
+            received.append(event.name)
+
+    @Pod()
+    def get_event_bus() -> AsyncEventBus:
+        return AsyncEventBus(queue_size=1, concurrency=1)
+
+    context = ApplicationContext()
+    context.add(get_event_bus)
+    context.add(SlowEventHandler)
+    context.start()
+    try:
+        bus: AsyncEventBus = context.get(AsyncEventBus)
+
+        async def publish_many() -> None:
+            for index in range(5):
+                await bus.publish(UserCreated(name=str(index)))
+
+        context.submit(publish_many()).result()
+        # With a single slot, publishing returns only after earlier events were taken
+        assert len(received) >= 3
+    finally:
+        context.stop()
+    assert received == ["0", "1", "2", "3", "4"]
+
+
+def test_event_bus_rejects_invalid_limits() -> None:
+    with pytest.raises(ValueError):
+        AsyncEventBus(queue_size=0)
+    with pytest.raises(ValueError):
+        AsyncEventBus(concurrency=0)
+
+
+async def test_event_bus_publish_before_start_raises() -> None:
+    with pytest.raises(EventBusNotStartedError):
+        await AsyncEventBus().publish(UserCreated(name="john"))
+
+
+def test_event_bus_publish_all_skips_unrouted_events() -> None:
+    received: list[str] = []
+
+    async def callback(event: UserCreated) -> None:
+        received.append(event.name)
+
+    context = ApplicationContext()
+    context.add(AsyncEventBus)
+    context.start()
+    try:
+        bus: AsyncEventBus = context.get(AsyncEventBus)
+        bus.register(UserCreated, callback)
+        asyncio.run(
+            bus.publish_all(
+                [UserCreated(name="john"), Unhandled(), AdminCreated(name="root")]
+            )
+        )
+        assert wait_until(lambda: sorted(received) == ["john", "root"])
+    finally:
+        context.stop()
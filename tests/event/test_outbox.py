@@ -0,0 +1,291 @@
+import asyncio
+import sqlite3
+from asyncio import locks
+from pathlib import Path
+from time import sleep, time
+from typing import Sequence
+
+import pytest
+
+from spakky.application.application_context import ApplicationContext
+from spakky.core.mutability import immutable, mutable
+from spakky.domain.models.aggregate_root import AbstractAggregateRoot
+from spakky.domain.models.event import AbstractDomainEvent
+from spakky.domain.models.event_serializer import EventSerializerRegistry
+from spakky.domain.ports.persistency.transaction import TransactionNotActiveError
+from spakky.event.outbox import (
+    OutboxDatabaseMismatchError,
+    OutboxRelay,
+    SqliteOutbox,
+    SqliteTransaction,
+)
+from spakky.pod.annotations.pod import Pod
+
+
+@immutable
+class OrderPlaced(AbstractDomainEvent):
+    order_id: int
+
+
+@mutable
+class Order(AbstractAggregateRoot[int]):
+    def validate(self) -> None:
+        return
+
+    @classmethod
+    def next_id(cls) -> int:
+        return 0
+
+    @classmethod
+    def place(cls, uid: int) -> "Order":
+        order = cls(uid=uid)
+        order.add_event(OrderPlaced(order_id=uid))
+        return order
+
+
+class RecordingPublisher:
+    batches: list[list[AbstractDomainEvent]]
+    failures: int
+
+    def __init__(self, failures: int = 0) -> None:
+        self.batches = []
+        self.failures = failures
+
+    async def publish(self, event: AbstractDomainEvent) -> None:
+        await self.publish_all([event])
+
+    async def publish_all(self, events: Sequence[AbstractDomainEvent]) -> None:
+        if self.failures > 0:
+            self.failures -= 1
+            raise ConnectionError("broker unavailable")
+        self.batches.append(list(events))
+
+
+def test_outbox_appends_and_deduplicates_by_event_id() -> None:
+    outbox = SqliteOutbox()
+    first, second = OrderPlaced(order_id=1), OrderPlaced(order_id=2)
+    outbox.publish_all([first, second])
+    outbox.publish(first)
+    records = outbox.fetch(10)
+    assert [record.event for record in records] == [first, second]
+    assert [record.event_id for record in records] == [first.event_id, second.event_id]
+
+    outbox.mark_sent([first.event_id])
+    outbox.publish(first)
+    assert outbox.count_pending() == 1
+    outbox.close()
+
+
+def test_outbox_is_durable_across_instances(tmp_path: Path) -> None:
+    path = tmp_path / "outbox.db"
+    event = OrderPlaced(order_id=1)
+    SqliteOutbox(path).publish(event)
+    serializer = EventSerializerRegistry()
+    serializer.register(OrderPlaced)
+    assert [record.event for record in SqliteOutbox(path, serializer).fetch(10)] == [
+        event
+    ]
+
+
+def test_outbox_quarantines_rows_it_cannot_decode(tmp_path: Path) -> None:
+    path = tmp_path / "outbox.db"
+    first, second = OrderPlaced(order_id=1), OrderPlaced(order_id=2)
+    SqliteOutbox(path).publish(first)
+    serializer = EventSerializerRegistry()
+    serializer.register(OrderPlaced)
+    SqliteOutbox(path, serializer).publish(second)
+    # A fresh process only decodes the events it registered
+    restarted = SqliteOutbox(path, EventSerializerRegistry())
+    assert restarted.fetch(1) == []
+    assert restarted.count_pending() == 0
+    assert restarted.count_quarantined() == 2
+
+    outbox = SqliteOutbox(path, serializer)
+    outbox.requeue_quarantined()
+    assert [record.event for record in outbox.fetch(10)] == [first, second]
+
+
+async def test_relay_skips_undecodable_rows(tmp_path: Path) -> None:
+    path = tmp_path / "outbox.db"
+    serializer = EventSerializerRegistry()
+    serializer.register(OrderPlaced)
+    outbox = SqliteOutbox(path, serializer)
+    event = OrderPlaced(order_id=2)
+    with sqlite3.connect(path) as connection:
+        connection.execute(
+            "INSERT INTO outbox (event_id, event_name, payload, created_at) "
+            "VALUES ('poison', 'OrderPlaced', x'00', 0)"
+        )
+    connection.close()
+    outbox.publish(event)
+    publisher = RecordingPublisher()
+
+    assert await OutboxRelay(outbox, publisher, batch_size=1).relay() == 1
+    assert publisher.batches == [[event]]
+    assert outbox.count_quarantined() == 1
+    outbox.close()
+
+
+def test_outbox_joins_caller_transaction(tmp_path: Path) -> None:
+    path = tmp_path / "outbox.db"
+    outbox = SqliteOutbox(path)
+    connection = sqlite3.connect(path)
+
+    with pytest.raises(RuntimeError):
+        with connection:
+            outbox.append([OrderPlaced(order_id=1)], connection)
+            raise RuntimeError
+    assert outbox.count_pending() == 0
+
+    with connection:
+        outbox.append([OrderPlaced(order_id=2)], connection)
+    assert outbox.count_pending() == 1
+    connection.close()
+
+
+def test_sqlite_transaction_writes_outbox_before_commit(tmp_path: Path) -> None:
+    path = tmp_path / "app.db"
+    outbox = SqliteOutbox(path)
+    transaction = SqliteTransaction(path, outbox)
+    with sqlite3.connect(path) as connection:
+        connection.executescript(
+            "CREATE TABLE orders (id INTEGER PRIMARY KEY);"
+            "CREATE TABLE lines (order_id INTEGER REFERENCES orders (id) "
+            "DEFERRABLE INITIALLY DEFERRED);"
+        )
+    connection.close()
+
+    def count_orders() -> int:
+        with sqlite3.connect(path) as connection:
+            (count,) = connection.execute("SELECT COUNT(*) FROM orders").fetchone()
+        connection.close()
+        return count
+
+    with pytest.raises(RuntimeError):
+        with transaction:
+            transaction.connection.execute("INSERT INTO orders VALUES (1)")
+            transaction.track(Order.place(1))
+            raise RuntimeError
+    assert count_orders() == 0
+    assert outbox.count_pending() == 0
+
+    # The outbox rows are already written when the deferred constraint fails
+    with pytest.raises(sqlite3.IntegrityError):
+        with transaction:
+            transaction.connection.execute("PRAGMA foreign_keys = ON")
+            transaction.connection.execute("INSERT INTO orders VALUES (2)")
+            transaction.connection.execute("INSERT INTO lines VALUES (3)")
+            transaction.track(Order.place(2))
+    assert count_orders() == 0
+    assert outbox.count_pending() == 0
+
+    with transaction:
+        transaction.connection.execute("INSERT INTO orders VALUES (4)")
+        transaction.track(Order.place(4))
+    assert count_orders() == 1
+    assert [record.event.order_id for record in outbox.fetch(10)] == [4]  # type: ignore
+
+    with pytest.raises(TransactionNotActiveError):
+        transaction.connection
+    outbox.close()
+
+
+def test_sqlite_transaction_shares_the_outbox_database(tmp_path: Path) -> None:
+    outbox = SqliteOutbox(tmp_path / "outbox.db")
+    transaction = SqliteTransaction(outbox=outbox)
+    with transaction:
+        transaction.track(Order.place(1))
+    assert outbox.count_pending() == 1
+
+    with pytest.raises(OutboxDatabaseMismatchError):
+        SqliteTransaction(tmp_path / "app.db", outbox)
+    with pytest.raises(OutboxDatabaseMismatchError):
+        SqliteTransaction(outbox=SqliteOutbox())
+    with pytest.raises(ValueError):
+        SqliteTransaction()
+    outbox.close()
+
+
+def test_outbox_purges_sent_records() -> None:
+    outbox = SqliteOutbox()
+    event = OrderPlaced(order_id=1)
+    outbox.publish(event)
+    outbox.mark_sent([event.event_id])
+    outbox.purge(older_than=time() + 1)
+    # Purged ids are no longer deduplicated
+    outbox.publish(event)
+    assert outbox.count_pending() == 1
+
+
+async def test_relay_drains_in_batches_and_marks_sent() -> None:
+    outbox = SqliteOutbox()
+    publisher = RecordingPublisher()
+    outbox.publish_all([OrderPlaced(order_id=index) for index in range(5)])
+    relay = OutboxRelay(outbox, publisher, batch_size=2)
+
+    assert await relay.relay() == 5
+    assert [len(batch) for batch in publisher.batches] == [2, 2, 1]
+    assert outbox.count_pending() == 0
+    assert await relay.relay() == 0
+
+
+async def test_relay_redelivers_after_publish_failure() -> None:
+    outbox = SqliteOutbox()
+    publisher = RecordingPublisher(failures=1)
+    event = OrderPlaced(order_id=1)
+    outbox.publish(event)
+    relay = OutboxRelay(outbox, publisher)
+
+    with pytest.raises(ConnectionError):
+        await relay.relay()
+    assert outbox.count_pending() == 1
+    assert await relay.relay() == 1
+    assert publisher.batches == [[event]]
+
+
+async def test_relay_service_retries_and_flushes_on_stop(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    outbox = SqliteOutbox()
+    publisher = RecordingPublisher(failures=1)
+    outbox.publish(OrderPlaced(order_id=1))
+    relay = OutboxRelay(outbox, publisher, interval=0.01)
+    relay.set_stop_event(locks.Event())
+    await relay.start_async()
+    while outbox.count_pending() > 0:
+        await asyncio.sleep(0.01)
+    outbox.publish(OrderPlaced(order_id=2))
+    await relay.stop_async()
+
+    assert "[OutboxRelay] relay failed" in caplog.text
+    assert outbox.count_pending() == 0
+    assert len(publisher.batches) == 2
+
+
+def test_relay_rejects_invalid_settings() -> None:
+    with pytest.raises(ValueError):
+        OutboxRelay(SqliteOutbox(), RecordingPublisher(), batch_size=0)
+    with pytest.raises(ValueError):
+        OutboxRelay(SqliteOutbox(), RecordingPublisher(), interval=0)
+
+
+def test_relay_as_pod_in_application_context() -> None:
+    publisher = RecordingPublisher()
+    outbox = SqliteOutbox()
+
+    @Pod()
+    def get_relay() -> OutboxRelay:
+        return OutboxRelay(outbox, publisher, interval=0.01)
+
+    context = ApplicationContext()
+    context.add(get_relay)
+    context.start()
+    try:
+        outbox.publish(OrderPlaced(order_id=1))
+        waited: float = 0
+        while not publisher.batches and waited < 3:
+            sleep(0.01)
+            waited += 0.01
+        assert len(publisher.batches) == 1
+    finally:
+        context.stop()
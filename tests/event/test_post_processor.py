@@ -0,0 +1,77 @@
+from typing import Sequence
+
+from spakky.application.application_context import ApplicationContext
+from spakky.domain.models.event import AbstractDomainEvent
+from spakky.domain.ports.event.event_publisher import (
+    IAsyncEventPublisher,
+    IEventPublisher,
+)
+from spakky.domain.ports.persistency.transaction import (
+    AbstractAsyncTransaction,
+    AbstractTransaction,
+)
+from spakky.pod.annotations.pod import Pod
+
+
+@Pod()
+class Publisher(IEventPublisher):
+    def publish(self, event: AbstractDomainEvent) -> None: ...
+
+
+@Pod()
+class AsyncPublisher(IAsyncEventPublisher):
+    async def publish(self, event: AbstractDomainEvent) -> None: ...
+
+    async def publish_all(self, events: Sequence[AbstractDomainEvent]) -> None: ...
+
+
+@Pod()
+class Transaction(AbstractTransaction):
+    def __init__(self) -> None:
+        super().__init__()
+
+    def initialize(self) -> None: ...
+
+    def dispose(self) -> None: ...
+
+    def commit(self) -> None: ...
+
+    def rollback(self) -> None: ...
+
+
+@Pod()
+class AsyncTransaction(AbstractAsyncTransaction):
+    def __init__(self) -> None:
+        super().__init__()
+
+    async def initialize(self) -> None: ...
+
+    async def dispose(self) -> None: ...
+
+    async def commit(self) -> None: ...
+
+    async def rollback(self) -> None: ...
+
+
+def test_transactions_publish_through_container_publishers() -> None:
+    context = ApplicationContext()
+    for pod in (Publisher, AsyncPublisher, Transaction, AsyncTransaction):
+        context.add(pod)
+    context.start()
+    try:
+        assert context.get(Transaction).event_publisher is context.get(Publisher)
+        assert context.get(AsyncTransaction).event_publisher is context.get(
+            AsyncPublisher
+        )
+    finally:
+        context.stop()
+
+
+def test_transactions_without_container_publishers_stay_unpublished() -> None:
+    context = ApplicationContext()
+    context.add(Transaction)
+    context.start()
+    try:
+        assert context.get(Transaction).event_publisher is None
+    finally:
+        context.stop()
@@ -0,0 +1,42 @@
+from abc import abstractmethod
+from typing import Annotated, Protocol, TypeVar
+
+from spakky.pod.annotations.pod import Pod
+from spakky.pod.annotations.qualifier import Qualifier
+
+T_co = TypeVar("T_co", covariant=True)
+
+
+class IProvider(Protocol[T_co]):
+    @abstractmethod
+    def provide(self) -> T_co: ...
+
+
+def is_engine(pod: Pod) -> bool:
+    return pod.name == "engine"
+
+
+@Pod()
+class Engine: ...
+
+
+@Pod()
+class Car(IProvider[Engine]):
+    engine: Engine
+    name: str
+
+    def __init__(
+        self,
+        engine: Annotated[Engine, Qualifier(is_engine)],
+        name: str = "car",
+    ) -> None:
+        self.engine = engine
+        self.name = name
+
+    def provide(self) -> Engine:
+        return self.engine
+
+
+@Pod()
+def get_wheel_count() -> int:
+    return 4
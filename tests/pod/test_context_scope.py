@@ -0,0 +1,144 @@
+from types import TracebackType
+
+import pytest
+
+from spakky.application.application_context import ApplicationContext
+from spakky.pod.annotations.pod import Pod
+from spakky.pod.context_scope import ContextScopeAlreadyEnteredError
+
+
+class Connection:
+    closed: list[str]
+
+    def __init__(self) -> None:
+        self.closed = []
+
+    def close(self, name: str) -> None:
+        self.closed.append(name)
+
+
+def test_context_scope_closes_pods_on_exit() -> None:
+    connection = Connection()
+
+    @Pod(scope=Pod.Scope.CONTEXT)
+    class Session:
+        def close(self) -> None:
+            connection.close("session")
+
+    @Pod(scope=Pod.Scope.CONTEXT)
+    class UnitOfWork:
+        def __init__(self, session: Session) -> None:
+            self.session = session
+
+        def close(self) -> None:
+            connection.close("unit_of_work")
+
+    context = ApplicationContext()
+    context.add(Session)
+    context.add(UnitOfWork)
+    context.start()
+
+    with context.scope() as scope:
+        unit_of_work = context.get(UnitOfWork)
+        assert context.get(UnitOfWork) is unit_of_work
+        assert context.get_context_id() == scope.id
+        assert connection.closed == []
+
+    assert connection.closed == ["unit_of_work", "session"]
+    assert context.get(UnitOfWork) is not unit_of_work
+    assert context.get_context_id() != scope.id
+
+    with pytest.raises(RuntimeError):
+        with context.scope():
+            context.get(UnitOfWork)
+            raise RuntimeError
+    assert connection.closed[-2:] == ["unit_of_work", "session"]
+    context.stop()
+
+
+def test_context_scope_leaves_context_managers_to_the_application() -> None:
+    connection = Connection()
+
+    @Pod(scope=Pod.Scope.CONTEXT)
+    class Transaction:
+        def __enter__(self) -> "Transaction":
+            connection.close("enter")
+            return self
+
+        def __exit__(
+            self,
+            __exc_type: type[BaseException] | None,
+            __exc_value: BaseException | None,
+            __traceback: TracebackType | None,
+        ) -> bool | None:
+            connection.close("exit")
+            return None
+
+    context = ApplicationContext()
+    context.add(Transaction)
+    context.start()
+
+    with context.scope():
+        with context.get(Transaction):
+            pass
+    assert connection.closed == ["enter", "exit"]
+    context.stop()
+
+
+async def test_context_scope_closes_async_pods_on_exit() -> None:
+    connection = Connection()
+
+    @Pod(scope=Pod.Scope.CONTEXT)
+    class AsyncSession:
+        async def close_async(self) -> None:
+            connection.close("async_session")
+
+    @Pod(scope=Pod.Scope.CONTEXT)
+    class AsyncClient:
+        async def close(self) -> None:
+            connection.close("async_client")
+
+    context = ApplicationContext()
+    context.add(AsyncSession)
+    context.add(AsyncClient)
+    context.start()
+
+    async with context.scope():
+        outer = context.get(AsyncSession)
+        async with context.scope():
+            inner = context.get(AsyncSession)
+            assert inner is not outer
+            context.get(AsyncClient)
+        assert connection.closed == ["async_client", "async_session"]
+        assert context.get(AsyncSession) is outer
+
+    assert connection.closed == ["async_client", "async_session", "async_session"]
+
+    # Asynchronous closes cannot be awaited by a synchronous scope
+    with context.scope():
+        context.get(AsyncSession)
+        context.get(AsyncClient)
+    assert len(connection.closed) == 3
+    context.stop()
+
+
+def test_context_scope_raises_disposal_error() -> None:
+    @Pod(scope=Pod.Scope.CONTEXT)
+    class Broken:
+        def close(self) -> None:
+            raise ValueError
+
+    context = ApplicationContext()
+    context.add(Broken)
+    context.start()
+
+    with pytest.raises(ValueError):
+        with context.scope():
+            context.get(Broken)
+
+    scope = context.scope()
+    with scope:
+        with pytest.raises(ContextScopeAlreadyEnteredError):
+            with scope:
+                pass
+    context.stop()
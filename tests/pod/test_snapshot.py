@@ -0,0 +1,229 @@
+import importlib
+import sys
+from pathlib import Path
+from typing import Any, NoReturn
+
+import pytest
+
+from spakky.aop.aspect import Aspect
+from spakky.application.application import SpakkyApplication
+from spakky.application.application_context import ApplicationContext
+from spakky.pod.annotations.pod import Pod, get_fingerprint
+from spakky.pod.snapshot import IncompatiblePodSnapshotError, PodSnapshot
+from tests.application import apps
+from tests.application.apps.domain.port.usecase.signup import ISignupUseCase
+from tests.pod.apps import frozen
+
+FROZEN_MODULE = "tests.pod.apps.frozen"
+
+
+def test_snapshot_capture_and_round_trip(tmp_path: Path) -> None:
+    context = ApplicationContext()
+    context.add(frozen.Engine)
+    context.add(frozen.Car)
+    context.add(frozen.get_wheel_count)
+    context.start()
+
+    snapshot: PodSnapshot = context.create_snapshot()
+    assert set(snapshot.records) == {
+        f"{FROZEN_MODULE}:Engine",
+        f"{FROZEN_MODULE}:Car",
+        f"{FROZEN_MODULE}:get_wheel_count",
+    }
+    context.stop()
+
+    path = tmp_path / "pods.snapshot.json"
+    snapshot.save(path)
+    assert PodSnapshot.load(path) == snapshot
+
+
+def test_snapshot_skips_pods_without_import_path() -> None:
+    @Pod()
+    class Local: ...
+
+    snapshot = PodSnapshot.capture([Pod.get(Local), Pod.get(frozen.Engine)])
+    assert set(snapshot.records) == {f"{FROZEN_MODULE}:Engine"}
+
+
+def test_snapshot_restores_pods_without_introspection(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    snapshot = PodSnapshot.capture(
+        [
+            Pod.get(frozen.Engine),
+            Pod.get(frozen.Car),
+            Pod.get(frozen.get_wheel_count),
+        ]
+    )
+
+    def introspect(*args: Any, **kwargs: Any) -> NoReturn:
+        raise AssertionError("Pod must not be introspected")
+
+    context = ApplicationContext(snapshot=snapshot)
+    try:
+        monkeypatch.setattr(Pod, "_Pod__get_dependencies", introspect)
+        monkeypatch.delitem(sys.modules, FROZEN_MODULE)
+        reloaded = importlib.import_module(FROZEN_MODULE)
+    finally:
+        snapshot.deactivate()
+    monkeypatch.undo()
+
+    car: Pod = Pod.get(reloaded.Car)
+    assert reloaded.Car is not frozen.Car
+    assert car.type_ is reloaded.Car
+    assert car.dependencies["engine"].type_ is reloaded.Engine
+    assert car.dependencies["engine"].qualifiers[0].selector is reloaded.is_engine
+    assert car.dependencies["name"].has_default is True
+    assert car.is_family_with(reloaded.IProvider[reloaded.Engine])
+    assert Pod.get(reloaded.get_wheel_count).type_ is int
+
+    context.add(reloaded.Engine)
+    context.add(reloaded.Car)
+    context.add(reloaded.get_wheel_count)
+    context.start()
+    assert isinstance(context.get(reloaded.Car).engine, reloaded.Engine)
+    assert context.get(int) == 4
+    context.stop()
+
+
+def test_snapshot_introspects_pods_changed_since_capture(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    snapshot = PodSnapshot.capture([Pod.get(frozen.Engine), Pod.get(frozen.Car)])
+    assert snapshot.records[f"{FROZEN_MODULE}:Car"].fingerprint == get_fingerprint(
+        frozen.Car
+    )
+    assert get_fingerprint(frozen.Car) != get_fingerprint(frozen.Engine)
+    # Simulates a snapshot taken before Car's constructor was edited
+    snapshot.records[f"{FROZEN_MODULE}:Car"].fingerprint = "stale"
+    introspected: list[object] = []
+    get_dependencies = Pod._Pod__get_dependencies  # type: ignore
+
+    def introspect(self: Pod, obj: Any) -> Any:
+        introspected.append(obj)
+        return get_dependencies(self, obj)
+
+    snapshot.activate()
+    try:
+        monkeypatch.setattr(Pod, "_Pod__get_dependencies", introspect)
+        monkeypatch.delitem(sys.modules, FROZEN_MODULE)
+        reloaded = importlib.import_module(FROZEN_MODULE)
+    finally:
+        snapshot.deactivate()
+    monkeypatch.undo()
+
+    names: list[str] = [getattr(obj, "__name__", "") for obj in introspected]
+    assert "Car" in names and "Engine" not in names
+    assert Pod.get(reloaded.Car).dependencies["engine"].type_ is reloaded.Engine
+
+
+def test_snapshot_is_deactivated_when_context_stops(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    snapshot = PodSnapshot.capture([Pod.get(frozen.Engine)])
+    other = PodSnapshot()
+    context = ApplicationContext(snapshot=snapshot)
+    context.start()
+    context.stop()
+
+    introspected: list[object] = []
+
+    def introspect(self: Pod, obj: Any) -> dict[str, Any]:
+        introspected.append(obj)
+        return {}
+
+    monkeypatch.setattr(Pod, "_Pod__get_dependencies", introspect)
+    Pod()(type("Engine", (), {"__module__": FROZEN_MODULE}))
+    assert len(introspected) == 1
+
+    # Stopping a context leaves records activated by another snapshot alone
+    other.activate()
+    snapshot.deactivate()
+    try:
+        assert Pod._Pod__records is other.records  # type: ignore
+    finally:
+        other.deactivate()
+
+
+def test_snapshot_reuses_aspect_matches(monkeypatch: pytest.MonkeyPatch) -> None:
+    application = (
+        SpakkyApplication(ApplicationContext())
+        .enable_logging()
+        .enable_transactional()
+        .scan(apps)
+        .start()
+    )
+    snapshot = application.container.create_snapshot()
+    application.stop()
+    assert set(
+        snapshot.aspect_matches[
+            "tests.application.apps.domain.usecase.signup:SignupUseCase"
+        ]
+    ) == {"logging_aspect", "transactional_aspect"}
+
+    def matches(self: Aspect, pod: object) -> NoReturn:
+        raise AssertionError("Aspect must not be matched again")
+
+    monkeypatch.setattr(Aspect, "matches", matches)
+    try:
+        application = (
+            SpakkyApplication(ApplicationContext(snapshot=snapshot))
+            .enable_logging()
+            .enable_transactional()
+            .scan(apps)
+            .start()
+        )
+    finally:
+        snapshot.deactivate()
+
+    usecase = application.container.get(ISignupUseCase)
+    assert type(usecase).__name__.endswith("@DynamicProxy")
+    application.stop()
+
+
+@pytest.mark.parametrize("stale", ["aspect", "pod"])
+def test_snapshot_matches_aspects_again_when_fingerprints_differ(stale: str) -> None:
+    def start(snapshot: PodSnapshot | None = None) -> SpakkyApplication:
+        return (
+            SpakkyApplication(ApplicationContext(snapshot=snapshot))
+            .enable_logging()
+            .enable_transactional()
+            .scan(apps)
+            .start()
+        )
+
+    application = start()
+    snapshot = application.container.create_snapshot()
+    application.stop()
+    key = "tests.application.apps.domain.usecase.signup:SignupUseCase"
+    assert snapshot.match_fingerprints[key]
+    assert set(snapshot.aspect_fingerprints) >= {
+        "logging_aspect",
+        "transactional_aspect",
+    }
+
+    # A stale entry would otherwise leave the use case without its aspects
+    snapshot.aspect_matches[key] = []
+    if stale == "aspect":
+        snapshot.aspect_fingerprints["logging_aspect"] = "stale"
+    else:
+        snapshot.match_fingerprints[key] = "stale"
+    try:
+        application = start(snapshot)
+    finally:
+        snapshot.deactivate()
+
+    usecase = application.container.get(ISignupUseCase)
+    assert type(usecase).__name__.endswith("@DynamicProxy")
+    assert set(application.container.create_snapshot().aspect_matches[key]) == {
+        "logging_aspect",
+        "transactional_aspect",
+    }
+    application.stop()
+
+
+def test_snapshot_rejects_incompatible_format() -> None:
+    data = PodSnapshot().to_dict()
+    data["format"] = 0
+    with pytest.raises(IncompatiblePodSnapshotError):
+        PodSnapshot.from_dict(data)
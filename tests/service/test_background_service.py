@@ -1,3 +1,4 @@
+import asyncio
 from asyncio.tasks import sleep as sleep_async
 from time import sleep
 
@@ -126,3 +127,74 @@ async def test_multiple_async_background_services_graceful_shutdown() -> None:
 
     assert 1 in ids
     assert 2 in ids
+
+
+def test_background_service_restarts_individually() -> None:
+    class Worker(AbstractBackgroundService):
+        runs: int = 0
+
+        def initialize(self) -> None:
+            return
+
+        def dispose(self) -> None:
+            return
+
+        def run(self) -> None:
+            type(self).runs += 1
+            self._stop_event.wait()
+
+    @Pod()
+    class Healthy(Worker): ...
+
+    @Pod()
+    class Failing(Worker): ...
+
+    context = ApplicationContext()
+    context.add(Healthy)
+    context.add(Failing)
+    context.start()
+
+    healthy = context.get(Healthy)
+    failing = context.get(Failing)
+    failing.restart()
+    sleep(0.05)
+
+    # Restarting one worker neither stops nor restarts the other
+    assert Failing.runs == 2
+    assert Healthy.runs == 1
+    assert healthy._thread is not None and healthy._thread.is_alive()  # pyright: ignore[reportPrivateUsage]
+    context.stop()
+    assert not healthy._thread.is_alive()  # pyright: ignore[reportPrivateUsage]
+
+
+@pytest.mark.asyncio
+async def test_async_background_service_cancels_child_tasks() -> None:
+    cancelled: list[str] = []
+
+    @Pod()
+    class Consumer(AbstractAsyncBackgroundService):
+        async def initialize_async(self) -> None:
+            return
+
+        async def dispose_async(self) -> None:
+            return
+
+        async def consume(self, name: str) -> None:
+            try:
+                await sleep_async(10)
+            except asyncio.CancelledError:
+                cancelled.append(name)
+                raise
+
+        async def run_async(self) -> None:
+            self.create_task(self.consume("first"))
+            self.create_task(self.consume("second"))
+            await self._stop_event.wait()
+
+    context = ApplicationContext()
+    context.add(Consumer)
+    context.start()
+    await sleep_async(0.05)
+    context.stop()
+
+    assert sorted(cancelled) == ["first", "second"]
@@ -0,0 +1,59 @@
+from datetime import datetime
+
+import pytest
+
+from spakky.service.cron import CronExpression, InvalidCronExpressionError
+
+
+def test_cron_every_minute() -> None:
+    expression = CronExpression("* * * * *")
+    assert expression.next_after(datetime(2024, 1, 1, 10, 30, 15)) == datetime(
+        2024, 1, 1, 10, 31
+    )
+
+
+def test_cron_steps_ranges_and_lists() -> None:
+    expression = CronExpression("*/15 9-17 * * 1-5")
+    # Saturday rolls over to Monday morning
+    assert expression.next_after(datetime(2024, 1, 6, 12, 0)) == datetime(
+        2024, 1, 8, 9, 0
+    )
+    assert expression.next_after(datetime(2024, 1, 8, 9, 0)) == datetime(
+        2024, 1, 8, 9, 15
+    )
+    assert expression.next_after(datetime(2024, 1, 8, 17, 45)) == datetime(
+        2024, 1, 9, 9, 0
+    )
+    assert CronExpression("0 0 1,15 * *").next_after(datetime(2024, 1, 2)) == datetime(
+        2024, 1, 15
+    )
+
+
+def test_cron_month_and_sunday_alias() -> None:
+    assert CronExpression("30 4 * 2 *").next_after(datetime(2024, 3, 1)) == datetime(
+        2025, 2, 1, 4, 30
+    )
+    assert CronExpression("0 0 * * 7").next_after(datetime(2024, 1, 1)) == datetime(
+        2024, 1, 7
+    )
+
+
+def test_cron_day_of_month_or_day_of_week() -> None:
+    # Either the 13th or any Friday, as in standard cron
+    expression = CronExpression("0 0 13 * 5")
+    assert expression.next_after(datetime(2024, 1, 1)) == datetime(2024, 1, 5)
+    assert expression.next_after(datetime(2024, 1, 12, 1)) == datetime(2024, 1, 13)
+
+
+@pytest.mark.parametrize(
+    "expression",
+    ["* * * *", "60 * * * *", "* 24 * * *", "*/0 * * * *", "5-1 * * * *", "a * * * *"],
+)
+def test_cron_expect_invalid_cron_expression_error(expression: str) -> None:
+    with pytest.raises(InvalidCronExpressionError):
+        CronExpression(expression)
+
+
+def test_cron_impossible_schedule_expect_invalid_cron_expression_error() -> None:
+    with pytest.raises(InvalidCronExpressionError):
+        CronExpression("0 0 31 2 *").next_after(datetime(2024, 1, 1))
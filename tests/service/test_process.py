@@ -0,0 +1,87 @@
+import os
+from pathlib import Path
+from time import sleep
+
+import pytest
+
+from spakky.application.application import SpakkyApplication
+from spakky.application.application_context import ApplicationContext
+from spakky.pod.annotations.pod import Pod
+from spakky.service.process import AbstractProcessBackgroundService, get_worker_index
+
+OUTPUT_PATH = "SPAKKY_TEST_PROCESS_OUTPUT"
+
+
+@Pod()
+def get_output_path() -> Path:
+    # Read from the environment, which spawned workers inherit
+    return Path(os.environ[OUTPUT_PATH])
+
+
+class AbstractCpuBoundService(AbstractProcessBackgroundService):
+    worker_count = 2
+    stop_timeout = 5.0
+
+    __output: Path
+
+    def __init__(self, output: Path) -> None:
+        self.__output = output
+
+    @classmethod
+    def create_application(cls) -> SpakkyApplication:
+        return SpakkyApplication(ApplicationContext()).add(get_output_path).add(cls)
+
+    def initialize(self) -> None:
+        (self.__output / f"{self.worker_index}.started").write_text(str(os.getpid()))
+
+    def dispose(self) -> None:
+        (self.__output / f"{self.worker_index}.done").write_text(str(os.getpid()))
+
+    def run(self) -> None:
+        assert get_worker_index() == self.worker_index
+        while not self._stop_event.is_set():
+            self.heartbeat()
+            sleep(0.01)
+
+
+@Pod()
+class CpuBoundService(AbstractCpuBoundService): ...
+
+
+@Pod()
+class ForkedCpuBoundService(AbstractCpuBoundService):
+    start_method = "fork"
+
+
+@pytest.mark.parametrize("service_type", [CpuBoundService, ForkedCpuBoundService])
+def test_process_background_service_runs_workers(
+    service_type: type[AbstractCpuBoundService],
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setenv(OUTPUT_PATH, str(tmp_path))
+    context = ApplicationContext()
+    context.add(get_output_path)
+    context.add(service_type)
+    context.start()
+
+    service = context.get(service_type)
+    for _ in range(1000):
+        if all(x.last_heartbeat is not None for x in service.health()):
+            break
+        sleep(0.01)
+
+    health = service.health()
+    assert [x.index for x in health] == [0, 1]
+    assert all(x.pid is not None and x.pid != os.getpid() for x in health)
+    assert service.is_healthy(max_heartbeat_age=5.0)
+    assert {x.name for x in tmp_path.iterdir()} == {"0.started", "1.started"}
+
+    context.stop()
+
+    assert {x.name for x in tmp_path.iterdir() if x.suffix == ".done"} == {
+        "0.done",
+        "1.done",
+    }
+    assert [x.exitcode for x in service.health()] == [0, 0]
+    assert service.is_healthy() is False
@@ -0,0 +1,40 @@
+from datetime import timedelta
+
+import pytest
+
+from spakky.service.scheduled import CronTrigger, IntervalTrigger, Scheduled
+
+
+def test_scheduled_expect_value_error() -> None:
+    with pytest.raises(ValueError):
+        Scheduled()
+    with pytest.raises(ValueError):
+        Scheduled(interval=1, cron="* * * * *")
+    with pytest.raises(ValueError):
+        Scheduled(interval=0)
+    with pytest.raises(ValueError):
+        Scheduled(interval=1, jitter=-1)
+
+
+def test_scheduled_create_trigger() -> None:
+    assert Scheduled(interval=timedelta(minutes=1)).seconds == 60
+    assert isinstance(Scheduled(interval=1).create_trigger(), IntervalTrigger)
+    assert isinstance(Scheduled(cron="* * * * *").create_trigger(), CronTrigger)
+
+
+def test_interval_trigger_is_drift_free() -> None:
+    trigger = IntervalTrigger(10)
+    assert trigger.next(None, 100) == 110
+    # Execution time does not shift the schedule
+    assert trigger.next(110, 113) == 120
+    # Runs missed by a long execution are skipped
+    assert trigger.next(120, 155) == 160
+    assert trigger.next(160, 170) == 180
+
+
+def test_cron_trigger_never_repeats_a_minute() -> None:
+    trigger = Scheduled(cron="* * * * *").create_trigger()
+    first = trigger.next(None, 0)
+    second = trigger.next(first, 0)
+    assert 0 < first <= 60
+    assert second - first == pytest.approx(60, abs=1)
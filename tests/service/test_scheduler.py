@@ -0,0 +1,138 @@
+import asyncio
+import threading
+from logging import Logger
+from time import sleep
+
+import pytest
+
+from spakky.application.application_context import ApplicationContext
+from spakky.pod.annotations.lazy import Lazy
+from spakky.pod.annotations.pod import Pod
+from spakky.service.scheduled import Scheduled, ScheduledPodNotSingletonError
+from spakky.service.scheduler import ScheduledJob, Scheduler
+
+
+def test_scheduled_methods_run_periodically() -> None:
+    async_runs: list[float] = []
+    sync_threads: list[str] = []
+    failures: list[int] = []
+
+    @Pod()
+    class Jobs:
+        @Scheduled(interval=0.02)
+        async def collect(self) -> None:
+            async_runs.append(asyncio.get_running_loop().time())
+
+        @Scheduled(interval=0.02, jitter=0.01)
+        def cleanup(self) -> None:
+            sync_threads.append(threading.current_thread().name)
+
+        @Scheduled(interval=0.02)
+        def broken(self) -> None:
+            failures.append(1)
+            raise RuntimeError
+
+        def not_scheduled(self) -> None:
+            raise AssertionError
+
+    context = ApplicationContext()
+    context.add(Jobs)
+    context.start()
+    sleep(0.3)
+    context.stop()
+
+    assert len(async_runs) >= 3
+    assert len(sync_threads) >= 3
+    assert all(name.startswith("Scheduler") for name in sync_threads)
+    # Failing job keeps being scheduled
+    assert len(failures) >= 3
+
+
+def test_scheduled_methods_of_lazy_pods_run_after_start() -> None:
+    runs: list[int] = []
+
+    @Lazy()
+    @Pod()
+    class LazyJobs:
+        @Scheduled(interval=0.01)
+        def collect(self) -> None:
+            runs.append(1)
+
+    context = ApplicationContext()
+    context.add(LazyJobs)
+    context.start()
+    assert "Scheduler" in context.service_statuses
+    context.get(LazyJobs)
+    sleep(0.2)
+    context.stop()
+
+    assert len(runs) >= 3
+
+
+def test_scheduled_methods_reject_non_singleton_pods() -> None:
+    @Pod(scope=Pod.Scope.PROTOTYPE)
+    class PrototypeJob:
+        @Scheduled(interval=0.01)
+        def run(self) -> None: ...
+
+    @Pod(scope=Pod.Scope.CONTEXT)
+    class ContextJob:
+        @Scheduled(interval=0.01)
+        def run(self) -> None: ...
+
+    @Pod(scope=Pod.Scope.PROTOTYPE)
+    class PrototypeHelper:
+        def run(self) -> None: ...
+
+    context = ApplicationContext()
+    with pytest.raises(ScheduledPodNotSingletonError):
+        context.add(PrototypeJob)
+    with pytest.raises(ScheduledPodNotSingletonError):
+        context.add(ContextJob)
+    context.add(PrototypeHelper)
+
+
+def test_scheduled_job_never_overlaps() -> None:
+    running: list[int] = []
+    overlaps: list[int] = []
+
+    @Pod()
+    class SlowJob:
+        @Scheduled(interval=0.01)
+        async def slow(self) -> None:
+            if running:
+                overlaps.append(1)
+            running.append(1)
+            await asyncio.sleep(0.05)
+            running.pop()
+
+    context = ApplicationContext()
+    context.add(SlowJob)
+    context.start()
+    sleep(0.2)
+    context.stop()
+
+    assert overlaps == []
+
+
+def test_scheduler_add_job_while_running() -> None:
+    runs: list[int] = []
+
+    async def job() -> None:
+        runs.append(1)
+
+    @Pod()
+    def get_scheduler(logger: Logger) -> Scheduler:
+        return Scheduler(logger)
+
+    context = ApplicationContext()
+    context.add(get_scheduler)
+    context.start()
+
+    scheduler = context.get(Scheduler)
+    scheduler.add_job(ScheduledJob("job", job, Scheduled(interval=0.01)))
+    sleep(0.1)
+    context.stop()
+
+    assert len(scheduler.jobs) == 1
+    assert len(runs) >= 2
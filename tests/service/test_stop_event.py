@@ -0,0 +1,41 @@
+import asyncio
+
+from spakky.service.stop_event import TaskStopEvent, ThreadStopEvent
+
+
+def test_thread_stop_event_propagates_to_children_only() -> None:
+    parent = ThreadStopEvent()
+    first = parent.spawn()
+    second = parent.spawn()
+    grandchild = first.spawn()
+
+    assert first.parent is parent
+    first.set()
+    assert grandchild.is_set()
+    assert not second.is_set()
+    assert not parent.is_set()
+
+    first.clear()
+    parent.set()
+    assert first.is_set() and second.is_set()
+
+    # Clearing a child never un-stops its parent
+    second.clear()
+    assert parent.is_set()
+    assert parent.spawn().is_set()
+
+
+async def test_task_stop_event_propagates_to_children_only() -> None:
+    parent = TaskStopEvent()
+    first = parent.spawn()
+    second = parent.spawn()
+
+    assert first.parent is parent
+    waiter = asyncio.create_task(second.wait())
+    first.set()
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    parent.set()
+    await asyncio.wait_for(waiter, 1)
+    assert parent.spawn().is_set()
@@ -0,0 +1,283 @@
+from asyncio import locks
+from asyncio.tasks import sleep as sleep_async
+from threading import Event
+from time import sleep
+
+import pytest
+
+from spakky.application.application_context import ApplicationContext
+from spakky.pod.annotations.pod import Pod
+from spakky.service.background import (
+    AbstractAsyncBackgroundService,
+    AbstractBackgroundService,
+)
+from spakky.service.supervision import (
+    UNSUPERVISED,
+    ServiceState,
+    ServiceStatus,
+    Supervised,
+)
+
+
+def wait_until(predicate, timeout: float = 3.0) -> bool:  # type: ignore
+    waited: float = 0
+    while not predicate():
+        if waited >= timeout:
+            return False
+        sleep(0.01)
+        waited += 0.01
+    return True
+
+
+def test_supervised_delay_grows_exponentially_up_to_limit() -> None:
+    policy = Supervised(backoff=0.5, multiplier=2, max_backoff=3)
+    assert [policy.delay(attempt) for attempt in range(5)] == [0.5, 1, 2, 3, 3]
+    assert UNSUPERVISED.max_restarts == 0
+
+
+def test_supervised_rejects_invalid_policy() -> None:
+    with pytest.raises(ValueError):
+        Supervised(max_restarts=-1)
+    with pytest.raises(ValueError):
+        Supervised(backoff=-1)
+    with pytest.raises(ValueError):
+        Supervised(multiplier=0.5)
+
+
+def test_status_before_start_is_stopped() -> None:
+    class IdleService(AbstractBackgroundService):
+        def initialize(self) -> None:
+            return
+
+        def dispose(self) -> None:
+            return
+
+        def run(self) -> None:
+            return
+
+    assert IdleService().status == ServiceStatus("IdleService")
+
+
+def test_supervised_service_restarts_and_recovers() -> None:
+    lifecycle: list[str] = []
+
+    @Supervised(max_restarts=3, backoff=0.01)
+    class FlakyService(AbstractBackgroundService):
+        def initialize(self) -> None:
+            lifecycle.append("initialize")
+
+        def dispose(self) -> None:
+            lifecycle.append("dispose")
+
+        def run(self) -> None:
+            if lifecycle.count("initialize") < 3:
+                raise RuntimeError("crash")
+            self._stop_event.wait()
+
+    service = FlakyService()
+    service.set_stop_event(Event())
+    service.start()
+    assert wait_until(lambda: lifecycle.count("initialize") == 3)
+    assert wait_until(lambda: service.status.state == ServiceState.RUNNING)
+    status: ServiceStatus = service.status
+    assert status.restart_count == 2
+    assert isinstance(status.last_error, RuntimeError)
+    service.stop()
+    assert service.status.state == ServiceState.STOPPED
+    assert lifecycle == [
+        "initialize",
+        "dispose",
+        "initialize",
+        "dispose",
+        "initialize",
+        "dispose",
+    ]
+
+
+def test_supervised_service_fails_after_max_restarts() -> None:
+    @Supervised(max_restarts=2, backoff=0.01)
+    class BrokenService(AbstractBackgroundService):
+        def initialize(self) -> None:
+            return
+
+        def dispose(self) -> None:
+            return
+
+        def run(self) -> None:
+            raise RuntimeError("crash")
+
+    service = BrokenService()
+    service.set_stop_event(Event())
+    service.start()
+    assert wait_until(lambda: service.status.state == ServiceState.FAILED)
+    assert service.status.restart_count == 2
+    service.stop()
+    assert service.status.state == ServiceState.FAILED
+
+
+def test_unsupervised_crash_is_logged_and_failed(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    class CrashingService(AbstractBackgroundService):
+        def initialize(self) -> None:
+            return
+
+        def dispose(self) -> None:
+            return
+
+        def run(self) -> None:
+            raise RuntimeError("crash")
+
+    service = CrashingService()
+    service.set_stop_event(Event())
+    service.start()
+    assert wait_until(lambda: service.status.state == ServiceState.FAILED)
+    service.stop()
+    assert service.status.restart_count == 0
+    assert "[CrashingService] crashed" in caplog.text
+
+
+def test_stop_during_backoff_does_not_restart() -> None:
+    initialized: list[int] = []
+
+    @Supervised(max_restarts=3, backoff=10)
+    class SlowRestartService(AbstractBackgroundService):
+        def initialize(self) -> None:
+            initialized.append(1)
+
+        def dispose(self) -> None:
+            return
+
+        def run(self) -> None:
+            raise RuntimeError("crash")
+
+    service = SlowRestartService()
+    service.set_stop_event(Event())
+    service.start()
+    assert wait_until(lambda: service.status.state == ServiceState.RESTARTING)
+    service.stop()
+    assert len(initialized) == 1
+    assert service.status.state == ServiceState.STOPPED
+
+
+async def test_async_supervised_service_restarts_and_recovers() -> None:
+    runs: list[int] = []
+
+    @Supervised(max_restarts=3, backoff=0.01)
+    class FlakyAsyncService(AbstractAsyncBackgroundService):
+        async def initialize_async(self) -> None:
+            return
+
+        async def dispose_async(self) -> None:
+            return
+
+        async def run_async(self) -> None:
+            runs.append(1)
+            if len(runs) < 3:
+                raise RuntimeError("crash")
+            await self._stop_event.wait()
+
+    service = FlakyAsyncService()
+    service.set_stop_event(locks.Event())
+    await service.start_async()
+    while len(runs) < 3:
+        await sleep_async(0.01)
+    assert service.status.state == ServiceState.RUNNING
+    assert service.status.restart_count == 2
+    await service.stop_async()
+    assert service.status.state == ServiceState.STOPPED
+
+
+async def test_async_supervised_service_fails_after_max_restarts() -> None:
+    @Supervised(max_restarts=1, backoff=0.01)
+    class BrokenAsyncService(AbstractAsyncBackgroundService):
+        async def initialize_async(self) -> None:
+            return
+
+        async def dispose_async(self) -> None:
+            return
+
+        async def run_async(self) -> None:
+            raise RuntimeError("crash")
+
+    service = BrokenAsyncService()
+    service.set_stop_event(locks.Event())
+    await service.start_async()
+    while service.status.state != ServiceState.FAILED:
+        await sleep_async(0.01)
+    assert service.status.restart_count == 1
+    await service.stop_async()
+
+
+async def test_async_stop_during_backoff_does_not_restart() -> None:
+    @Supervised(max_restarts=3, backoff=10)
+    class SlowRestartAsyncService(AbstractAsyncBackgroundService):
+        async def initialize_async(self) -> None:
+            return
+
+        async def dispose_async(self) -> None:
+            return
+
+        async def run_async(self) -> None:
+            raise RuntimeError("crash")
+
+    service = SlowRestartAsyncService()
+    service.set_stop_event(locks.Event())
+    await service.start_async()
+    while service.status.state != ServiceState.RESTARTING:
+        await sleep_async(0.01)
+    await service.stop_async()
+    assert service.status.restart_count == 0
+    assert service.status.state == ServiceState.STOPPED
+
+
+def create_healthy_service(name: str) -> type[AbstractBackgroundService]:
+    @Pod(name=name)
+    class HealthyService(AbstractBackgroundService):
+        def initialize(self) -> None:
+            return
+
+        def dispose(self) -> None:
+            return
+
+        def run(self) -> None:
+            self._stop_event.wait()
+
+    return HealthyService
+
+
+def test_application_context_exposes_service_statuses() -> None:
+    HealthyService = create_healthy_service("healthy")
+    OtherHealthyService = create_healthy_service("other_healthy")
+
+    @Pod()
+    class FailingAsyncService(AbstractAsyncBackgroundService):
+        async def initialize_async(self) -> None:
+            return
+
+        async def dispose_async(self) -> None:
+            return
+
+        async def run_async(self) -> None:
+            raise RuntimeError("crash")
+
+    context = ApplicationContext()
+    context.add(HealthyService)
+    context.add(OtherHealthyService)
+    context.add(FailingAsyncService)
+    context.start()
+    try:
+        assert wait_until(
+            lambda: context.service_statuses["failing_async_service"].state
+            == ServiceState.FAILED
+        )
+        statuses: dict[str, ServiceStatus] = context.service_statuses
+        # Pods sharing a class name are still told apart by their pod names
+        assert set(statuses) == {"healthy", "other_healthy", "failing_async_service"}
+        assert statuses["healthy"].state == ServiceState.RUNNING
+        assert statuses["other_healthy"].state == ServiceState.RUNNING
+        assert isinstance(statuses["failing_async_service"].last_error, RuntimeError)
+        healthy = context.get(HealthyService)
+    finally:
+        context.stop()
+    assert healthy.status.state == ServiceState.STOPPED